@@ -14,6 +14,8 @@ Components
 - ``tile_cache`` — LOD tile pyramid with async loading and LRU eviction
 - ``tiled_canvas`` — Tiled rendering extension of ImageCanvas
 - ``coordinate_bar`` — Pixel + lat/lon status bar
+- ``geolocation_lock`` — Per-model locks serializing geolocation calls
+  across threads
 - ``vector_overlay`` — GeoJSON vector rendering over images
 - ``geo_viewer`` — Single-pane geospatial viewer (composite widget)
 - ``dual_viewer`` — Dual-pane viewer with sync controller and sync bar
@@ -46,7 +48,7 @@ Created
 
 Modified
 --------
-2026-02-18
+2026-10-16
 """
 
 from grdk.viewers.band_info import BandInfo, get_band_info
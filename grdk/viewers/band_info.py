@@ -26,9 +26,10 @@ Created
 
 Modified
 --------
-2026-02-18
+2026-10-16
 """
 
+import weakref
 from dataclasses import dataclass
 from typing import Any, List
 
@@ -52,12 +53,20 @@ class BandInfo:
     description: str = ""
 
 
+# Band lists keyed weakly by reader so repeated UI queries are O(1) and
+# entries vanish with the reader.
+_BAND_INFO_CACHE: "weakref.WeakKeyDictionary[Any, List[BandInfo]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 def get_band_info(reader: Any) -> List[BandInfo]:
     """Extract named band information from any grdl reader.
 
     Dispatches by reader class to extract sensor-specific band names.
     Falls back to generic ``Band 0``, ``Band 1``, etc. for unknown
-    reader types.
+    reader types.  Results are cached per reader instance (held weakly),
+    so repeated calls for the same reader skip the dispatch.
 
     Parameters
     ----------
@@ -69,6 +78,19 @@ def get_band_info(reader: Any) -> List[BandInfo]:
     List[BandInfo]
         One entry per band, ordered by band index.
     """
+    try:
+        cached = _BAND_INFO_CACHE.get(reader)
+    except TypeError:
+        # Unhashable or non-weakrefable reader — compute uncached
+        return _compute_band_info(reader)
+    if cached is None:
+        cached = _compute_band_info(reader)
+        _BAND_INFO_CACHE[reader] = cached
+    return list(cached)
+
+
+def _compute_band_info(reader: Any) -> List[BandInfo]:
+    """Dispatch on reader type to build the band list (uncached)."""
     # --- BIOMASS L1: polarization channels (HH, HV, VH, VV) ---
     try:
         from grdl.IO.sar.biomass import BIOMASSL1Reader
@@ -87,11 +109,7 @@ def get_band_info(reader: Any) -> List[BandInfo]:
         from grdl.IO.sar.sentinel1_slc import Sentinel1SLCReader
         if isinstance(reader, Sentinel1SLCReader):
             # List all available polarizations so the combo shows them all
-            all_pols = []
-            try:
-                all_pols = reader.get_available_polarizations()
-            except Exception:
-                pass
+            all_pols = _available_polarizations(reader)
             swath_info = reader.metadata.get('swath_info')
             swath = getattr(swath_info, 'swath', None) if swath_info else None
 
@@ -142,11 +160,7 @@ def get_band_info(reader: Any) -> List[BandInfo]:
         from grdl.IO.sar.terrasar import TerraSARReader
         if isinstance(reader, TerraSARReader):
             # List all available polarizations so the combo shows them all
-            all_pols = []
-            try:
-                all_pols = reader.get_available_polarizations()
-            except Exception:
-                pass
+            all_pols = _available_polarizations(reader)
             if len(all_pols) > 1:
                 return [
                     BandInfo(i, pol, f"Polarization {pol}")
@@ -163,11 +177,7 @@ def get_band_info(reader: Any) -> List[BandInfo]:
     try:
         from grdl.IO.sar.nisar import NISARReader
         if isinstance(reader, NISARReader):
-            all_pols = []
-            try:
-                all_pols = reader.get_available_polarizations()
-            except Exception:
-                pass
+            all_pols = _available_polarizations(reader)
             freq = getattr(reader.metadata, 'frequency', None)
             freq_label = f"Freq{freq}" if freq else ""
             if len(all_pols) > 1:
@@ -196,7 +206,7 @@ def get_band_info(reader: Any) -> List[BandInfo]:
             band_id = reader.metadata.get('band_id')
             wl = reader.metadata.get('wavelength_center')
             if band_id:
-                desc = f"{wl:.0f} nm" if wl else ""
+                desc = f"{float(wl):.0f} nm" if wl else ""
                 return [BandInfo(0, band_id, desc)]
             # TCI or other non-spectral product — check filename
             fname = reader.filepath.stem.upper()
@@ -211,8 +221,28 @@ def get_band_info(reader: Any) -> List[BandInfo]:
     return [BandInfo(i, f"Band {i}", "") for i in range(num_bands)]
 
 
+def _available_polarizations(reader: Any) -> List[str]:
+    """Return the reader's available polarizations, or ``[]`` if unsupported.
+
+    The grdl multi-pol readers answer from already-parsed metadata and do
+    not raise, so no exception guard is needed at the call sites.
+    """
+    fn = getattr(reader, 'get_available_polarizations', None)
+    if fn is None or not callable(fn):
+        return []
+    return list(fn() or [])
+
+
 def _get_num_bands(reader: Any) -> int:
-    """Get band count from a reader using available metadata."""
+    """Get band count from a reader using available metadata.
+
+    Prefers an explicit ``num_bands`` attribute on the reader, then
+    ``metadata.bands``, and only then infers from ``get_shape()``.
+    """
+    n = getattr(reader, 'num_bands', None)
+    if isinstance(n, int) and n > 0:
+        return n
+
     # Try metadata.bands
     meta = getattr(reader, 'metadata', None)
     if meta is not None:
@@ -224,9 +254,8 @@ def _get_num_bands(reader: Any) -> int:
     try:
         shape = reader.get_shape()
         if len(shape) == 3:
-            # Channels-first: (C, H, W) if shape[0] < shape[1] and shape[0] < shape[2]
-            # Channels-last: (H, W, C) otherwise
-            # grdl uses channels-last for get_shape but channels-first for read_chip
+            # grdl get_shape() is (rows, cols, bands); read_chip() is
+            # channels-first, so only this fallback needs the last axis.
             return shape[2]
         return 1
     except Exception:
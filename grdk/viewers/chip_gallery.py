@@ -30,15 +30,13 @@ Created
 
 Modified
 --------
-2026-02-06
+2026-10-16
 """
 
 # Standard library
 from typing import Any, Callable, Dict, List, Optional
 
 # Third-party
-import numpy as np
-
 try:
     from PyQt6.QtWidgets import (
         QFrame,
@@ -69,6 +67,12 @@ _LABEL_COLORS = {
 
 _LABEL_CYCLE = [ChipLabel.UNKNOWN, ChipLabel.POSITIVE, ChipLabel.NEGATIVE]
 
+# Click transition table: label -> (next label, display text, border color)
+_LABEL_NEXT = {
+    current: (nxt, nxt.value.upper(), _LABEL_COLORS[nxt])
+    for current, nxt in zip(_LABEL_CYCLE, _LABEL_CYCLE[1:] + _LABEL_CYCLE[:1])
+}
+
 THUMB_SIZE = 128
 
 
@@ -127,17 +131,19 @@ class ChipThumbnail(QFrame):
 
     def mousePressEvent(self, event: Any) -> None:
         """Cycle through labels on click."""
-        current_idx = _LABEL_CYCLE.index(self._chip.label)
-        next_idx = (current_idx + 1) % len(_LABEL_CYCLE)
-        self._chip.label = _LABEL_CYCLE[next_idx]
-        self._update_border()
-        self._label_text.setText(self._chip.label.value.upper())
+        nxt, text, color = _LABEL_NEXT[self._chip.label]
+        self._chip.label = nxt
+        self._set_border(color)
+        self._label_text.setText(text)
         if self._on_label_changed:
             self._on_label_changed(self._index, self._chip.label)
 
     def _update_border(self) -> None:
         """Update border color based on current label."""
-        color = _LABEL_COLORS[self._chip.label]
+        self._set_border(_LABEL_COLORS[self._chip.label])
+
+    def _set_border(self, color: str) -> None:
+        """Apply a border of the given color."""
         self.setStyleSheet(f"ChipThumbnail {{ border: 3px solid {color}; }}")
 
 
@@ -26,18 +26,144 @@ Created
 
 Modified
 --------
-2026-02-17
+2026-10-16
 """
 
 # Standard library
-from typing import Any, Optional
+import cmath
+import math
+import statistics
+import sys
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 # Third-party
 import numpy as np
 
+# GRDK internal
+from grdk.viewers.geolocation_lock import geolocation_lock
+
+# Line width that keeps np.array2string output on a single line
+_NO_WRAP = sys.maxsize
+
+# Label text templates
+_PIXEL_FMT = "Pixel: ({}, {})"
+_GEO_FMT = "Lat: {:.6f}\u00b0  Lon: {:.6f}\u00b0"
+_VALUE_FMT = "Value: {:.4g}"
+_GEO_NONE = "Lat/Lon: \u2014"
+_VALUE_NONE = "Value: \u2014"
+_SEGMENT_SEP = "   "
+
+
+class _LatLonGrid:
+    """Coarse lat/lon lookup table for cheap per-hover geolocation.
+
+    Samples the full image-to-ground transform once on an ``n x n`` grid
+    spanning the image (one vectorised ``image_to_latlon`` call) and
+    answers point queries by bilinear interpolation on plain Python
+    floats.
+
+    Parameters
+    ----------
+    lat : List[List[float]]
+        Latitude samples, ``n x n``.
+    lon : List[List[float]]
+        Longitude samples, ``n x n``.
+    row_scale : float
+        Grid cells per image row.
+    col_scale : float
+        Grid cells per image column.
+    """
+
+    def __init__(
+        self,
+        lat: List[List[float]],
+        lon: List[List[float]],
+        row_scale: float,
+        col_scale: float,
+    ) -> None:
+        self._lat = lat
+        self._lon = lon
+        self._last = len(lat) - 2
+        self._row_scale = row_scale
+        self._col_scale = col_scale
+
+    @classmethod
+    def build(cls, geo: Any, n: int) -> Optional["_LatLonGrid"]:
+        """Sample ``geo`` on an ``n x n`` grid.
+
+        Parameters
+        ----------
+        geo : Geolocation
+            grdl geolocation exposing ``shape`` and an ``image_to_latlon``
+            that accepts an ``(N, 2)`` array of ``[row, col]``.
+        n : int
+            Samples per axis.
+
+        Returns
+        -------
+        Optional[_LatLonGrid]
+            ``None`` when the model cannot be sampled or is unsuitable
+            for interpolation (non-finite samples, antimeridian span).
+        """
+        shape = getattr(geo, 'shape', None)
+        if n < 2 or not isinstance(shape, (tuple, list)) or len(shape) < 2:
+            return None
+        rows, cols = int(shape[0]), int(shape[1])
+        if rows < 2 or cols < 2:
+            return None
+
+        rr, cc = np.meshgrid(
+            np.linspace(0.0, rows - 1, n),
+            np.linspace(0.0, cols - 1, n),
+            indexing='ij',
+        )
+        try:
+            with geolocation_lock(geo):
+                out = np.asarray(
+                    geo.image_to_latlon(
+                        np.column_stack([rr.ravel(), cc.ravel()]),
+                    ),
+                    dtype=np.float64,
+                )
+        except Exception:
+            return None
+        if out.ndim != 2 or out.shape[0] != n * n or out.shape[1] < 2:
+            return None
+        lat = out[:, 0].reshape(n, n)
+        lon = out[:, 1].reshape(n, n)
+        if not (np.isfinite(lat).all() and np.isfinite(lon).all()):
+            return None
+        if lon.max() - lon.min() > 180.0:
+            return None
+        return cls(
+            lat.tolist(), lon.tolist(),
+            (n - 1) / (rows - 1), (n - 1) / (cols - 1),
+        )
+
+    def lookup(self, row: float, col: float) -> Tuple[float, float]:
+        """Interpolate ``(lat, lon)`` at an image pixel."""
+        fr = row * self._row_scale
+        fc = col * self._col_scale
+        i = min(max(int(fr), 0), self._last)
+        j = min(max(int(fc), 0), self._last)
+        dr = fr - i
+        dc = fc - j
+        lat0, lat1 = self._lat[i], self._lat[i + 1]
+        lon0, lon1 = self._lon[i], self._lon[i + 1]
+        top = lat0[j] + (lat0[j + 1] - lat0[j]) * dc
+        bot = lat1[j] + (lat1[j + 1] - lat1[j]) * dc
+        lat = top + (bot - top) * dr
+        top = lon0[j] + (lon0[j + 1] - lon0[j]) * dc
+        bot = lon1[j] + (lon1[j + 1] - lon1[j]) * dc
+        lon = top + (bot - top) * dr
+        return lat, lon
+
+
 try:
-    from PyQt6.QtWidgets import QHBoxLayout, QLabel, QWidget
-    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QHBoxLayout, QLabel, QSizePolicy, QWidget
+    from PyQt6.QtCore import Qt, QTimer
 
     _QT_AVAILABLE = True
 except ImportError:
@@ -58,12 +184,29 @@ if _QT_AVAILABLE:
             Parent widget.
         """
 
-        _THROTTLE_MS = 33  # ~30 Hz max geolocation update rate
+        _THROTTLE_MS = 33  # initial geolocation debounce interval
+        _MIN_THROTTLE_MS = 16  # floor once lookup latency is measured
+
+        # Samples per axis of the interpolated lat/lon grid; 0 disables
+        # the grid and sends every lookup through the exact model.
+        _GEO_GRID_SIZE = 32
+
+        # Pixel value formatter per value class key, filled lazily
+        _FORMATTERS: Dict[Any, Callable[[Any], str]] = {}
+
+        # Element formatters for np.array2string on multi-band values
+        _ARRAY_FORMATTER: Dict[str, Callable[[Any], str]] = {
+            'int_kind': lambda v: f"{float(v):.4g}",
+            'float_kind': lambda v: f"{float(v):.4g}",
+            'complex_kind': lambda v: CoordinateBar._fmt_complex(v),
+        }
 
         def __init__(self, parent: Optional[Any] = None) -> None:
             super().__init__(parent)
 
+            self._canvas: Optional[Any] = None
             self._geolocation: Optional[Any] = None
+            self._geo_grid: Optional[_LatLonGrid] = None
 
             # Pending geolocation lookup
             self._pending_row: Optional[int] = None
@@ -72,18 +215,46 @@ if _QT_AVAILABLE:
             self._throttle_timer.setSingleShot(True)
             self._throttle_timer.setInterval(self._THROTTLE_MS)
             self._throttle_timer.timeout.connect(self._do_geo_lookup)
-
-            # Labels
-            self._pixel_label = QLabel("Pixel: —")
-            self._geo_label = QLabel("")
-            self._value_label = QLabel("Value: —")
+            # Recent exact-lookup costs (ns); the debounce interval tracks
+            # 3x their median so lookups stay a bounded share of UI time.
+            self._geo_costs: Deque[int] = deque(maxlen=16)
+
+            # Hover event compression: the canvas signal only records the
+            # latest cursor state; a zero-interval timer delivers it once
+            # per event-loop pass, so a burst of moves costs one update.
+            self._hover_args: Optional[Tuple[int, int, Any]] = None
+            self._hover_timer = QTimer(self)
+            self._hover_timer.setSingleShot(True)
+            self._hover_timer.setInterval(0)
+            self._hover_timer.timeout.connect(self._flush_hover)
+
+            # Most recent successful lookup; the label already shows it
+            self._last_geo_key: Optional[Tuple[int, int]] = None
+
+            # Last cursor state handled, for skipping identical re-emits
+            self._last_hover: Optional[Tuple[int, int, Any]] = None
+
+            # One label for all three segments, so each event costs at
+            # most one setText and one repaint.  Segment strings are kept
+            # separately and the label is only touched when the joined
+            # text actually changes.
+            self._pixel_text = "Pixel: —"
+            self._geo_text = ""
+            self._value_text = _VALUE_NONE
+            self._text = ""
+            self._label = QLabel()
+            # Plain text skips Qt's rich-text sniffing; an ignored
+            # horizontal size hint keeps text-length changes from
+            # reflowing the layout on every hover.
+            self._label.setTextFormat(Qt.TextFormat.PlainText)
+            self._label.setSizePolicy(
+                QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed,
+            )
+            self._refresh_label()
 
             layout = QHBoxLayout(self)
             layout.setContentsMargins(4, 2, 4, 2)
-            layout.addWidget(self._pixel_label)
-            layout.addWidget(self._geo_label)
-            layout.addWidget(self._value_label)
-            layout.addStretch(1)
+            layout.addWidget(self._label, 1)
 
             self.setFixedHeight(24)
 
@@ -94,10 +265,33 @@ if _QT_AVAILABLE:
             ----------
             geo : Optional[Geolocation]
                 grdl Geolocation instance, or None to disable lat/lon.
+
+            Notes
+            -----
+            When ``geo`` exposes ``shape``, it is sampled once on a coarse
+            grid and hover lookups are bilinearly interpolated from it;
+            otherwise each lookup calls ``image_to_latlon`` directly.
             """
+            # Validate the API once here rather than on every lookup
+            if geo is not None and not callable(
+                getattr(geo, 'image_to_latlon', None)
+            ):
+                geo = None
             self._geolocation = geo
+            self._geo_grid = (
+                _LatLonGrid.build(geo, self._GEO_GRID_SIZE)
+                if geo is not None else None
+            )
+            self._last_geo_key = None
+            self._last_hover = None
             if geo is None:
-                self._geo_label.setText("")
+                # No model means no pending lookup, so _do_geo_lookup
+                # only has to test _pending_row.
+                self._throttle_timer.stop()
+                self._pending_row = None
+                self._pending_col = None
+                self._geo_text = ""
+                self._refresh_label()
 
         def connect_canvas(self, canvas: Any) -> None:
             """Connect to an ImageCanvas's pixel_hovered signal.
@@ -107,84 +301,261 @@ if _QT_AVAILABLE:
             canvas : ImageCanvas
                 Canvas whose cursor position drives this bar.
             """
-            canvas.pixel_hovered.connect(self._on_pixel_hovered)
+            self.disconnect_canvas()
+            canvas.pixel_hovered.connect(self.queue_hover)
+            self._canvas = canvas
+
+        def disconnect_canvas(self) -> None:
+            """Disconnect from the current canvas, if any."""
+            canvas, self._canvas = self._canvas, None
+            if canvas is None:
+                return
+            try:
+                canvas.pixel_hovered.disconnect(self.queue_hover)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected or canvas destroyed
+
+        def closeEvent(self, event: Any) -> None:
+            """Stop timers and release the canvas and geolocation."""
+            self._throttle_timer.stop()
+            self._hover_timer.stop()
+            self._hover_args = None
+            self.disconnect_canvas()
+            self._geolocation = None
+            self._geo_grid = None
+            super().closeEvent(event)
+
+        def queue_hover(self, row: int, col: int, value: Any) -> None:
+            """Report the cursor position and pixel value under it.
+
+            Bursts of calls within one event-loop pass are coalesced;
+            only the most recent state is displayed.  ``connect_canvas``
+            wires a canvas's ``pixel_hovered`` signal here, and
+            composite viewers that share one bar call it directly.
+
+            Parameters
+            ----------
+            row, col : int
+                Pixel under the cursor.
+            value : Any
+                Pixel value (scalar or per-band array), or None.
+            """
+            self._hover_args = (row, col, value)
+            if not self._hover_timer.isActive():
+                self._hover_timer.start()
+
+        def _flush_hover(self) -> None:
+            """Deliver the most recent queued cursor state."""
+            args = self._hover_args
+            self._hover_args = None
+            if args is not None:
+                self._on_pixel_hovered(*args)
 
         def _on_pixel_hovered(self, row: int, col: int, value: Any) -> None:
             """Handle cursor position update from canvas."""
-            self._pixel_label.setText(f"Pixel: ({row}, {col})")
+            if not self.isVisible():
+                return
+            last = self._last_hover
+            if (
+                last is not None
+                and last[0] == row
+                and last[1] == col
+                and self._same_value(last[2], value)
+            ):
+                return
+            self._last_hover = (row, col, value)
+            self._pixel_text = _PIXEL_FMT.format(row, col)
             self._format_value(value)
 
             if self._geolocation is not None:
                 self._pending_row = row
                 self._pending_col = col
-                if not self._throttle_timer.isActive():
-                    self._throttle_timer.start()
+                # Trailing-edge debounce: restarting the single-shot timer
+                # defers the lookup until the cursor has been still for
+                # one interval, so a burst of moves costs one lookup.
+                self._throttle_timer.start()
             else:
-                self._geo_label.setText("")
+                self._geo_text = ""
+            self._refresh_label()
+
+        @staticmethod
+        def _same_value(a: Any, b: Any) -> bool:
+            """Cheap identity/scalar-equality test for hover values.
+
+            Arrays (per-band vectors) only match by identity; comparing
+            them elementwise would cost as much as reformatting.
+            """
+            if a is b:
+                return True
+            if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+                return False
+            return type(a) is type(b) and a == b
+
+        def hideEvent(self, event: Any) -> None:
+            """Drop any pending lookup while the bar is hidden."""
+            self._throttle_timer.stop()
+            self._hover_timer.stop()
+            self._hover_args = None
+            self._last_hover = None
+            self._pending_row = None
+            self._pending_col = None
+            super().hideEvent(event)
+
+        def showEvent(self, event: Any) -> None:
+            """Force a fresh lookup on the first hover after re-showing."""
+            self._last_geo_key = None
+            super().showEvent(event)
+
+        def _refresh_label(self) -> None:
+            """Push the joined segments to the label if they changed."""
+            text = _SEGMENT_SEP.join(
+                t for t in (self._pixel_text, self._geo_text, self._value_text)
+                if t
+            )
+            if text != self._text:
+                self._text = text
+                self._label.setText(text)
 
         def _do_geo_lookup(self) -> None:
-            """Perform the geolocation lookup (throttled)."""
-            if self._pending_row is None or self._geolocation is None:
+            """Perform the geolocation lookup (debounced)."""
+            if self._pending_row is None:
                 return
 
-            try:
-                result = self._geolocation.image_to_latlon(
-                    self._pending_row, self._pending_col
-                )
-                if isinstance(result, tuple) and len(result) >= 2:
-                    lat, lon = result[0], result[1]
-                    self._geo_label.setText(
-                        f"Lat: {lat:.6f}\u00b0  Lon: {lon:.6f}\u00b0"
-                    )
-                else:
-                    self._geo_label.setText("")
-            except Exception:
-                self._geo_label.setText("Lat/Lon: —")
+            key = (self._pending_row, self._pending_col)
+            if key == self._last_geo_key:
+                return
+
+            self._last_geo_key = None
+            if self._geo_grid is not None:
+                self._geo_text = _GEO_FMT.format(*self._geo_grid.lookup(*key))
+                self._last_geo_key = key
+            else:
+                lock = geolocation_lock(self._geolocation)
+                if not lock.acquire(blocking=False):
+                    # A pool worker is projecting with this model; retry
+                    # after another interval instead of blocking the GUI
+                    self._throttle_timer.start()
+                    return
+                try:
+                    t0 = time.perf_counter_ns()
+                    result = self._geolocation.image_to_latlon(*key)
+                    self._record_geo_cost(time.perf_counter_ns() - t0)
+                    # grdl returns an ndarray ``[lat, lon, height]`` from
+                    # its vectorised API; older models return a tuple.
+                    if (
+                        isinstance(result, (tuple, list, np.ndarray))
+                        and len(result) >= 2
+                    ):
+                        lat, lon = float(result[0]), float(result[1])
+                        if lat != lat or lon != lon:
+                            # NaN: point off the model's valid domain
+                            self._geo_text = _GEO_NONE
+                        else:
+                            self._geo_text = _GEO_FMT.format(lat, lon)
+                            self._last_geo_key = key
+                    else:
+                        self._geo_text = ""
+                except Exception:
+                    # PyQt6 aborts on exceptions escaping a slot, so model
+                    # failures must still be contained here.
+                    self._geo_text = _GEO_NONE
+                finally:
+                    lock.release()
+            self._refresh_label()
+
+        def _record_geo_cost(self, cost_ns: int) -> None:
+            """Adapt the debounce interval to measured lookup latency."""
+            self._geo_costs.append(cost_ns)
+            median_ms = statistics.median(self._geo_costs) / 1e6
+            self._throttle_timer.setInterval(
+                max(self._MIN_THROTTLE_MS, int(3 * median_ms))
+            )
 
         def _format_value(self, value: Any) -> None:
-            """Format the pixel value for display."""
+            """Format the pixel value into the value segment."""
             if value is None:
-                self._value_label.setText("Value: —")
+                self._value_text = _VALUE_NONE
                 return
 
-            # Numpy array (includes 0-d scalars from array indexing)
-            if isinstance(value, np.ndarray):
-                if np.iscomplexobj(value):
-                    if value.ndim == 0:
-                        self._value_label.setText(
-                            f"Value: {self._fmt_complex(value)}"
-                        )
-                    else:
-                        parts = [self._fmt_complex(v) for v in value.flat]
-                        self._value_label.setText(
-                            f"Value: [{', '.join(parts)}]"
-                        )
-                elif value.ndim == 0:
-                    self._value_label.setText(
-                        f"Value: {float(value):.4g}"
-                    )
-                else:
-                    parts = [f"{float(v):.4g}" for v in value.flat]
-                    self._value_label.setText(
-                        f"Value: [{', '.join(parts)}]"
-                    )
-            # Numpy complex scalars (np.complex64, np.complex128, etc.)
-            # np.complex64 does NOT inherit from Python complex, so
-            # check np.complexfloating before the builtin complex check.
-            elif isinstance(value, (np.complexfloating, complex)):
-                self._value_label.setText(
-                    f"Value: {self._fmt_complex(value)}"
-                )
-            elif isinstance(value, (int, float, np.integer, np.floating)):
-                self._value_label.setText(f"Value: {float(value):.4g}")
+            # One dict lookup per hover; the isinstance chain only runs
+            # the first time a value class is seen.  Numpy arrays and
+            # scalars (anything with shape and dtype) are further keyed on
+            # (is 0-d, dtype kind) so their handler is fully specialised
+            # and never re-inspects the value.
+            value_type = type(value)
+            shape = getattr(value, 'shape', None)
+            dtype = getattr(value, 'dtype', None)
+            if shape is None or dtype is None:
+                key: Any = value_type
             else:
-                self._value_label.setText(f"Value: {value}")
+                key = (value_type, shape == (), dtype.kind)
+            formatter = self._FORMATTERS.get(key)
+            if formatter is None:
+                formatter = self._resolve_formatter(key)
+                self._FORMATTERS[key] = formatter
+            self._value_text = formatter(value)
+
+        @classmethod
+        def _resolve_formatter(cls, key: Any) -> Callable[[Any], str]:
+            """Select the formatter for a value class key."""
+            # Numpy arrays and scalars: (type, is 0-d, dtype kind)
+            if isinstance(key, tuple):
+                _, zero_d, kind = key
+                if not zero_d:
+                    return cls._fmt_band_vector
+                if kind == 'c':
+                    return cls._fmt_complex_0d
+                if kind in 'biuf':
+                    return cls._fmt_real_0d
+                return cls._fmt_other_value
+            if issubclass(key, complex):
+                return cls._fmt_complex_value
+            if issubclass(key, (int, float)):
+                return cls._fmt_real_value
+            return cls._fmt_other_value
+
+        @classmethod
+        def _fmt_complex_0d(cls, value: np.ndarray) -> str:
+            """Format a 0-d complex value, unboxed to a Python scalar."""
+            return f"Value: {cls._fmt_complex(value.item())}"
+
+        @staticmethod
+        def _fmt_real_0d(value: np.ndarray) -> str:
+            """Format a 0-d real value, unboxed to a Python scalar."""
+            return _VALUE_FMT.format(float(value.item()))
+
+        @classmethod
+        def _fmt_band_vector(cls, value: np.ndarray) -> str:
+            """Format a per-band pixel vector."""
+            # Single C-level pass that writes the whole band vector
+            return "Value: " + np.array2string(
+                value.ravel(),
+                separator=', ',
+                max_line_width=_NO_WRAP,
+                formatter=cls._ARRAY_FORMATTER,
+            )
+
+        @classmethod
+        def _fmt_complex_value(cls, value: Any) -> str:
+            """Format a complex scalar pixel value."""
+            return f"Value: {cls._fmt_complex(value)}"
+
+        @staticmethod
+        def _fmt_real_value(value: Any) -> str:
+            """Format a real scalar pixel value."""
+            return _VALUE_FMT.format(float(value))
+
+        @staticmethod
+        def _fmt_other_value(value: Any) -> str:
+            """Format a pixel value of unrecognised type."""
+            return f"Value: {value}"
 
         @staticmethod
         def _fmt_complex(val: Any) -> str:
             """Format a single complex value as magnitude∠phase."""
-            mag = float(np.abs(val))
-            phase = float(np.angle(val, deg=True))
+            # One C call on the unboxed complex; no ufunc dispatch
+            mag, phase = cmath.polar(complex(val))
+            phase = math.degrees(phase)
             return f"{mag:.4g}\u2220{phase:.1f}\u00b0"
 
 else:
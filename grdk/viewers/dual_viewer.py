@@ -32,12 +32,13 @@ Created
 
 Modified
 --------
-2026-02-20
+2026-10-16
 """
 
 # Standard library
 import logging
-from typing import Any, Optional, Tuple
+import os
+from typing import Any, Dict, List, Optional, Tuple
 
 # Third-party
 import numpy as np
@@ -53,12 +54,25 @@ try:
         QVBoxLayout,
         QWidget,
     )
-    from PyQt6.QtCore import QEvent, QObject, Qt, pyqtSignal as Signal
+    from PyQt6.QtCore import (
+        QEvent,
+        QObject,
+        QRunnable,
+        QThreadPool,
+        Qt,
+        QTimer,
+        pyqtSignal as Signal,
+    )
+    from PyQt6.QtGui import QColor, QPainter, QPen
 
     _QT_AVAILABLE = True
 except ImportError:
     _QT_AVAILABLE = False
 
+from grdk.viewers.geolocation_lock import (
+    geolocation_lock,
+    share_geolocation_lock,
+)
 from grdk.viewers.image_canvas import DisplaySettings
 
 
@@ -74,7 +88,10 @@ def compute_geo_bounds(
     """Compute geographic bounding box from a geolocation model.
 
     Transforms the four image corners to lat/lon and returns the
-    axis-aligned bounding box.
+    axis-aligned bounding box.  Models that accept an ``(N, 2)``
+    ``[row, col]`` array (the grdl ``Geolocation`` API) are queried with
+    a single vectorised call; scalar-only models fall back to one call
+    per corner.
 
     Parameters
     ----------
@@ -91,18 +108,36 @@ def compute_geo_bounds(
         ``(lat_min, lat_max, lon_min, lon_max)``, or ``None`` on error.
     """
     corners = [(0, 0), (0, cols - 1), (rows - 1, 0), (rows - 1, cols - 1)]
-    lats, lons = [], []
-    for r, c in corners:
+
+    with geolocation_lock(geolocation):
+        # Vectorised fast path: one projection call for all four corners
         try:
-            result = geolocation.image_to_latlon(r, c)
-            if isinstance(result, tuple) and len(result) >= 2:
+            out = np.asarray(
+                geolocation.image_to_latlon(np.array(corners, dtype=np.float64)),
+                dtype=np.float64,
+            )
+        except Exception:
+            out = None
+        if out is not None and out.ndim == 2 and out.shape[0] == 4 \
+                and out.shape[1] >= 2:
+            lats_arr, lons_arr = out[:, 0], out[:, 1]
+            return (
+                float(lats_arr.min()), float(lats_arr.max()),
+                float(lons_arr.min()), float(lons_arr.max()),
+            )
+
+        lats, lons = [], []
+        for r, c in corners:
+            try:
+                result = geolocation.image_to_latlon(r, c)
                 lats.append(float(result[0]))
                 lons.append(float(result[1]))
-        except Exception:
-            return None
-    if len(lats) < 4:
-        return None
-    return (min(lats), max(lats), min(lons), max(lons))
+            except Exception:
+                return None
+    # One in-place sort per axis instead of separate min and max passes
+    lats.sort()
+    lons.sort()
+    return (lats[0], lats[-1], lons[0], lons[-1])
 
 
 def compute_overlap(
@@ -133,8 +168,112 @@ def compute_overlap(
     if left_geo is None or right_geo is None:
         return None
 
-    left_bounds = compute_geo_bounds(left_geo, *left_shape)
-    right_bounds = compute_geo_bounds(right_geo, *right_shape)
+    # Same model over the same extent overlaps itself entirely
+    if left_geo is right_geo and tuple(left_shape) == tuple(right_shape):
+        return compute_geo_bounds(left_geo, *left_shape)
+
+    return _intersect_bounds(
+        compute_geo_bounds(left_geo, *left_shape),
+        compute_geo_bounds(right_geo, *right_shape),
+    )
+
+
+def _overlap_pixel_bbox(
+    geolocation: Any,
+    overlap: Any,
+    shape: Optional[Tuple[int, int]] = None,
+    densify_pts: int = 21,
+) -> Optional[Tuple[int, int, int, int]]:
+    """Project a lat/lon box into an image's pixel bounding box.
+
+    Models that accept an ``(N, 2)`` ``[lat, lon]`` array are queried
+    once with the box outline densified to ``densify_pts`` extra points
+    per edge, so edges that curve in pixel space are bounded correctly
+    (as in ``rasterio.warp.transform_bounds``).  Scalar-only models fall
+    back to one call per corner.  Models without an inverse raise
+    ``NotImplementedError`` (a ``RuntimeError``), which is treated as a
+    projection failure.
+
+    Parameters
+    ----------
+    geolocation : Geolocation
+        grdl geolocation whose ``latlon_to_image`` returns ``[row, col]``
+        (indexable) for a scalar point and ``(N, 2)`` for stacked
+        points.  Results are indexed without type checks; anything
+        else makes the projection fail and returns ``None``.
+    overlap : np.ndarray or Tuple[float, float, float, float]
+        ``(2, 2)`` array ``[[lat_min, lon_min], [lat_max, lon_max]]``
+        (as from ``SyncController.get_overlap(as_array=True)``), or the
+        tuple ``(lat_min, lat_max, lon_min, lon_max)``.
+    shape : Tuple[int, int], optional
+        ``(rows, cols)`` of the image; the box is clamped to it.
+    densify_pts : int
+        Interior points sampled along each edge on the vectorised path.
+
+    Returns
+    -------
+    Optional[Tuple[int, int, int, int]]
+        ``(r0, r1, c0, c1)`` with exclusive ends, as taken by
+        ``read_chip``, clamped to the image.  ``None`` if the box
+        misses the image, or if projection fails with ``TypeError``,
+        ``ValueError``, ``IndexError`` or ``RuntimeError`` or yields
+        non-finite pixels.  Other errors from the model propagate.
+    """
+    box = np.asarray(overlap, dtype=np.float64)
+    if box.shape != (2, 2):
+        box = box.reshape(2, 2).T
+
+    # Box outline as fractions of the box: corners plus densify_pts
+    # interior points per edge
+    t = np.linspace(0.0, 1.0, densify_pts + 2)[1:-1]
+    lo = np.zeros_like(t)
+    hi = np.ones_like(t)
+    frac = np.concatenate([
+        [[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]],
+        np.column_stack([t, lo]), np.column_stack([t, hi]),
+        np.column_stack([lo, t]), np.column_stack([hi, t]),
+    ])
+    outline = box[0] + (box[1] - box[0]) * frac
+    corners = outline[:4]
+
+    with geolocation_lock(geolocation):
+        try:
+            out = np.asarray(geolocation.latlon_to_image(outline), dtype=np.float64)
+        except (TypeError, ValueError, IndexError, RuntimeError):
+            # Scalar-only model
+            out = None
+        if out is None or out.ndim != 2 or out.shape[0] != len(outline) \
+                or out.shape[1] < 2:
+            try:
+                out = np.array(
+                    [geolocation.latlon_to_image(lat, lon)[:2] for lat, lon in corners],
+                    dtype=np.float64,
+                )
+            except (TypeError, ValueError, IndexError, RuntimeError) as e:
+                _log.warning("crop_to_overlap: projection failed: %r", e)
+                return None
+    if not np.all(np.isfinite(out[:, :2])):
+        return None
+
+    rows = out[:, 0].astype(np.int64)
+    cols = out[:, 1].astype(np.int64)
+    # The largest projected pixel is inside the box, so the exclusive
+    # end is one past it
+    r0, r1 = max(0, int(rows.min())), int(rows.max()) + 1
+    c0, c1 = max(0, int(cols.min())), int(cols.max()) + 1
+    if shape is not None:
+        r1 = min(int(shape[0]), r1)
+        c1 = min(int(shape[1]), c1)
+    if r1 <= r0 or c1 <= c0:
+        return None
+    return (r0, r1, c0, c1)
+
+
+def _intersect_bounds(
+    left_bounds: Optional[Tuple[float, float, float, float]],
+    right_bounds: Optional[Tuple[float, float, float, float]],
+) -> Optional[Tuple[float, float, float, float]]:
+    """Intersect two ``(lat_min, lat_max, lon_min, lon_max)`` boxes."""
     if left_bounds is None or right_bounds is None:
         return None
 
@@ -149,13 +288,283 @@ def compute_overlap(
     return (lat_min, lat_max, lon_min, lon_max)
 
 
+def _project_pixel(
+    source_geo: Any,
+    target_geo: Any,
+    row: float,
+    col: float,
+) -> Optional[Tuple[float, float]]:
+    """Map a source pixel to target pixel space through lat/lon.
+
+    Returns ``None`` if either projection fails or returns an
+    unexpected result.
+    """
+    try:
+        with geolocation_lock(source_geo):
+            result = source_geo.image_to_latlon(row, col)
+        with geolocation_lock(target_geo):
+            tgt = target_geo.latlon_to_image(float(result[0]), float(result[1]))
+        return (float(tgt[0]), float(tgt[1]))
+    except Exception:
+        return None
+
+
+def _fit_pixel_affine(
+    source_geo: Any,
+    source_shape: Tuple[int, int],
+    target_geo: Any,
+) -> Optional[np.ndarray]:
+    """Fit a source-pixel to target-pixel affine from sampled points.
+
+    The four corners and the center of the source image are projected
+    exactly and a least-squares ``2x3`` affine ``A`` is solved so that
+    ``A @ [row, col, 1]`` approximates the target ``(row, col)``.
+
+    Parameters
+    ----------
+    source_geo : Geolocation
+        Source image geolocation.
+    source_shape : Tuple[int, int]
+        ``(rows, cols)`` of the source image.
+    target_geo : Geolocation
+        Target image geolocation.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        ``(2, 3)`` affine, or ``None`` if too few points project or the
+        samples are degenerate.
+    """
+    rows, cols = source_shape[0], source_shape[1]
+    if rows < 2 or cols < 2:
+        return None
+    samples = [
+        (0, 0), (0, cols - 1), (rows - 1, 0), (rows - 1, cols - 1),
+        ((rows - 1) / 2.0, (cols - 1) / 2.0),
+    ]
+    src, dst = [], []
+    for r, c in samples:
+        tgt = _project_pixel(source_geo, target_geo, r, c)
+        if tgt is not None:
+            src.append((r, c, 1.0))
+            dst.append(tgt)
+    if len(src) < 3:
+        return None
+
+    coef, _, rank, _ = np.linalg.lstsq(
+        np.array(src, dtype=np.float64),
+        np.array(dst, dtype=np.float64),
+        rcond=None,
+    )
+    if rank < 3 or not np.all(np.isfinite(coef)):
+        return None
+    return coef.T
+
+
+class _OffsetGeolocation:
+    """Chip-local view of a duck-typed geolocation.
+
+    Fallback for models that are not grdl ``Geolocation`` subclasses
+    (which ``ChipGeolocation`` requires).  Only ``image_to_latlon`` and
+    ``latlon_to_image`` are offered, in the scalar ``(row, col)`` /
+    ``(lat, lon)`` and stacked ``(N, 2)`` forms used by the viewers.
+    """
+
+    def __init__(
+        self,
+        geolocation: Any,
+        row_offset: float,
+        col_offset: float,
+        shape: Tuple[int, int],
+    ) -> None:
+        self._geo = geolocation
+        self._row_offset = float(row_offset)
+        self._col_offset = float(col_offset)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+    def image_to_latlon(self, *args: Any, **kwargs: Any) -> Any:
+        """Offset chip pixels to full-image pixels and delegate."""
+        if len(args) == 1:
+            pts = np.array(args[0], dtype=np.float64)
+            pts[..., 0] += self._row_offset
+            pts[..., 1] += self._col_offset
+            return self._geo.image_to_latlon(pts, **kwargs)
+        row, col = args[0], args[1]
+        return self._geo.image_to_latlon(
+            np.add(row, self._row_offset), np.add(col, self._col_offset),
+            *args[2:], **kwargs,
+        )
+
+    def latlon_to_image(self, *args: Any, **kwargs: Any) -> Any:
+        """Delegate and offset the full-image result to chip pixels."""
+        result = self._geo.latlon_to_image(*args, **kwargs)
+        if len(args) == 1:
+            out = np.array(result, dtype=np.float64)
+            out[..., 0] -= self._row_offset
+            out[..., 1] -= self._col_offset
+            return out
+        return (
+            np.subtract(result[0], self._row_offset),
+            np.subtract(result[1], self._col_offset),
+            *result[2:],
+        )
+
+
+def _chip_geolocation(
+    geolocation: Any,
+    row_offset: int,
+    col_offset: int,
+    shape: Tuple[int, int],
+) -> Any:
+    """Geolocation for a chip whose origin is ``(row_offset, col_offset)``.
+
+    grdl models are wrapped in ``grdl.geolocation.ChipGeolocation``;
+    anything else gets ``_OffsetGeolocation``.  The chip shares the
+    model's ``geolocation_lock``.
+    """
+    try:
+        from grdl.geolocation import ChipGeolocation, Geolocation
+    except ImportError:
+        Geolocation = None
+    if Geolocation is not None and isinstance(geolocation, Geolocation):
+        chip = ChipGeolocation(
+            geolocation, row_offset=row_offset, col_offset=col_offset,
+            shape=shape,
+        )
+    else:
+        chip = _OffsetGeolocation(geolocation, row_offset, col_offset, shape)
+    # Calls through the chip reach the parent model
+    share_geolocation_lock(chip, geolocation)
+    return chip
+
+
 # ---------------------------------------------------------------------------
 # SyncController
 # ---------------------------------------------------------------------------
 
 if _QT_AVAILABLE:
+    from grdk.viewers.coordinate_bar import CoordinateBar
+    from grdk.viewers.geo_viewer import GeoImageViewer
     from grdk.viewers.tiled_canvas import TiledImageCanvas
 
+    def _safe_disconnect(signal: Any, slot: Any) -> None:
+        """Disconnect ``slot`` from ``signal``, ignoring missing connections.
+
+        PyQt6 raises ``TypeError`` when the slot is not connected and
+        ``RuntimeError`` when the emitting object has been deleted.
+        """
+        try:
+            signal.disconnect(slot)
+        except (TypeError, RuntimeError):
+            pass
+
+    class _GeoPairSignals(QObject):
+        """Signal proxy for ``_GeoPairWorker`` (QRunnable cannot emit)."""
+
+        # (generation, (left_bounds, right_bounds, affine_lr, affine_rl))
+        ready = Signal(int, object)
+
+    class _GeoPairWorker(QRunnable):
+        """Project corner bounds and fit sync affines in a thread pool.
+
+        The result is posted back to the GUI thread through the proxy
+        and tagged with the generation it was started for, so results
+        from superseded loads can be discarded.
+        """
+
+        def __init__(
+            self,
+            generation: int,
+            left_geo: Any,
+            left_shape: Tuple[int, int],
+            right_geo: Any,
+            right_shape: Tuple[int, int],
+            proxy: _GeoPairSignals,
+        ) -> None:
+            super().__init__()
+            self.generation = generation
+            self.left_geo = left_geo
+            self.left_shape = left_shape
+            self.right_geo = right_geo
+            self.right_shape = right_shape
+            self.proxy = proxy
+            self.setAutoDelete(True)
+
+        def run(self) -> None:
+            """Compute bounds and affines in a worker thread."""
+            result = (
+                compute_geo_bounds(self.left_geo, *self.left_shape),
+                compute_geo_bounds(self.right_geo, *self.right_shape),
+                _fit_pixel_affine(self.left_geo, self.left_shape, self.right_geo),
+                _fit_pixel_affine(self.right_geo, self.right_shape, self.left_geo),
+            )
+            try:
+                self.proxy.ready.emit(self.generation, result)
+            except RuntimeError:
+                pass  # Controller deleted before the worker finished
+
+    class _ChipSignals(QObject):
+        """Signal proxy for ``_ChipReadWorker`` (QRunnable cannot emit)."""
+
+        # (generation, pane, chip or None on failure)
+        ready = Signal(int, int, object)
+
+    class _ChipReadWorker(QRunnable):
+        """Read one crop-to-overlap chip in a thread pool.
+
+        ``mutex`` is the pane's tile-cache reader mutex, if any, so the
+        read is serialised with in-flight tile loads from the same
+        reader.
+        """
+
+        def __init__(
+            self,
+            generation: int,
+            pane: int,
+            reader: Any,
+            bbox: Tuple[int, int, int, int],
+            mutex: Optional[Any],
+            proxy: _ChipSignals,
+        ) -> None:
+            super().__init__()
+            self.generation = generation
+            self.pane = pane
+            self.reader = reader
+            self.bbox = bbox
+            self.mutex = mutex
+            self.proxy = proxy
+            self.setAutoDelete(True)
+
+        def run(self) -> None:
+            """Read the chip in a worker thread."""
+            r0, r1, c0, c1 = self.bbox
+            try:
+                if self.mutex is not None:
+                    self.mutex.lock()
+                try:
+                    chip = self.reader.read_chip(r0, r1, c0, c1)
+                finally:
+                    if self.mutex is not None:
+                        self.mutex.unlock()
+                # Readers may hand back strided views; pay any layout copy
+                # here rather than in GUI-thread rendering (no-op if
+                # already C-contiguous)
+                chip = np.ascontiguousarray(chip)
+            except (OSError, ValueError, IndexError) as e:
+                _log.warning("crop_to_overlap: pane %d read failed: %s",
+                             self.pane, e)
+                chip = None
+            except Exception:
+                # Unexpected: a reader bug, not a bad box.  Log it loudly;
+                # raising out of a pool thread would abort under PyQt6
+                _log.exception("crop_to_overlap: pane %d read error",
+                               self.pane)
+                chip = None
+            try:
+                self.proxy.ready.emit(self.generation, self.pane, chip)
+            except RuntimeError:
+                pass  # Viewer deleted before the read finished
+
     class SyncController(QObject):
         """Mediates synchronized pan/zoom between two TiledImageCanvas instances.
 
@@ -172,12 +581,34 @@ if _QT_AVAILABLE:
         sync_mode_changed(str)
             Emitted when the sync mode changes.
         overlap_changed(bool)
-            Emitted when geographic overlap availability changes.
+            Emitted when geographic overlap availability changes
+            (always on the first ``set_geolocations``).
         """
 
         sync_mode_changed = Signal(str)
         overlap_changed = Signal(bool)
 
+        # Slot descriptors for the per-event state; sip wrappers still
+        # carry a __dict__, so this speeds access rather than saving memory.
+        __slots__ = (
+            "_left_canvas", "_right_canvas",
+            "_left_geo", "_right_geo", "_left_shape", "_right_shape",
+            "_bounds_cache", "_overlap_cache", "_overlap_array",
+            "_overlap_valid",
+            "_last_has_overlap", "_geo_generation", "_geo_signals",
+            "_affine_lr", "_affine_rl", "_geo_anchor", "_last_sync",
+            "_sync_mode", "_syncing", "_enabled",
+            "_pending_source", "_sync_timer",
+        )
+
+        # Geo sync reuses the last exact projection for pans within this
+        # many source pixels, extrapolating with the fitted affine.
+        _AFFINE_REANCHOR_PX = 256.0
+
+        # Syncs that would move the target by less than these are skipped
+        _SYNC_PIXEL_TOL = 0.5
+        _SYNC_ZOOM_TOL = 1e-3
+
         def __init__(self, parent: Optional[QObject] = None) -> None:
             super().__init__(parent)
 
@@ -188,10 +619,55 @@ if _QT_AVAILABLE:
             self._left_shape: Tuple[int, int] = (0, 0)
             self._right_shape: Tuple[int, int] = (0, 0)
 
+            # Corner-projection results keyed by (id(geo), rows, cols);
+            # only entries for the current models are kept, so ids stay
+            # valid while they are referenced here.
+            self._bounds_cache: Dict[
+                Tuple[int, int, int],
+                Optional[Tuple[float, float, float, float]],
+            ] = {}
+            self._overlap_cache: Optional[Tuple[float, float, float, float]] = None
+            # Same overlap as [[lat_min, lon_min], [lat_max, lon_max]]
+            self._overlap_array: Optional[np.ndarray] = None
+            self._overlap_valid: bool = False
+            # Last value sent on overlap_changed (None before the first)
+            self._last_has_overlap: Optional[bool] = None
+
+            # Background corner projection; results from superseded
+            # set_geolocations calls are dropped by generation.  While
+            # one is in flight the overlap is not yet known.
+            self._geo_generation: int = 0
+            self._geo_pending: bool = False
+            self._geo_signals = _GeoPairSignals(self)
+            self._geo_signals.ready.connect(self._on_geo_pair_ready)
+
+            # Pixel-to-pixel affines fitted per geolocation pair, and the
+            # last exact projection ``(source_geo, row, col, trow, tcol)``.
+            self._affine_lr: Optional[np.ndarray] = None
+            self._affine_rl: Optional[np.ndarray] = None
+            self._geo_anchor: Optional[
+                Tuple[Any, float, float, float, float]
+            ] = None
+
+            # Last dispatched sync: (target, row, col, zoom)
+            self._last_sync: Optional[
+                Tuple[TiledImageCanvas, float, float, float]
+            ] = None
+
             self._sync_mode: str = "pixel"  # "pixel" | "geo" | "none"
             self._syncing: bool = False  # Re-entrancy guard
             self._enabled: bool = True
 
+            # Viewport changes arriving within one event-loop pass are
+            # coalesced; only the most recent source is synced.
+            self._pending_source: Optional[Tuple[
+                TiledImageCanvas, TiledImageCanvas, Any, Any,
+            ]] = None
+            self._sync_timer = QTimer(self)
+            self._sync_timer.setSingleShot(True)
+            self._sync_timer.setInterval(0)
+            self._sync_timer.timeout.connect(self._flush_sync)
+
         # --- Configuration ---
 
         def set_canvases(
@@ -210,19 +686,37 @@ if _QT_AVAILABLE:
             """
             # Disconnect previous if any
             if self._left_canvas is not None:
-                self._left_canvas.viewport_changed.disconnect(
-                    self._on_left_viewport_changed
+                _safe_disconnect(
+                    self._left_canvas.viewport_changed,
+                    self._on_left_viewport_changed,
                 )
             if self._right_canvas is not None:
-                self._right_canvas.viewport_changed.disconnect(
-                    self._on_right_viewport_changed
+                _safe_disconnect(
+                    self._right_canvas.viewport_changed,
+                    self._on_right_viewport_changed,
                 )
+            # A sync queued for the old canvases no longer applies
+            self._sync_timer.stop()
+            self._pending_source = None
+            self._last_sync = None
 
             self._left_canvas = left
             self._right_canvas = right
 
-            left.viewport_changed.connect(self._on_left_viewport_changed)
-            right.viewport_changed.connect(self._on_right_viewport_changed)
+            # Guard against stale connections to the same canvases, and
+            # keep them quiet until both new connections exist
+            _safe_disconnect(left.viewport_changed, self._on_left_viewport_changed)
+            _safe_disconnect(right.viewport_changed, self._on_right_viewport_changed)
+            left_blocked = left.blockSignals(True)
+            right_blocked = right.blockSignals(True)
+            try:
+                # Canvases and controller share the GUI thread
+                direct = Qt.ConnectionType.DirectConnection
+                left.viewport_changed.connect(self._on_left_viewport_changed, direct)
+                right.viewport_changed.connect(self._on_right_viewport_changed, direct)
+            finally:
+                left.blockSignals(left_blocked)
+                right.blockSignals(right_blocked)
             _log.debug("SyncController: canvases connected")
 
         def set_geolocations(
@@ -231,6 +725,7 @@ if _QT_AVAILABLE:
             left_shape: Tuple[int, int],
             right_geo: Optional[Any],
             right_shape: Tuple[int, int],
+            background: bool = False,
         ) -> None:
             """Update geolocation models and recompute overlap.
 
@@ -244,20 +739,68 @@ if _QT_AVAILABLE:
                 Right image geolocation.
             right_shape : Tuple[int, int]
                 ``(rows, cols)`` of right image.
+            background : bool
+                If True and both models are set, project the corners and
+                fit the sync affines on ``QThreadPool.globalInstance()``;
+                ``overlap_changed`` is emitted when the result arrives.
+                Until then ``overlap_pending`` is True and
+                ``get_overlap()`` returns None.
             """
             self._left_geo = left_geo
             self._left_shape = left_shape
             self._right_geo = right_geo
             self._right_shape = right_shape
-
+            self._overlap_valid = False
+            self._geo_generation += 1
+            self._geo_pending = False
+
+            # Drop cached bounds for models no longer displayed
+            live = {id(left_geo), id(right_geo)}
+            for key in [k for k in self._bounds_cache if k[0] not in live]:
+                del self._bounds_cache[key]
+
+            self._geo_anchor = None
+            self._last_sync = None
+            self._affine_lr = self._affine_rl = None
+            if left_geo is not None and right_geo is not None:
+                if background:
+                    self._geo_pending = True
+                    QThreadPool.globalInstance().start(_GeoPairWorker(
+                        self._geo_generation,
+                        left_geo, left_shape, right_geo, right_shape,
+                        self._geo_signals,
+                    ))
+                    return
+                self._affine_lr = _fit_pixel_affine(left_geo, left_shape, right_geo)
+                self._affine_rl = _fit_pixel_affine(right_geo, right_shape, left_geo)
+
+            self._apply_overlap()
+
+        def _on_geo_pair_ready(self, generation: int, result: Any) -> None:
+            """Store background bounds/affines and publish the overlap."""
+            if generation != self._geo_generation:
+                return
+            self._geo_pending = False
+            left_bounds, right_bounds, affine_lr, affine_rl = result
+            cache = self._bounds_cache
+            cache[self._bounds_key(self._left_geo, self._left_shape)] = left_bounds
+            cache[self._bounds_key(self._right_geo, self._right_shape)] = right_bounds
+            self._affine_lr, self._affine_rl = affine_lr, affine_rl
+            self._overlap_valid = False
+            self._apply_overlap()
+
+        def _apply_overlap(self) -> None:
+            """Emit overlap availability and leave geo mode if it is lost."""
             has_overlap = self.get_overlap() is not None
             _log.info(
                 "SyncController: geolocations updated, left=%s, right=%s, overlap=%s",
-                type(left_geo).__name__ if left_geo else None,
-                type(right_geo).__name__ if right_geo else None,
+                type(self._left_geo).__name__ if self._left_geo else None,
+                type(self._right_geo).__name__ if self._right_geo else None,
                 has_overlap,
             )
-            self.overlap_changed.emit(has_overlap)
+            if has_overlap != self._last_has_overlap:
+                self._last_has_overlap = has_overlap
+                self.overlap_changed.emit(has_overlap)
 
             # If geo mode but no overlap, fall back to pixel
             if self._sync_mode == "geo" and not has_overlap:
@@ -274,8 +817,11 @@ if _QT_AVAILABLE:
             """
             if mode not in ("pixel", "geo", "none"):
                 raise ValueError(f"Invalid sync mode: {mode!r}")
+            if mode == self._sync_mode:
+                return
             _log.info("SyncController: sync mode -> %s", mode)
             self._sync_mode = mode
+            self._last_sync = None
             self.sync_mode_changed.emit(mode)
 
         @property
@@ -305,35 +851,117 @@ if _QT_AVAILABLE:
             else:
                 self.set_sync_mode("none")
 
-        def get_overlap(self) -> Optional[Tuple[float, float, float, float]]:
+        def get_overlap(
+            self, as_array: bool = False,
+        ) -> Optional[Any]:
             """Compute the current geographic overlap, if any.
 
+            Parameters
+            ----------
+            as_array : bool
+                Return the overlap as a ``(2, 2)`` array
+                ``[[lat_min, lon_min], [lat_max, lon_max]]`` instead of
+                a tuple.  The array is shared between calls; do not
+                modify it.
+
             Returns
             -------
-            Optional[Tuple[float, float, float, float]]
-                ``(lat_min, lat_max, lon_min, lon_max)`` or ``None``.
+            Optional[Tuple[float, float, float, float] | np.ndarray]
+                ``(lat_min, lat_max, lon_min, lon_max)`` (or the array
+                form), or ``None``.  Also ``None`` while
+                ``overlap_pending``; ``overlap_changed`` reports the
+                result.
             """
-            return compute_overlap(
-                self._left_geo, self._left_shape,
-                self._right_geo, self._right_shape,
-            )
+            if self._geo_pending:
+                return None
+            if not self._overlap_valid:
+                if self._left_geo is None or self._right_geo is None:
+                    overlap = None
+                else:
+                    overlap = _intersect_bounds(
+                        self._cached_bounds(self._left_geo, self._left_shape),
+                        self._cached_bounds(self._right_geo, self._right_shape),
+                    )
+                self._overlap_cache = overlap
+                self._overlap_array = None if overlap is None else np.array(
+                    [[overlap[0], overlap[2]], [overlap[1], overlap[3]]],
+                    dtype=np.float64,
+                )
+                self._overlap_valid = True
+            return self._overlap_array if as_array else self._overlap_cache
+
+        @property
+        def overlap_pending(self) -> bool:
+            """Whether a background overlap computation is in flight."""
+            return self._geo_pending
+
+        def invalidate_overlap(self) -> None:
+            """Discard cached bounds and overlap for the current models.
+
+            The next ``get_overlap()`` re-projects the image corners.
+            """
+            self._bounds_cache.clear()
+            self._overlap_cache = None
+            self._overlap_array = None
+            self._overlap_valid = False
+
+        @staticmethod
+        def _bounds_key(geo: Any, shape: Tuple[int, int]) -> Tuple[int, int, int]:
+            """Bounds-cache key for a model displayed at ``shape``."""
+            return (id(geo), int(shape[0]), int(shape[1]))
+
+        def _cached_bounds(
+            self, geo: Any, shape: Tuple[int, int],
+        ) -> Optional[Tuple[float, float, float, float]]:
+            """Memoized ``compute_geo_bounds`` for a displayed model."""
+            key = self._bounds_key(geo, shape)
+            try:
+                return self._bounds_cache[key]
+            except KeyError:
+                bounds = compute_geo_bounds(geo, *shape)
+                self._bounds_cache[key] = bounds
+                return bounds
 
         # --- Internal sync handlers ---
 
         def _on_left_viewport_changed(self) -> None:
-            """Sync right canvas to match left viewport."""
-            self._sync_viewport(
+            """Schedule a sync of the right canvas to the left viewport."""
+            self._queue_sync(
                 self._left_canvas, self._right_canvas,
                 self._left_geo, self._right_geo,
             )
 
         def _on_right_viewport_changed(self) -> None:
-            """Sync left canvas to match right viewport."""
-            self._sync_viewport(
+            """Schedule a sync of the left canvas to the right viewport."""
+            self._queue_sync(
                 self._right_canvas, self._left_canvas,
                 self._right_geo, self._left_geo,
             )
 
+        def _queue_sync(
+            self,
+            source: Optional[TiledImageCanvas],
+            target: Optional[TiledImageCanvas],
+            source_geo: Optional[Any],
+            target_geo: Optional[Any],
+        ) -> None:
+            """Record the latest sync request and arm the coalescing timer.
+
+            Viewport changes emitted by the target while it is being
+            synced are ignored so the panes do not ping-pong.
+            """
+            if self._syncing or self._sync_mode == "none":
+                return
+            self._pending_source = (source, target, source_geo, target_geo)
+            self._sync_timer.start()
+
+        def _flush_sync(self) -> None:
+            """Apply the most recent pending sync request."""
+            pending = self._pending_source
+            self._pending_source = None
+            if pending is not None:
+                self._sync_viewport(*pending)
+
         def _sync_viewport(
             self,
             source: Optional[TiledImageCanvas],
@@ -345,7 +973,8 @@ if _QT_AVAILABLE:
 
             Uses a re-entrancy guard to prevent infinite loops.
             """
-            if self._syncing or self._sync_mode == "none":
+            mode = self._sync_mode
+            if self._syncing or mode == "none":
                 return
             if source is None or target is None:
                 return
@@ -356,31 +985,80 @@ if _QT_AVAILABLE:
                 src_zoom = source.get_zoom()
 
                 if (
-                    self._sync_mode == "geo"
+                    mode == "geo"
                     and source_geo is not None
                     and target_geo is not None
                 ):
-                    try:
-                        result = source_geo.image_to_latlon(src_row, src_col)
-                        if isinstance(result, tuple) and len(result) >= 2:
-                            lat, lon = float(result[0]), float(result[1])
-                            tgt = target_geo.latlon_to_image(lat, lon)
-                            if isinstance(tgt, tuple) and len(tgt) >= 2:
-                                tgt_row, tgt_col = float(tgt[0]), float(tgt[1])
-                            else:
-                                tgt_row, tgt_col = src_row, src_col
-                        else:
-                            tgt_row, tgt_col = src_row, src_col
-                    except Exception:
-                        tgt_row, tgt_col = src_row, src_col
+                    tgt_row, tgt_col = self._map_geo(
+                        source_geo, target_geo, src_row, src_col,
+                    )
                 else:
                     tgt_row, tgt_col = src_row, src_col
 
-                target.center_on(tgt_row, tgt_col)
-                target.zoom_to(src_zoom)
+                last = self._last_sync
+                if (
+                    last is not None
+                    and last[0] is target
+                    and abs(tgt_row - last[1]) < self._SYNC_PIXEL_TOL
+                    and abs(tgt_col - last[2]) < self._SYNC_PIXEL_TOL
+                    and abs(src_zoom - last[3]) < self._SYNC_ZOOM_TOL
+                ):
+                    return
+
+                # Block the target's own viewport_changed rather than
+                # bouncing it off the re-entrancy guard; zoom_changed is
+                # re-sent afterwards for zoom displays.
+                target.blockSignals(True)
+                try:
+                    target.set_viewport(tgt_row, tgt_col, src_zoom)
+                finally:
+                    target.blockSignals(False)
+                if src_zoom > 0:
+                    target.zoom_changed.emit(src_zoom)
+                self._last_sync = (target, tgt_row, tgt_col, src_zoom)
             finally:
                 self._syncing = False
 
+        def _map_geo(
+            self,
+            source_geo: Any,
+            target_geo: Any,
+            row: float,
+            col: float,
+        ) -> Tuple[float, float]:
+            """Map a source viewport center into target pixel space.
+
+            Near the last exact projection the fitted affine is applied
+            to the pixel delta; farther away (or without an affine) the
+            full lat/lon round trip is run and becomes the new anchor.
+            Falls back to the source position if projection fails.
+            """
+            affine = (
+                self._affine_lr if source_geo is self._left_geo
+                else self._affine_rl
+            )
+            anchor = self._geo_anchor
+            if affine is not None and anchor is not None \
+                    and anchor[0] is source_geo:
+                d_row, d_col = row - anchor[1], col - anchor[2]
+                limit = self._AFFINE_REANCHOR_PX
+                if abs(d_row) <= limit and abs(d_col) <= limit:
+                    return (
+                        float(anchor[3] + affine[0, 0] * d_row + affine[0, 1] * d_col),
+                        float(anchor[4] + affine[1, 0] * d_row + affine[1, 1] * d_col),
+                    )
+
+            tgt = _project_pixel(source_geo, target_geo, row, col)
+            if tgt is None:
+                if affine is not None:
+                    return (
+                        float(affine[0, 0] * row + affine[0, 1] * col + affine[0, 2]),
+                        float(affine[1, 0] * row + affine[1, 1] * col + affine[1, 2]),
+                    )
+                return (row, col)
+            self._geo_anchor = (source_geo, row, col, tgt[0], tgt[1])
+            return tgt
+
 
     # -------------------------------------------------------------------
     # SyncBar
@@ -414,6 +1092,12 @@ if _QT_AVAILABLE:
         crop_requested = Signal()
         reset_requested = Signal()
 
+        # Sync button (text, tooltip) keyed by checked state
+        _SYNC_BUTTON_STATE = {
+            True: ("\u26d3", "Sync enabled — click to disable"),  # chain
+            False: ("\u26a0", "Sync disabled — click to enable"),  # broken
+        }
+
         def __init__(self, parent: Optional[QWidget] = None) -> None:
             super().__init__(parent)
 
@@ -499,12 +1183,9 @@ if _QT_AVAILABLE:
         # --- Internal ---
 
         def _on_sync_toggled(self, checked: bool) -> None:
-            if checked:
-                self._sync_btn.setText("\u26d3")  # chain
-                self._sync_btn.setToolTip("Sync enabled — click to disable")
-            else:
-                self._sync_btn.setText("\u26a0")  # warning/broken
-                self._sync_btn.setToolTip("Sync disabled — click to enable")
+            text, tooltip = self._SYNC_BUTTON_STATE[bool(checked)]
+            self._sync_btn.setText(text)
+            self._sync_btn.setToolTip(tooltip)
             self.sync_toggled.emit(checked)
 
         def _on_mode_clicked(self) -> None:
@@ -530,6 +1211,46 @@ if _QT_AVAILABLE:
             self.reset_requested.emit()
 
 
+    class _PaneFrame(QWidget):
+        """Container that paints the active-pane border around a viewer.
+
+        The border is drawn in ``paintEvent`` so toggling it only
+        repaints this widget; no style sheet is parsed or cascaded to
+        the viewer's children.
+        """
+
+        _BORDER_COLOR = "#4A90D9"
+        _BORDER_WIDTH = 2
+
+        def __init__(self, child: QWidget, parent: Optional[QWidget] = None) -> None:
+            super().__init__(parent)
+            self._bordered = False
+            self._active = False
+            self._pen = QPen(QColor(self._BORDER_COLOR), self._BORDER_WIDTH)
+            layout = QVBoxLayout(self)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(child)
+
+        def set_border(self, bordered: bool, active: bool) -> None:
+            """Reserve border space when ``bordered``; draw it when ``active``."""
+            if bordered != self._bordered:
+                self._bordered = bordered
+                m = self._BORDER_WIDTH if bordered else 0
+                self.layout().setContentsMargins(m, m, m, m)
+            if active != self._active:
+                self._active = active
+                self.update()
+
+        def paintEvent(self, event: Any) -> None:
+            """Draw the border around the child when active."""
+            if not (self._bordered and self._active):
+                return
+            half = self._BORDER_WIDTH // 2
+            painter = QPainter(self)
+            painter.setPen(self._pen)
+            painter.drawRect(self.rect().adjusted(half, half, -half, -half))
+            painter.end()
+
     # -------------------------------------------------------------------
     # DualGeoViewer
     # -------------------------------------------------------------------
@@ -554,7 +1275,13 @@ if _QT_AVAILABLE:
         active_pane_changed(int)
             Emitted when the active pane changes (0=left, 1=right).
         band_info_changed(list)
-            Forwarded from the active pane.
+            Forwarded from the active pane.  Prefer
+            ``pane_band_info_changed``, which covers both panes.
+        pane_band_info_changed(int, list)
+            ``(pane_index, band_info)`` from either pane.
+        export_finished(str, str)
+            ``(filepath, error)`` when a background export from either
+            pane completes; ``error`` is empty on success.
         mode_changed(str)
             Emitted on ``"single"`` / ``"dual"`` switch.
         """
@@ -562,27 +1289,70 @@ if _QT_AVAILABLE:
         active_pane_changed = Signal(int)
         band_info_changed = Signal(list)
         pane_band_info_changed = Signal(int, list)  # (pane_index, band_info)
+        export_finished = Signal(str, str)  # (filepath, error or "")
         mode_changed = Signal(str)
 
         def __init__(self, parent: Optional[QWidget] = None) -> None:
             super().__init__(parent)
 
-            from grdk.viewers.geo_viewer import GeoImageViewer
-            from grdk.viewers.coordinate_bar import CoordinateBar
-
             self._mode: str = "single"
             self._active_pane: int = 0
             self._cropped: bool = False
 
-            # Store original readers/geolocations for crop reset
-            self._left_reader: Optional[Any] = None
-            self._left_orig_geo: Optional[Any] = None
-            self._right_reader: Optional[Any] = None
-            self._right_orig_geo: Optional[Any] = None
+            # Original reader/geolocation per pane, for crop reset
+            self._readers: List[Optional[Any]] = [None, None]
+            self._orig_geos: List[Optional[Any]] = [None, None]
+            # (rows, cols) of each pane's full image, for clamping crops
+            self._orig_shapes: List[Tuple[int, int]] = [(0, 0), (0, 0)]
+
+            # (rows, cols) of each pane's loaded image; None until the
+            # next _update_after_load recomputes it
+            self._cached_left_shape: Optional[Tuple[int, int]] = None
+            self._cached_right_shape: Optional[Tuple[int, int]] = None
+
+            # What each pane was last loaded from, to skip identical
+            # reloads: ("file", path, mtime) or ("reader", reader, geo)
+            self._pane_sources: List[Optional[Tuple[Any, ...]]] = [None, None]
+
+            # Pixel crop boxes keyed by (id(geo), shape, overlap), so
+            # panes that share a geolocation and shape project once;
+            # cleared whenever a pane loads new data
+            self._crop_bbox_cache: Dict[
+                Tuple[int, Tuple[int, int], Tuple[float, float, float, float]],
+                Optional[Tuple[int, int, int, int]],
+            ] = {}
+
+            # Asynchronous crop reads; chips from a superseded crop or
+            # load are dropped by generation
+            self._crop_generation: int = 0
+            self._crop_pending: int = 0
+            # Pixel box each pane is showing (or reading) from a crop
+            self._last_chip_bbox: List[Optional[Tuple[int, int, int, int]]] = [
+                None, None,
+            ]
+            # (row, col, zoom) each pane showed before its first crop
+            # chip replaced the full image; None for panes still showing
+            # the full image, which reset_crop leaves alone
+            self._crop_viewports: List[
+                Optional[Tuple[float, float, float]]
+            ] = [None, None]
+            # (overlap, overlap array) the current crop was made from.
+            # While cropped the controller holds the chip models, whose
+            # overlap can differ from the full images' by rounding.
+            self._crop_overlap: Optional[Tuple[Any, np.ndarray]] = None
+            self._chip_signals = _ChipSignals(self)
+            self._chip_signals.ready.connect(self._on_chip_ready)
+
+            # Whether each pane may hold vector overlays, so clearing
+            # already-empty panes does not touch their scenes
+            self._has_vectors: List[bool] = [False, False]
 
             # --- Panes ---
             self._left_viewer = GeoImageViewer(self)
             self._right_viewer = GeoImageViewer(self)
+            self._viewers: Tuple[GeoImageViewer, GeoImageViewer] = (
+                self._left_viewer, self._right_viewer,
+            )
 
             # Hide per-viewer coordinate bars (we use a shared one)
             self._left_viewer.coord_bar.hide()
@@ -598,19 +1368,26 @@ if _QT_AVAILABLE:
 
             # --- Shared coordinate bar ---
             self._coord_bar = CoordinateBar(self)
+            # Geolocation last handed to the coordinate bar, which
+            # resamples its lookup grid on every set_geolocation
+            self._last_coord_geo: Optional[Any] = None
 
-            # Connect pixel_hovered from both canvases
+            # Connect pixel_hovered from both canvases (same thread)
             self._left_viewer.canvas.pixel_hovered.connect(
                 self._on_left_pixel_hovered,
+                Qt.ConnectionType.DirectConnection,
             )
             self._right_viewer.canvas.pixel_hovered.connect(
                 self._on_right_pixel_hovered,
+                Qt.ConnectionType.DirectConnection,
             )
 
             # --- Layout ---
+            self._left_frame = _PaneFrame(self._left_viewer, self)
+            self._right_frame = _PaneFrame(self._right_viewer, self)
             self._splitter = QSplitter(Qt.Orientation.Horizontal, self)
-            self._splitter.addWidget(self._left_viewer)
-            self._splitter.addWidget(self._right_viewer)
+            self._splitter.addWidget(self._left_frame)
+            self._splitter.addWidget(self._right_frame)
             self._splitter.setChildrenCollapsible(False)
 
             top_layout = QHBoxLayout()
@@ -632,6 +1409,8 @@ if _QT_AVAILABLE:
             self._right_viewer.band_info_changed.connect(
                 self._on_right_band_info,
             )
+            self._left_viewer.export_finished.connect(self.export_finished)
+            self._right_viewer.export_finished.connect(self.export_finished)
             self._sync_bar.sync_toggled.connect(self._on_sync_toggled)
             self._sync_bar.mode_changed.connect(self._on_sync_mode_changed)
             self._sync_bar.crop_requested.connect(self.crop_to_overlap)
@@ -645,7 +1424,7 @@ if _QT_AVAILABLE:
             self._right_viewer.installEventFilter(self)
 
             # Start in single mode
-            self._right_viewer.hide()
+            self._right_frame.hide()
             self._sync_bar.hide()
 
         # --- Properties ---
@@ -715,29 +1494,28 @@ if _QT_AVAILABLE:
             _log.info("DualGeoViewer: mode -> %s", mode)
             self._mode = mode
 
-            if mode == "dual":
-                self._right_viewer.show()
-                self._sync_bar.show()
-                # Equal split
-                total = self._splitter.width()
-                self._splitter.setSizes([total // 2, total // 2])
-                # Show active pane indicator
-                if self._active_pane == 0:
-                    self._left_viewer.setStyleSheet(self._ACTIVE_BORDER)
-                    self._right_viewer.setStyleSheet(self._INACTIVE_BORDER)
+            # Batch the show/hide, resize and border changes into a
+            # single repaint
+            self.setUpdatesEnabled(False)
+            try:
+                if mode == "dual":
+                    self._right_frame.show()
+                    self._sync_bar.show()
+                    # Equal split
+                    total = self._splitter.width()
+                    self._splitter.setSizes([total // 2, total // 2])
                 else:
-                    self._left_viewer.setStyleSheet(self._INACTIVE_BORDER)
-                    self._right_viewer.setStyleSheet(self._ACTIVE_BORDER)
-            else:
-                self._right_viewer.hide()
-                self._sync_bar.hide()
-                # Clear pane borders in single mode
-                self._left_viewer.setStyleSheet("")
-                self._right_viewer.setStyleSheet("")
-                # Ensure active pane is left in single mode
-                if self._active_pane == 1:
-                    self._active_pane = 0
-                    self.active_pane_changed.emit(0)
+                    self._right_frame.hide()
+                    self._sync_bar.hide()
+                    # Ensure active pane is left in single mode
+                    if self._active_pane == 1:
+                        self._active_pane = 0
+                        self.active_pane_changed.emit(0)
+                # Active pane indicator (no borders in single mode)
+                self._update_pane_borders()
+            finally:
+                self.setUpdatesEnabled(True)
+                self.update()
 
             self.mode_changed.emit(mode)
 
@@ -758,9 +1536,24 @@ if _QT_AVAILABLE:
             pane : int
                 0 for left pane, 1 for right pane.
             """
+            try:
+                source = ("file", os.fspath(filepath), os.path.getmtime(filepath))
+            except (OSError, TypeError):
+                source = None
+            if source is not None and self._is_loaded_from(pane, source):
+                _log.debug("DualGeoViewer: %r already open in pane %d", filepath, pane)
+                return
+
             _log.info("DualGeoViewer: open_file(%r, pane=%d)", filepath, pane)
-            viewer = self._left_viewer if pane == 0 else self._right_viewer
+            viewer = self._viewers[pane]
+            self._close_detached_reader(pane)
+            self._invalidate_shape(pane)
+            self._pane_sources[pane] = None
+            self._crop_bbox_cache.clear()
+            self._cancel_crop()
+            self._crop_viewports = [None, None]
             viewer.open_file(filepath)
+            self._pane_sources[pane] = source
             self._update_after_load(pane)
 
         def open_reader(
@@ -784,8 +1577,18 @@ if _QT_AVAILABLE:
                 "DualGeoViewer: open_reader(%s, geo=%s, pane=%d)",
                 type(reader).__name__, type(geolocation).__name__ if geolocation else None, pane,
             )
-            viewer = self._left_viewer if pane == 0 else self._right_viewer
+            source = ("reader", reader, geolocation)
+            if self._is_loaded_from(pane, source):
+                return
+            viewer = self._viewers[pane]
+            self._close_detached_reader(pane, keep=reader)
+            self._invalidate_shape(pane)
+            self._pane_sources[pane] = None
+            self._crop_bbox_cache.clear()
+            self._cancel_crop()
+            self._crop_viewports = [None, None]
             viewer.open_reader(reader, geolocation=geolocation)
+            self._pane_sources[pane] = source
             self._update_after_load(pane)
 
         def set_array(
@@ -805,36 +1608,97 @@ if _QT_AVAILABLE:
             pane : int
                 0 for left pane, 1 for right pane.
             """
-            viewer = self._left_viewer if pane == 0 else self._right_viewer
+            viewer = self._viewers[pane]
+            self._close_detached_reader(pane)
+            self._invalidate_shape(pane)
+            self._pane_sources[pane] = None
+            self._crop_bbox_cache.clear()
+            self._cancel_crop()
+            self._crop_viewports = [None, None]
             viewer.set_array(arr, geolocation=geolocation)
             self._update_after_load(pane)
 
+        def _is_loaded_from(self, pane: int, source: Tuple[Any, ...]) -> bool:
+            """Whether ``pane`` already shows ``source`` uncropped."""
+            loaded = self._pane_sources[pane]
+            if self._cropped or loaded is None or loaded[0] != source[0]:
+                return False
+            if source[0] == "reader":
+                return loaded[1] is source[1] and loaded[2] is source[2]
+            return loaded[1:] == source[1:]
+
         def _update_after_load(self, pane: int) -> None:
             """Update sync controller and overlap state after loading."""
             # Store reader/geo references for crop reset
-            if pane == 0:
-                self._left_reader = self._left_viewer._reader
-                self._left_orig_geo = self._left_viewer.geolocation
-            else:
-                self._right_reader = self._right_viewer._reader
-                self._right_orig_geo = self._right_viewer.geolocation
+            viewer = self._viewers[pane]
+            self._readers[pane] = viewer._reader
+            self._orig_geos[pane] = viewer.geolocation
 
             # Reset crop state
             if self._cropped:
                 self._cropped = False
                 self._sync_bar.set_cropped(False)
 
-            # Update geolocations for sync
-            left_shape = self._get_image_shape(self._left_viewer)
-            right_shape = self._get_image_shape(self._right_viewer)
+            # Update geolocations for sync; only the reloaded pane's
+            # shape is recomputed
+            self._sync_geolocations()
+            self._orig_shapes[pane] = self._pane_shape(pane)
 
+        def _sync_geolocations(self) -> None:
+            """Hand the displayed models and shapes to the sync controller
+            and the coordinate bar."""
             self._sync_controller.set_geolocations(
-                self._left_viewer.geolocation, left_shape,
-                self._right_viewer.geolocation, right_shape,
+                self._left_viewer.geolocation, self._pane_shape(0),
+                self._right_viewer.geolocation, self._pane_shape(1),
+                background=True,
             )
 
             # Update coordinate bar geolocation for active pane
-            self._coord_bar.set_geolocation(self.active_viewer.geolocation)
+            self._update_coord_geo()
+
+        def _close_detached_reader(
+            self, pane: int, keep: Optional[Any] = None,
+        ) -> None:
+            """Close the reader a crop chip detached from ``pane``.
+
+            A pane showing a crop chip no longer owns its reader, which
+            is kept open in ``_readers`` for ``reset_crop``; it is closed
+            here when the pane loads something else instead.  ``keep``
+            is a reader about to be reopened, which is left open.
+            """
+            reader = self._readers[pane]
+            if (
+                reader is None
+                or reader is keep
+                or reader is self._viewers[pane]._reader
+            ):
+                return
+            try:
+                reader.close()
+            except Exception:
+                pass
+            self._readers[pane] = None
+
+        def _pane_shape(self, pane: int) -> Tuple[int, int]:
+            """Return the cached (rows, cols) of a pane, computing on miss."""
+            if pane == 0:
+                if self._cached_left_shape is None:
+                    self._cached_left_shape = self._get_image_shape(
+                        self._left_viewer,
+                    )
+                return self._cached_left_shape
+            if self._cached_right_shape is None:
+                self._cached_right_shape = self._get_image_shape(
+                    self._right_viewer,
+                )
+            return self._cached_right_shape
+
+        def _invalidate_shape(self, pane: Optional[int] = None) -> None:
+            """Drop the cached shape of one pane, or both if None."""
+            if pane is None or pane == 0:
+                self._cached_left_shape = None
+            if pane is None or pane == 1:
+                self._cached_right_shape = None
 
         @staticmethod
         def _get_image_shape(viewer: Any) -> Tuple[int, int]:
@@ -867,29 +1731,35 @@ if _QT_AVAILABLE:
             """
             if pane is None:
                 pane = self._active_pane
-            viewer = self._left_viewer if pane == 0 else self._right_viewer
+            viewer = self._viewers[pane]
             viewer.load_vector(filepath)
+            self._has_vectors[pane] = True
 
         def clear_vectors(self, pane: Optional[int] = None) -> None:
             """Clear vector overlays.
 
+            Panes with no vectors loaded are left untouched.
+
             Parameters
             ----------
             pane : int, optional
                 Target pane.  If None, clears both panes.
             """
-            if pane is None:
-                self._left_viewer.clear_vectors()
-                self._right_viewer.clear_vectors()
-            else:
-                viewer = (
-                    self._left_viewer if pane == 0 else self._right_viewer
-                )
-                viewer.clear_vectors()
+            panes = (0, 1) if pane is None else (pane,)
+            for i in panes:
+                if not self._has_vectors[i]:
+                    continue
+                self._viewers[i].clear_vectors()
+                self._has_vectors[i] = False
 
         # --- Export ---
 
-        def export_view(self, filepath: str, pane: Optional[int] = None) -> None:
+        def export_view(
+            self,
+            filepath: str,
+            pane: Optional[int] = None,
+            background: bool = False,
+        ) -> None:
             """Export the current view from a pane.
 
             Parameters
@@ -898,80 +1768,147 @@ if _QT_AVAILABLE:
                 Output file path.
             pane : int, optional
                 Target pane.  If None, uses the active pane.
+            background : bool
+                Encode and write off the GUI thread; completion is
+                reported by ``export_finished``.
             """
             if pane is None:
                 pane = self._active_pane
-            viewer = self._left_viewer if pane == 0 else self._right_viewer
-            viewer.export_view(filepath)
+            viewer = self._viewers[pane]
+            viewer.export_view(filepath, background=background)
 
         # --- Crop to overlap ---
 
         def crop_to_overlap(self) -> None:
             """Crop both panes to show only the geographic overlap region.
 
-            Requires both images to be loaded with geolocation and to
-            have a geographic overlap.  Does nothing otherwise.
+            Requires both images to be loaded from readers with
+            geolocation and to have a geographic overlap.  Does nothing
+            otherwise.  The
+            overlap chips are read on ``QThreadPool.globalInstance()``
+            and displayed as each read completes.  The viewer counts as
+            cropped only while a chip is being read or shown.
             """
-            overlap = self._sync_controller.get_overlap()
-            if overlap is None:
-                _log.warning("crop_to_overlap: no geographic overlap")
+            if self._crop_pending:
+                _log.debug("crop_to_overlap: crop already in flight")
+                return
+            if None in self._readers or None in self._orig_geos:
+                _log.warning("crop_to_overlap: missing reader/geo")
                 return
+            if self._crop_overlap is not None:
+                overlap, box = self._crop_overlap
+            else:
+                if self._sync_controller.overlap_pending:
+                    _log.info("crop_to_overlap: overlap not yet known")
+                    return
+                overlap = self._sync_controller.get_overlap()
+                if overlap is None:
+                    _log.warning("crop_to_overlap: no geographic overlap")
+                    return
+                box = self._sync_controller.get_overlap(as_array=True)
+                self._crop_overlap = (overlap, box)
 
             _log.info("crop_to_overlap: overlap=%s", overlap)
 
-            lat_min, lat_max, lon_min, lon_max = overlap
-
-            for viewer, reader, geo in [
-                (self._left_viewer, self._left_reader, self._left_orig_geo),
-                (self._right_viewer, self._right_reader, self._right_orig_geo),
-            ]:
-                if reader is None or geo is None:
-                    continue
-
+            self._crop_generation += 1
+            pool = QThreadPool.globalInstance()
+            for pane, (viewer, reader, geo) in enumerate(zip(
+                self._viewers, self._readers, self._orig_geos,
+            )):
+                # Convert geographic bounds to pixel bounds
+                shape = self._orig_shapes[pane]
+                key = (id(geo), shape, overlap)
                 try:
-                    # Convert geographic bounds to pixel bounds
-                    corners_lat = [lat_min, lat_min, lat_max, lat_max]
-                    corners_lon = [lon_min, lon_max, lon_min, lon_max]
-                    pixel_rows, pixel_cols = [], []
-                    for lat, lon in zip(corners_lat, corners_lon):
-                        result = geo.latlon_to_image(lat, lon)
-                        if isinstance(result, tuple) and len(result) >= 2:
-                            pixel_rows.append(int(result[0]))
-                            pixel_cols.append(int(result[1]))
-
-                    if len(pixel_rows) < 4:
-                        continue
-
-                    r0 = max(0, min(pixel_rows))
-                    r1 = max(pixel_rows)
-                    c0 = max(0, min(pixel_cols))
-                    c1 = max(pixel_cols)
-
-                    # Read the overlap chip
-                    chip = reader.read_chip(r0, r1, c0, c1)
-                    viewer.set_array(chip, geolocation=geo)
-                except Exception:
+                    bbox = self._crop_bbox_cache[key]
+                except KeyError:
+                    bbox = _overlap_pixel_bbox(geo, box, shape)
+                    self._crop_bbox_cache[key] = bbox
+                if bbox is None or bbox == self._last_chip_bbox[pane]:
                     continue
 
+                # Read the overlap chip off the GUI thread
+                self._last_chip_bbox[pane] = bbox
+                self._crop_pending += 1
+                pool.start(_ChipReadWorker(
+                    self._crop_generation, pane, reader, bbox,
+                    viewer.canvas.reader_mutex, self._chip_signals,
+                ))
+
+            if not self._crop_pending and not self._showing_chip():
+                _log.warning("crop_to_overlap: overlap covers no pixels")
+                self._crop_overlap = None
+                return
             self._cropped = True
             self._sync_bar.set_cropped(True)
 
+        def _on_chip_ready(self, generation: int, pane: int, chip: Any) -> None:
+            """Display a crop chip read by ``_ChipReadWorker``."""
+            if generation != self._crop_generation:
+                return
+            self._crop_pending -= 1
+            if chip is None:
+                self._last_chip_bbox[pane] = None
+                if not self._crop_pending and not self._showing_chip():
+                    # Every read failed; nothing was cropped
+                    self._crop_overlap = None
+                    self._cropped = False
+                    self._sync_bar.set_cropped(False)
+                return
+            viewer = self._viewers[pane]
+            if self._crop_viewports[pane] is None:
+                canvas = viewer.canvas
+                row, col = canvas.get_viewport_center()
+                self._crop_viewports[pane] = (row, col, canvas.get_zoom())
+
+            # The chip's pixel (0, 0) is (r0, c0) of the full image
+            r0, _, c0, _ = self._last_chip_bbox[pane]
+            shape = chip.shape if chip.ndim == 2 else chip.shape[1:3]
+            geo = _chip_geolocation(self._orig_geos[pane], r0, c0, shape)
+            # The reader stays open in _readers for reset_crop
+            viewer.set_array(chip, geolocation=geo, close_reader=False)
+            if pane == 0:
+                self._cached_left_shape = shape
+            else:
+                self._cached_right_shape = shape
+            self._sync_geolocations()
+
+        def _showing_chip(self) -> bool:
+            """Whether either pane shows a crop chip in place of its image."""
+            return any(v is not None for v in self._crop_viewports)
+
+        def _cancel_crop(self) -> None:
+            """Drop any crop chips still being read and forget crop boxes."""
+            self._crop_generation += 1
+            self._crop_pending = 0
+            self._last_chip_bbox = [None, None]
+            self._crop_overlap = None
+
         def reset_crop(self) -> None:
-            """Restore full images after crop-to-overlap."""
+            """Restore full images after crop-to-overlap.
+
+            Only panes that were actually swapped to a crop chip are
+            reopened; each is returned to the viewport it showed before
+            the crop rather than fit to the full image.
+            """
             if not self._cropped:
                 return
             _log.info("reset_crop: restoring full images")
-
-            if self._left_reader is not None:
-                self._left_viewer.open_reader(
-                    self._left_reader,
-                    geolocation=self._left_orig_geo,
-                )
-            if self._right_reader is not None:
-                self._right_viewer.open_reader(
-                    self._right_reader,
-                    geolocation=self._right_orig_geo,
-                )
+            self._invalidate_shape()
+            self._cancel_crop()
+
+            restored = False
+            for pane, (viewer, reader, geo) in enumerate(zip(
+                self._viewers, self._readers, self._orig_geos,
+            )):
+                viewport = self._crop_viewports[pane]
+                if viewport is None or reader is None:
+                    continue
+                viewer.open_reader(reader, geolocation=geo)
+                viewer.canvas.set_viewport(*viewport)
+                restored = True
+            self._crop_viewports = [None, None]
+            if restored:
+                self._sync_geolocations()
 
             self._cropped = False
             self._sync_bar.set_cropped(False)
@@ -983,25 +1920,32 @@ if _QT_AVAILABLE:
         ) -> None:
             """Forward left canvas hover to shared coordinate bar."""
             if self._active_pane == 0:
-                self._coord_bar._on_pixel_hovered(row, col, value)
+                self._coord_bar.queue_hover(row, col, value)
 
         def _on_right_pixel_hovered(
             self, row: int, col: int, value: Any,
         ) -> None:
             """Forward right canvas hover to shared coordinate bar."""
             if self._active_pane == 1:
-                self._coord_bar._on_pixel_hovered(row, col, value)
+                self._coord_bar.queue_hover(row, col, value)
 
         # --- Band info forwarding ---
 
         def _on_left_band_info(self, info: list) -> None:
-            self.pane_band_info_changed.emit(0, info)
-            if self._active_pane == 0:
-                self.band_info_changed.emit(info)
+            self._forward_band_info(0, info)
 
         def _on_right_band_info(self, info: list) -> None:
-            self.pane_band_info_changed.emit(1, info)
-            if self._active_pane == 1:
+            self._forward_band_info(1, info)
+
+        def _forward_band_info(self, pane: int, info: list) -> None:
+            """Emit ``pane_band_info_changed``, plus the legacy
+            ``band_info_changed`` for the active pane when anything is
+            still connected to it."""
+            self.pane_band_info_changed.emit(pane, info)
+            if (
+                pane == self._active_pane
+                and self.receivers(self.band_info_changed) > 0
+            ):
                 self.band_info_changed.emit(info)
 
         # --- Sync bar handlers ---
@@ -1016,18 +1960,18 @@ if _QT_AVAILABLE:
 
         def eventFilter(self, obj: QObject, event: QEvent) -> bool:
             """Track which pane the cursor is over."""
-            if event.type() == QEvent.Type.Enter:
-                if obj is self._left_viewer:
+            # Only the two viewers are filtered, and the base filter
+            # never consumes events, so skip the super() hop for them.
+            if obj is self._left_viewer:
+                if event.type() == QEvent.Type.Enter:
                     self._set_active_pane(0)
-                elif obj is self._right_viewer:
+                return False
+            if obj is self._right_viewer:
+                if event.type() == QEvent.Type.Enter:
                     self._set_active_pane(1)
+                return False
             return super().eventFilter(obj, event)
 
-        _ACTIVE_BORDER = (
-            "border: 2px solid #4A90D9; border-radius: 2px;"
-        )
-        _INACTIVE_BORDER = "border: none;"
-
         def _set_active_pane(self, pane: int) -> None:
             """Update the active pane and notify listeners."""
             if pane == self._active_pane:
@@ -1035,17 +1979,24 @@ if _QT_AVAILABLE:
             _log.debug("Active pane -> %d", pane)
             self._active_pane = pane
             # Update shared coordinate bar geolocation
-            self._coord_bar.set_geolocation(self.active_viewer.geolocation)
+            self._update_coord_geo()
             # Visual indicator: highlight active pane with a border
-            if self._mode == "dual":
-                if pane == 0:
-                    self._left_viewer.setStyleSheet(self._ACTIVE_BORDER)
-                    self._right_viewer.setStyleSheet(self._INACTIVE_BORDER)
-                else:
-                    self._left_viewer.setStyleSheet(self._INACTIVE_BORDER)
-                    self._right_viewer.setStyleSheet(self._ACTIVE_BORDER)
+            self._update_pane_borders()
             self.active_pane_changed.emit(pane)
 
+        def _update_coord_geo(self) -> None:
+            """Point the coordinate bar at the active pane's geolocation."""
+            geo = self.active_viewer.geolocation
+            if geo is not self._last_coord_geo:
+                self._coord_bar.set_geolocation(geo)
+                self._last_coord_geo = geo
+
+        def _update_pane_borders(self) -> None:
+            """Border the active pane in dual mode; none in single mode."""
+            dual = self._mode == "dual"
+            self._left_frame.set_border(dual, dual and self._active_pane == 0)
+            self._right_frame.set_border(dual, dual and self._active_pane == 1)
+
 else:
 
     class SyncController:  # type: ignore[no-redef]
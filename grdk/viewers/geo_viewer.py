@@ -27,30 +27,39 @@ Created
 
 Modified
 --------
-2026-02-18
+2026-10-16
 """
 
 # Standard library
 import contextlib
+import functools
 import logging
 import os
+import re
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
 
 _log = logging.getLogger("grdk.geo_viewer")
 
+# BIOMASS product directories carry 'BIO' in their name (any case)
+_BIO_RE = re.compile(r'BIO', re.IGNORECASE)
+
 # Third-party
 import numpy as np
 
 try:
     from PyQt6.QtWidgets import QApplication, QVBoxLayout, QWidget
-    from PyQt6.QtCore import Qt, pyqtSignal as Signal
+    from PyQt6.QtCore import (
+        QObject, QRunnable, QThreadPool, Qt, pyqtSignal as Signal,
+    )
 
     _QT_AVAILABLE = True
 except ImportError:
     _QT_AVAILABLE = False
 
-from grdk.viewers.band_info import BandInfo, get_band_info
+from grdk.viewers.band_info import (
+    BandInfo, _available_polarizations, get_band_info,
+)
 from grdk.viewers.image_canvas import DisplaySettings
 from grdk.viewers.tiled_canvas import TiledImageCanvas
 from grdk.viewers.coordinate_bar import CoordinateBar
@@ -90,15 +99,50 @@ def _find_biomass_product_dir(path: Path) -> Optional[Path]:
 
     Returns the product directory path, or None if not found.
     """
-    if (path / "annotation").is_dir():
+    if os.path.isdir(os.path.join(path, "annotation")):
         return path
-    # Check immediate subdirectories for nested structure
-    for child in path.iterdir():
-        if child.is_dir() and (child / "annotation").is_dir():
-            return child
+    # Check immediate subdirectories for nested structure; the entry
+    # type comes from the directory listing, without a stat per child
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir() and os.path.isdir(
+                os.path.join(entry.path, "annotation"),
+            ):
+                return Path(entry.path)
     return None
 
 
+def _best_sentinel2_jp2(directory: Path) -> Optional[Path]:
+    """Pick the preferred JP2 in one directory in a single listing pass.
+
+    TCI (True Color Image — pre-composed RGB) wins outright; otherwise
+    B04 (Red), then any spectral band (B01–B12, B8A), then any JP2.
+
+    Returns the JP2 file path, or None if the directory is missing or
+    holds no JP2 files.
+    """
+    b04 = band = other = None
+    try:
+        it = os.scandir(directory)
+    except OSError:
+        return None
+    with it:
+        for entry in it:
+            name = entry.name
+            if not name.endswith(".jp2"):
+                continue
+            if "_TCI_" in name:
+                return Path(entry.path)
+            if b04 is None and "_B04_" in name:
+                b04 = entry.path
+            elif band is None and "_B" in name:
+                band = entry.path
+            elif other is None:
+                other = entry.path
+    best = b04 or band or other
+    return Path(best) if best is not None else None
+
+
 def _find_sentinel2_band_file(safe_dir: Path) -> Optional[Path]:
     """Find the best JP2 band file inside a Sentinel-2 .SAFE directory.
 
@@ -107,54 +151,84 @@ def _find_sentinel2_band_file(safe_dir: Path) -> Optional[Path]:
 
     Returns the JP2 file path, or None if not found.
     """
-    # Locate IMG_DATA directory inside GRANULE
-    granule_dir = safe_dir / "GRANULE"
-    if not granule_dir.is_dir():
+    # Locate IMG_DATA directory inside GRANULE.  A missing GRANULE
+    # simply yields no match.  First match only; don't stat the rest of
+    # a large GRANULE tree
+    img_data = next((safe_dir / "GRANULE").glob("*/IMG_DATA"), None)
+    if img_data is None:
         return None
 
-    img_data_dirs = list(granule_dir.glob("*/IMG_DATA"))
-    if not img_data_dirs:
-        return None
-    img_data = img_data_dirs[0]
-
     # Search in resolution order: 10m > 20m > 60m
     for res_dir_name in ("R10m", "R20m", "R60m"):
-        res_dir = img_data / res_dir_name
-        if not res_dir.is_dir():
-            continue
-        jp2_files = list(res_dir.glob("*.jp2"))
-        if not jp2_files:
-            continue
+        band_file = _best_sentinel2_jp2(img_data / res_dir_name)
+        if band_file is not None:
+            return band_file
+
+    # Fallback: any JP2 under IMG_DATA (flat structure)
+    return _best_sentinel2_jp2(img_data)
 
-        # Prefer TCI (True Color Image — pre-composed RGB)
-        for f in jp2_files:
-            if "_TCI_" in f.name:
-                return f
 
-        # Prefer B04 (Red band)
-        for f in jp2_files:
-            if "_B04_" in f.name:
-                return f
+# File-based grdl openers tried by open_any, in priority order:
+# (label for error messages, grdl.IO function name, may read NITF).
+# SAR goes first so NITF files containing SICD complex data are handled
+# correctly.  Openers that may read NITF run with C-level stderr
+# silenced, as GDAL prints TXTFMT warnings for many NITF headers.
+_OPENER_NAMES: Tuple[Tuple[str, str, bool], ...] = (
+    ("SAR", "open_sar", True),                # SICD, CPHD, Sentinel-1, ...
+    ("Image", "open_reader", True),           # GeoTIFF, NITF, HDF5, JP2
+    ("EO", "open_eo", False),                 # Sentinel-2, etc.
+    ("IR", "open_ir", False),
+    ("MSI", "open_multispectral", False),
+)
 
-        # Prefer any spectral band (B01–B12, B8A)
-        for f in jp2_files:
-            if "_B" in f.name:
-                return f
 
-        # Any JP2 in this resolution tier
-        return jp2_files[0]
+@functools.lru_cache(maxsize=1)
+def _openers() -> Tuple[
+    Tuple[str, str, bool, Union[Callable[[Any], Any], str]], ...
+]:
+    """Resolve the ``_OPENER_NAMES`` callables from ``grdl.IO`` once.
+
+    Returns
+    -------
+    Tuple[Tuple[str, str, bool, Callable or str], ...]
+        ``(label, name, nitf, opener)`` in priority order.  Openers that
+        could not be imported carry the import error message instead of
+        a callable, so ``open_any`` can still report them.
+    """
+    try:
+        import grdl.IO as grdl_io
+    except ImportError as e:
+        return tuple(
+            (label, name, nitf, str(e)) for label, name, nitf in _OPENER_NAMES
+        )
+    return tuple(
+        (label, name, nitf, getattr(grdl_io, name, f"grdl.IO has no {name}"))
+        for label, name, nitf in _OPENER_NAMES
+    )
 
-    # Fallback: any JP2 under IMG_DATA (flat structure)
-    jp2_files = list(img_data.glob("*.jp2"))
-    if jp2_files:
-        for f in jp2_files:
-            if "_TCI_" in f.name:
-                return f
-        for f in jp2_files:
-            if "_B04_" in f.name:
-                return f
-        return jp2_files[0]
 
+def _first_reader(
+    path: Path,
+    openers: Any,
+    errors: list,
+) -> Optional[Any]:
+    """Return the first reader any of ``openers`` opens, else None.
+
+    Each failure is appended to ``errors`` as ``"label: message"``.
+    """
+    for label, name, _, opener in openers:
+        if isinstance(opener, str):
+            errors.append(f"{label}: {opener}")
+            continue
+        try:
+            reader = opener(path)
+            _log.info(
+                "open_any: opened via %s → %s", name, type(reader).__name__,
+            )
+            return reader
+        except (ValueError, ImportError, OSError, RuntimeError) as e:
+            _log.debug("open_any: %s failed: %s", name, e)
+            errors.append(f"{label}: {e}")
     return None
 
 
@@ -185,83 +259,39 @@ def open_any(filepath: Union[str, Path]) -> Any:
     errors = []
     _log.info("open_any: trying %s", filepath)
 
-    # Suppress C-level GDAL warnings (e.g. "TXTFMT: Invalid field value")
-    # that are emitted to stderr when reading NITF/SICD files.
+    # 0. Directory-based formats
+    if os.path.isdir(path):
+        # BIOMASS — directory name contains 'BIO' and product type
+        if _BIO_RE.search(path.name):
+            product_dir = _find_biomass_product_dir(path)
+            if product_dir is not None:
+                try:
+                    from grdl.IO import open_biomass
+                    return open_biomass(product_dir)
+                except (ValueError, ImportError, OSError, RuntimeError) as e:
+                    errors.append(f"BIOMASS: {e}")
+
+        # Sentinel-2 .SAFE directory
+        if path.suffix.lower() == '.safe':
+            band_file = _find_sentinel2_band_file(path)
+            if band_file is not None:
+                try:
+                    from grdl.IO.eo.sentinel2 import Sentinel2Reader
+                    return Sentinel2Reader(band_file)
+                except (ValueError, ImportError, OSError, RuntimeError) as e:
+                    errors.append(f"Sentinel-2 SAFE: {e}")
+
+    # 1-5. File openers: SAR, generic, EO, IR, multispectral.  Suppress
+    # C-level GDAL warnings (e.g. "TXTFMT: Invalid field value") only
+    # around the openers that may read NITF/SICD files; the NITF
+    # openers lead _OPENER_NAMES, so priority order is kept.
+    openers = _openers()
     with _suppress_stderr():
-        # 0. Directory-based formats
-        if path.is_dir():
-            # BIOMASS — directory name contains 'BIO' and product type
-            if 'BIO' in path.name.upper():
-                product_dir = _find_biomass_product_dir(path)
-                if product_dir is not None:
-                    try:
-                        from grdl.IO import open_biomass
-                        return open_biomass(product_dir)
-                    except (ValueError, ImportError, Exception) as e:
-                        errors.append(f"BIOMASS: {e}")
-
-            # Sentinel-2 .SAFE directory
-            if path.name.upper().endswith('.SAFE'):
-                band_file = _find_sentinel2_band_file(path)
-                if band_file is not None:
-                    try:
-                        from grdl.IO.eo.sentinel2 import Sentinel2Reader
-                        return Sentinel2Reader(band_file)
-                    except (ValueError, ImportError, Exception) as e:
-                        errors.append(f"Sentinel-2 SAFE: {e}")
-
-        # 1. SAR first — NITF files may be SICD (complex SAR), not generic NITF
-        try:
-            from grdl.IO import open_sar
-            reader = open_sar(path)
-            _log.info("open_any: opened via open_sar → %s", type(reader).__name__)
-            return reader
-        except (ValueError, ImportError, Exception) as e:
-            _log.debug("open_any: open_sar failed: %s", e)
-            errors.append(f"SAR: {e}")
-
-        # 2. Generic formats (GeoTIFF, NITF, HDF5, JP2)
-        try:
-            from grdl.IO import open_reader
-            reader = open_reader(path)
-            _log.info("open_any: opened via open_reader → %s", type(reader).__name__)
-            return reader
-        except (ValueError, ImportError, Exception) as e:
-            _log.debug("open_any: open_reader failed: %s", e)
-            errors.append(f"Image: {e}")
-
-        # 3. EO-specific (Sentinel-2, etc.)
-        try:
-            from grdl.IO import open_eo
-            reader = open_eo(path)
-            _log.info("open_any: opened via open_eo → %s", type(reader).__name__)
-            return reader
-        except (ValueError, ImportError, Exception) as e:
-            _log.debug("open_any: open_eo failed: %s", e)
-            errors.append(f"EO: {e}")
-
-        # 4. IR
-        try:
-            from grdl.IO import open_ir
-            reader = open_ir(path)
-            _log.info("open_any: opened via open_ir → %s", type(reader).__name__)
-            return reader
-        except (ValueError, ImportError, Exception) as e:
-            _log.debug("open_any: open_ir failed: %s", e)
-            errors.append(f"IR: {e}")
-
-        # 5. Multispectral
-        try:
-            from grdl.IO import open_multispectral
-            reader = open_multispectral(path)
-            _log.info(
-                "open_any: opened via open_multispectral → %s",
-                type(reader).__name__,
-            )
-            return reader
-        except (ValueError, ImportError, Exception) as e:
-            _log.debug("open_any: open_multispectral failed: %s", e)
-            errors.append(f"MSI: {e}")
+        reader = _first_reader(path, (o for o in openers if o[2]), errors)
+    if reader is None:
+        reader = _first_reader(path, (o for o in openers if not o[2]), errors)
+    if reader is not None:
+        return reader
 
     _log.error("open_any: all openers failed for %s", filepath)
     raise ValueError(
@@ -295,7 +325,8 @@ def _make_biomass_geo(reader: Any) -> Optional[Any]:
 # ---------------------------------------------------------------------------
 # Geolocation registry: (reader_module, reader_class, factory_callable)
 #
-# Entries are tried in order.  The first isinstance match wins.
+# Resolved once into a class -> factory table (see _geo_dispatch); a
+# reader is matched by walking its MRO, most-derived class first.
 # Modules that are not installed are silently skipped (ImportError).
 # ---------------------------------------------------------------------------
 
@@ -311,6 +342,66 @@ _GEO_REGISTRY: list = [
 ]
 
 
+# Reader classes whose imagery gets SAR display defaults in
+# GeoImageViewer._apply_auto_settings: (reader_module, reader_class).
+_SAR_READER_TYPES: Tuple[Tuple[str, str], ...] = (
+    ('grdl.IO.sar.sicd',          'SICDReader'),
+    ('grdl.IO.sar.biomass',       'BIOMASSL1Reader'),
+    ('grdl.IO.sar.sentinel1_slc', 'Sentinel1SLCReader'),
+    ('grdl.IO.sar.sidd',          'SIDDReader'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _sar_reader_classes() -> Tuple[type, ...]:
+    """Import the ``_SAR_READER_TYPES`` classes once.
+
+    Returns
+    -------
+    Tuple[type, ...]
+        The importable classes, for a single ``isinstance`` check.
+        Modules that are not installed are skipped.
+    """
+    import importlib
+
+    classes = []
+    for reader_module, reader_class in _SAR_READER_TYPES:
+        try:
+            mod = importlib.import_module(reader_module)
+            classes.append(getattr(mod, reader_class))
+        except (ImportError, AttributeError):
+            continue
+    return tuple(classes)
+
+
+class _ReaderSnapshot(NamedTuple):
+    """Reader accessors read once when a reader is opened.
+
+    Attributes
+    ----------
+    shape : Tuple[int, ...]
+        ``reader.get_shape()``.
+    dtype : Any
+        ``reader.get_dtype()``, or None if the reader has no such method.
+    metadata : Any
+        ``reader.metadata``, or None.
+    """
+
+    shape: Tuple[int, ...]
+    dtype: Any
+    metadata: Any
+
+
+def _reader_snapshot(reader: Any) -> _ReaderSnapshot:
+    """Read shape, dtype and metadata from ``reader`` once."""
+    get_dtype = getattr(reader, 'get_dtype', None)
+    return _ReaderSnapshot(
+        shape=reader.get_shape(),
+        dtype=get_dtype() if get_dtype is not None else None,
+        metadata=getattr(reader, 'metadata', None),
+    )
+
+
 def _load_geo(geo_module: str, geo_class: str, reader: Any) -> Any:
     """Import *geo_class* from *geo_module* and call ``.from_reader(reader)``."""
     import importlib
@@ -319,12 +410,36 @@ def _load_geo(geo_module: str, geo_class: str, reader: Any) -> Any:
     return cls.from_reader(reader)
 
 
+@functools.lru_cache(maxsize=1)
+def _geo_dispatch() -> Dict[type, Tuple[str, Callable[[Any], Any]]]:
+    """Import the :data:`_GEO_REGISTRY` reader classes once.
+
+    Returns
+    -------
+    Dict[type, Tuple[str, Callable]]
+        Reader class -> (``"module.Class"`` label, factory).  The first
+        registry entry wins for a class listed twice.
+    """
+    import importlib
+
+    dispatch: Dict[type, Tuple[str, Callable[[Any], Any]]] = {}
+    for reader_module, reader_class, factory in _GEO_REGISTRY:
+        try:
+            mod = importlib.import_module(reader_module)
+            cls = getattr(mod, reader_class)
+        except (ImportError, AttributeError):
+            continue
+        dispatch.setdefault(cls, (f"{reader_module}.{reader_class}", factory))
+    return dispatch
+
+
 def create_geolocation(reader: Any) -> Optional[Any]:
     """Create the appropriate Geolocation from a reader type.
 
-    Consults :data:`_GEO_REGISTRY` in declaration order.  Returns the
-    first successful result, or ``None`` when no entry matches (the
-    viewer will operate in pixel-only mode).
+    Looks up each class in the reader's MRO in the :data:`_GEO_REGISTRY`
+    dispatch table, most-derived first.  Returns the first successful
+    factory result, or ``None`` when no entry matches (the viewer will
+    operate in pixel-only mode).
 
     Parameters
     ----------
@@ -336,32 +451,25 @@ def create_geolocation(reader: Any) -> Optional[Any]:
     Optional[Geolocation]
         Geolocation instance, or None.
     """
-    import importlib
-
     _log.debug("create_geolocation: reader type = %s", type(reader).__name__)
 
-    for reader_module, reader_class, factory in _GEO_REGISTRY:
-        try:
-            mod = importlib.import_module(reader_module)
-            cls = getattr(mod, reader_class)
-        except (ImportError, AttributeError):
-            continue
-
-        if not isinstance(reader, cls):
+    dispatch = _geo_dispatch()
+    for cls in type(reader).__mro__:
+        entry = dispatch.get(cls)
+        if entry is None:
             continue
+        label, factory = entry
 
         try:
             geo = factory(reader)
             if geo is not None:
                 _log.info(
-                    "create_geolocation: %s via %s.%s",
-                    type(geo).__name__, reader_module, reader_class,
+                    "create_geolocation: %s via %s", type(geo).__name__, label,
                 )
                 return geo
         except Exception as e:
             _log.warning(
-                "create_geolocation: factory failed for %s.%s: %s",
-                reader_module, reader_class, e,
+                "create_geolocation: factory failed for %s: %s", label, e,
             )
 
     _log.info(
@@ -375,8 +483,78 @@ def create_geolocation(reader: Any) -> Optional[Any]:
 # GeoImageViewer widget
 # ---------------------------------------------------------------------------
 
+# Export format by file extension; others are left to Qt to detect
+_EXPORT_FORMATS: Dict[str, str] = {
+    '.png': 'PNG',
+    '.jpg': 'JPEG',
+    '.jpeg': 'JPEG',
+    '.bmp': 'BMP',
+    '.tif': 'TIFF',
+    '.tiff': 'TIFF',
+    '.webp': 'WEBP',
+}
+
+# PNG "quality" selects the deflate level (100 = uncompressed).  80 maps
+# to zlib level 1: ~5x faster than Qt's default on screen grabs for
+# files ~10% larger.
+_PNG_EXPORT_QUALITY = 80
+
+
+def _save_image(image: Any, filepath: str) -> str:
+    """Save a QPixmap or QImage, choosing the format from the extension.
+
+    Returns
+    -------
+    str
+        Empty on success, otherwise the failure message.
+    """
+    # Determine format from extension for reliable saving
+    fmt = _EXPORT_FORMATS.get(Path(filepath).suffix.lower())
+
+    if fmt == 'PNG':
+        ok = image.save(filepath, fmt, _PNG_EXPORT_QUALITY)
+    elif fmt:
+        ok = image.save(filepath, fmt)
+    else:
+        ok = image.save(filepath)
+
+    if not ok:
+        return f"Failed to save image (format={fmt or 'auto'})."
+    return ""
+
+
 if _QT_AVAILABLE:
 
+    class _ExportSignals(QObject):
+        """Signal proxy for ``_ExportWorker`` (QRunnable cannot emit)."""
+
+        # (filepath, error message or "" on success)
+        finished = Signal(str, str)
+
+    class _ExportWorker(QRunnable):
+        """Encode and write an exported view in a thread pool.
+
+        Holds a ``QImage`` rather than a ``QPixmap``: pixmaps may only
+        be used on the GUI thread.
+        """
+
+        def __init__(
+            self, image: Any, filepath: str, proxy: _ExportSignals,
+        ) -> None:
+            super().__init__()
+            self.image = image
+            self.filepath = filepath
+            self.proxy = proxy
+            self.setAutoDelete(True)
+
+        def run(self) -> None:
+            """Save the image in a worker thread."""
+            error = _save_image(self.image, self.filepath)
+            try:
+                self.proxy.finished.emit(self.filepath, error)
+            except RuntimeError:
+                pass  # Viewer deleted before the export finished
+
     class GeoImageViewer(QWidget):
         """Single-pane geospatial image viewer.
 
@@ -395,9 +573,14 @@ if _QT_AVAILABLE:
         band_info_changed(list)
             Emitted when band info changes (e.g., after opening a file).
             Payload is a ``List[BandInfo]``.
+        export_finished(str, str)
+            Emitted when a background ``export_view`` completes.
+            Payload is ``(filepath, error)``; ``error`` is empty on
+            success.
         """
 
         band_info_changed = Signal(list)
+        export_finished = Signal(str, str)
 
         def __init__(self, parent: Optional[Any] = None) -> None:
             super().__init__(parent)
@@ -411,22 +594,21 @@ if _QT_AVAILABLE:
             self._canvas = TiledImageCanvas(self)
             self._coord_bar = CoordinateBar(self)
             self._coord_bar.connect_canvas(self._canvas)
-            self._colorbar = ColorBarWidget(self)
 
-            # Update colorbar when display settings change
-            self._canvas.display_settings_changed.connect(
-                self._colorbar.update_from_settings,
-            )
+            # Built on first use (see _ensure_colorbar and
+            # _ensure_vector_overlay); many viewers never need them
+            self._colorbar: Optional[ColorBarWidget] = None
+            self._vector_overlay: Optional[VectorOverlayLayer] = None
 
-            # Vector overlay (operates on canvas scene)
-            self._vector_overlay = VectorOverlayLayer(self._canvas._scene)
+            # Background exports report back through this proxy
+            self._export_signals = _ExportSignals(self)
+            self._export_signals.finished.connect(self.export_finished)
 
             # Layout
             layout = QVBoxLayout(self)
             layout.setContentsMargins(0, 0, 0, 0)
             layout.setSpacing(0)
             layout.addWidget(self._canvas, 1)
-            layout.addWidget(self._colorbar, 0)
             layout.addWidget(self._coord_bar, 0)
 
         # --- Public properties ---
@@ -467,12 +649,44 @@ if _QT_AVAILABLE:
 
         @property
         def colorbar(self) -> ColorBarWidget:
-            """The colorbar widget."""
-            return self._colorbar
+            """The colorbar widget (created on first access)."""
+            return self._ensure_colorbar()
 
         @property
         def vector_overlay(self) -> VectorOverlayLayer:
-            """The vector overlay layer."""
+            """The vector overlay layer (created on first access)."""
+            return self._ensure_vector_overlay()
+
+        def set_colorbar_visible(self, visible: bool) -> None:
+            """Show or hide the colorbar, creating it only to show it.
+
+            Parameters
+            ----------
+            visible : bool
+                Whether the colorbar is shown below the canvas.
+            """
+            if not visible and self._colorbar is None:
+                return
+            self._ensure_colorbar().setVisible(visible)
+
+        def _ensure_colorbar(self) -> ColorBarWidget:
+            """Create the colorbar between canvas and coordinate bar."""
+            if self._colorbar is None:
+                bar = ColorBarWidget(self)
+                bar.update_from_settings(self._canvas.display_settings)
+                # Update colorbar when display settings change
+                self._canvas.display_settings_changed.connect(
+                    bar.update_from_settings,
+                )
+                self.layout().insertWidget(1, bar, 0)
+                self._colorbar = bar
+            return self._colorbar
+
+        def _ensure_vector_overlay(self) -> VectorOverlayLayer:
+            """Create the vector overlay on the canvas scene."""
+            if self._vector_overlay is None:
+                self._vector_overlay = VectorOverlayLayer(self._canvas._scene)
+                self._vector_overlay.set_geolocation(self._geolocation)
             return self._vector_overlay
 
         # --- Loading ---
@@ -529,24 +743,24 @@ if _QT_AVAILABLE:
 
                 self._reader = reader
                 self._geolocation = geolocation
-                self._metadata = getattr(reader, 'metadata', None)
+                snapshot = _reader_snapshot(reader)
+                self._metadata = snapshot.metadata
 
-                shape = reader.get_shape()
-                dtype = getattr(reader, 'get_dtype', lambda: 'unknown')()
                 _log.info(
                     "open_reader: %s, shape=%s, dtype=%s, geo=%s",
-                    type(reader).__name__, shape, dtype,
+                    type(reader).__name__, snapshot.shape, snapshot.dtype,
                     type(geolocation).__name__ if geolocation else "None",
                 )
 
                 # Auto-detect SICD and apply 2-98% contrast stretch
-                self._apply_auto_settings(reader)
+                self._apply_auto_settings(reader, snapshot)
 
                 # Update coordinate bar
                 self._coord_bar.set_geolocation(geolocation)
 
                 # Update vector overlay geolocation
-                self._vector_overlay.set_geolocation(geolocation)
+                if self._vector_overlay is not None:
+                    self._vector_overlay.set_geolocation(geolocation)
 
                 # Clear any existing polygons from previous image
                 self._canvas.clear_all_polygons()
@@ -571,6 +785,7 @@ if _QT_AVAILABLE:
             self,
             arr: np.ndarray,
             geolocation: Optional[Any] = None,
+            close_reader: bool = True,
         ) -> None:
             """Display a pre-loaded numpy array.
 
@@ -580,18 +795,24 @@ if _QT_AVAILABLE:
                 Image data (2D, 3D, or complex).
             geolocation : Geolocation, optional
                 Geolocation model for coordinate display.
+            close_reader : bool
+                Close the current reader.  Pass False when the caller
+                keeps the reader to reopen later; the viewer drops its
+                reference either way.
             """
             if self._reader is not None:
-                try:
-                    self._reader.close()
-                except Exception:
-                    pass
+                if close_reader:
+                    try:
+                        self._reader.close()
+                    except Exception:
+                        pass
                 self._reader = None
 
             self._geolocation = geolocation
             self._metadata = None
             self._coord_bar.set_geolocation(geolocation)
-            self._vector_overlay.set_geolocation(geolocation)
+            if self._vector_overlay is not None:
+                self._vector_overlay.set_geolocation(geolocation)
 
             # Clear any existing polygons from previous image
             self._canvas.clear_all_polygons()
@@ -614,7 +835,11 @@ if _QT_AVAILABLE:
 
         # --- Auto settings ---
 
-        def _apply_auto_settings(self, reader: Any) -> None:
+        def _apply_auto_settings(
+            self,
+            reader: Any,
+            snapshot: Optional[_ReaderSnapshot] = None,
+        ) -> None:
             """Apply sensible default display settings based on reader type.
 
             For SAR/complex data:
@@ -623,44 +848,22 @@ if _QT_AVAILABLE:
               display.  Without this, multi-band SAR data is incorrectly
               displayed as false-color RGB, which disables remap functions
               and colormap application.
+
+            ``snapshot`` carries the shape, dtype and metadata already
+            read by ``open_reader``; it is taken from ``reader`` if omitted.
             """
             from dataclasses import replace
 
-            is_sar = False
-            try:
-                from grdl.IO.sar.sicd import SICDReader
-                if isinstance(reader, SICDReader):
-                    is_sar = True
-            except ImportError:
-                pass
-            if not is_sar:
-                try:
-                    from grdl.IO.sar.biomass import BIOMASSL1Reader
-                    if isinstance(reader, BIOMASSL1Reader):
-                        is_sar = True
-                except ImportError:
-                    pass
-            if not is_sar:
-                try:
-                    from grdl.IO.sar.sentinel1_slc import Sentinel1SLCReader
-                    if isinstance(reader, Sentinel1SLCReader):
-                        is_sar = True
-                except ImportError:
-                    pass
-            if not is_sar:
-                try:
-                    from grdl.IO.sar.sidd import SIDDReader
-                    if isinstance(reader, SIDDReader):
-                        is_sar = True
-                except ImportError:
-                    pass
-            if not is_sar:
+            if snapshot is None:
+                snapshot = _reader_snapshot(reader)
+
+            # Known SAR reader types, else any complex-valued data
+            is_sar = isinstance(reader, _sar_reader_classes())
+            if not is_sar and snapshot.dtype is not None:
                 try:
-                    dtype = reader.get_dtype()
-                    if np.issubdtype(dtype, np.complexfloating):
-                        is_sar = True
-                except Exception:
-                    pass
+                    is_sar = np.issubdtype(snapshot.dtype, np.complexfloating)
+                except TypeError:
+                    pass  # dtype that numpy does not understand
 
             if not is_sar:
                 _log.debug("_apply_auto_settings: not SAR, skipping")
@@ -681,7 +884,7 @@ if _QT_AVAILABLE:
             # RGB channels — displaying them as RGB disables remap and
             # colormap, and produces misleading colors.
             try:
-                shape = reader.get_shape()
+                shape = snapshot.shape
                 if len(shape) >= 3 and shape[2] > 1:
                     # get_shape returns (rows, cols, bands)
                     settings = replace(settings, band_index=0)
@@ -697,37 +900,35 @@ if _QT_AVAILABLE:
             # only loads one polarization, but band_info lists all
             # available pols.  Set band_index to the loaded pol's
             # position so the combo shows the correct selection.
-            try:
-                all_pols = reader.get_available_polarizations()
-                if len(all_pols) > 1:
-                    current_pol = None
-                    # TerraSAR-X
-                    current_pol = getattr(
-                        reader, '_requested_polarization', None,
+            # Single-pol readers (SICD, ...) answer [] without raising.
+            all_pols = _available_polarizations(reader)
+            if len(all_pols) > 1:
+                # TerraSAR-X
+                current_pol = getattr(
+                    reader, '_requested_polarization', None,
+                )
+                meta = snapshot.metadata
+                if current_pol is None and meta is not None:
+                    # Sentinel-1
+                    get = getattr(meta, 'get', None)
+                    si = (
+                        get('swath_info') if get is not None
+                        else getattr(meta, 'swath_info', None)
+                    )
+                    if si:
+                        current_pol = getattr(si, 'polarization', None)
+                # One scan for membership and position
+                try:
+                    pol_index = all_pols.index(current_pol)
+                except ValueError:
+                    pol_index = None
+                if current_pol and pol_index is not None:
+                    settings = replace(settings, band_index=pol_index)
+                    _log.info(
+                        "_apply_auto_settings: multi-pol SAR, "
+                        "selected %s at index %d",
+                        current_pol, pol_index,
                     )
-                    if current_pol is None:
-                        # Sentinel-1
-                        meta = getattr(reader, 'metadata', None)
-                        if meta is not None:
-                            si = (
-                                meta.get('swath_info')
-                                if hasattr(meta, 'get')
-                                else getattr(meta, 'swath_info', None)
-                            )
-                            if si:
-                                current_pol = getattr(
-                                    si, 'polarization', None,
-                                )
-                    if current_pol and current_pol in all_pols:
-                        pol_index = all_pols.index(current_pol)
-                        settings = replace(settings, band_index=pol_index)
-                        _log.info(
-                            "_apply_auto_settings: multi-pol SAR, "
-                            "selected %s at index %d",
-                            current_pol, pol_index,
-                        )
-            except (AttributeError, Exception):
-                pass
 
             _log.debug("_apply_auto_settings: settings = %s", settings)
 
@@ -749,15 +950,16 @@ if _QT_AVAILABLE:
             filepath : str
                 Path to a GeoJSON file.
             """
-            self._vector_overlay.load_geojson(filepath)
+            self._ensure_vector_overlay().load_geojson(filepath)
 
         def clear_vectors(self) -> None:
             """Remove all vector overlay features."""
-            self._vector_overlay.clear()
+            if self._vector_overlay is not None:
+                self._vector_overlay.clear()
 
         # --- Export ---
 
-        def export_view(self, filepath: str) -> None:
+        def export_view(self, filepath: str, background: bool = False) -> None:
             """Save the current viewport as an image file.
 
             Parameters
@@ -765,35 +967,27 @@ if _QT_AVAILABLE:
             filepath : str
                 Output path.  Format determined by extension
                 (e.g., .png, .jpg, .bmp).
+            background : bool
+                If True, only grab the view here and encode/write it on
+                ``QThreadPool.globalInstance()``; the result is reported
+                by ``export_finished`` instead of raising.
 
             Raises
             ------
             RuntimeError
-                If the save operation fails.
+                If the save operation fails (foreground only).
             """
-            import os
-
             pixmap = self._canvas.grab()
 
-            # Determine format from extension for reliable saving
-            ext = os.path.splitext(filepath)[1].lower()
-            fmt_map = {
-                '.png': 'PNG',
-                '.jpg': 'JPEG',
-                '.jpeg': 'JPEG',
-                '.bmp': 'BMP',
-            }
-            fmt = fmt_map.get(ext)
-
-            if fmt:
-                ok = pixmap.save(filepath, fmt)
-            else:
-                ok = pixmap.save(filepath)
+            if background:
+                QThreadPool.globalInstance().start(_ExportWorker(
+                    pixmap.toImage(), filepath, self._export_signals,
+                ))
+                return
 
-            if not ok:
-                raise RuntimeError(
-                    f"Failed to save image (format={fmt or 'auto'})."
-                )
+            error = _save_image(pixmap, filepath)
+            if error:
+                raise RuntimeError(error)
 
 else:
 
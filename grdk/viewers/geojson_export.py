@@ -26,7 +26,7 @@ Created
 
 Modified
 --------
-2026-06-23
+2026-10-16
 """
 
 # Standard library
@@ -39,6 +39,9 @@ from typing import Any, Dict, List, Optional
 # Third-party
 import numpy as np
 
+# GRDK internal
+from grdk.viewers.geolocation_lock import geolocation_lock
+
 _log = logging.getLogger("grdk.geojson_export")
 
 
@@ -268,7 +271,8 @@ def _vertices_to_geographic(vertices: np.ndarray, geolocation: Any) -> List[List
     geo_coords = []
 
     for row, col in vertices:
-        result = geolocation.image_to_latlon(float(row), float(col))
+        with geolocation_lock(geolocation):
+            result = geolocation.image_to_latlon(float(row), float(col))
         
         # Handle both tuple and numpy array returns, with 2 or 3 elements (lat, lon, [height])
         if isinstance(result, (tuple, list, np.ndarray)):
@@ -26,7 +26,7 @@ Created
 
 Modified
 --------
-2026-06-23
+2026-10-16
 """
 
 # Standard library
@@ -38,6 +38,9 @@ from typing import Any, Dict, List, Optional, Tuple
 # Third-party
 import numpy as np
 
+# GRDK internal
+from grdk.viewers.geolocation_lock import geolocation_lock
+
 _log = logging.getLogger(__name__)
 
 
@@ -226,7 +229,8 @@ def _get_image_geographic_bounds(
     
     for row, col in corners:
         try:
-            result = geolocation.image_to_latlon(float(row), float(col))
+            with geolocation_lock(geolocation):
+                result = geolocation.image_to_latlon(float(row), float(col))
             if isinstance(result, (tuple, list, np.ndarray)):
                 lat, lon = result[0], result[1]
                 lats.append(lat)
@@ -350,7 +354,8 @@ def _convert_geographic_to_pixels(
     
     for lon, lat in geo_coords:
         try:
-            result = geolocation.latlon_to_image(lat, lon)
+            with geolocation_lock(geolocation):
+                result = geolocation.latlon_to_image(lat, lon)
             if isinstance(result, (tuple, list, np.ndarray)) and len(result) >= 2:
                 row, col = result[0], result[1]
                 pixel_coords.append((row, col))
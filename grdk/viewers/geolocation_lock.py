@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""
+Geolocation Lock - Serialize calls into a shared geolocation model.
+
+grdl geolocation models wrap pyproj Transformers, GDAL handles and DEM
+backends that are not thread-safe.  The viewers call a model from the
+GUI thread (hover lookups, vector overlays, sync) and from thread-pool
+workers (``SyncController`` corner projection), so every call into a
+model is made while holding the lock returned by
+``geolocation_lock()``, as tile reads hold the tile cache's
+``reader_mutex``.
+
+Dependencies
+------------
+None
+
+Author
+------
+Claude Code (Anthropic)
+
+License
+-------
+MIT License
+Copyright (c) 2024 geoint.org
+See LICENSE file for full text.
+
+Created
+-------
+2026-10-16
+
+Modified
+--------
+2026-10-16
+"""
+
+import threading
+import weakref
+from typing import Any
+
+# One lock per model, keyed weakly so entries vanish with the model.
+_LOCKS: "weakref.WeakKeyDictionary[Any, threading.RLock]" = (
+    weakref.WeakKeyDictionary()
+)
+# Guards _LOCKS itself; also the lock for models that cannot be weakly
+# referenced, which then share it.
+_REGISTRY_LOCK = threading.RLock()
+
+
+def geolocation_lock(geolocation: Any) -> threading.RLock:
+    """Return the lock that serializes calls into ``geolocation``.
+
+    Parameters
+    ----------
+    geolocation : Geolocation
+        Any geolocation model.
+
+    Returns
+    -------
+    threading.RLock
+        The same lock for every call with the same model (or a chip
+        adapter registered with ``share_geolocation_lock``).  The lock
+        is re-entrant, so helpers that lock may call one another.
+    """
+    with _REGISTRY_LOCK:
+        try:
+            lock = _LOCKS.get(geolocation)
+            if lock is None:
+                lock = _LOCKS[geolocation] = threading.RLock()
+        except TypeError:
+            # Not weakly referenceable (or unhashable)
+            return _REGISTRY_LOCK
+        return lock
+
+
+def share_geolocation_lock(adapter: Any, geolocation: Any) -> None:
+    """Make ``adapter`` use the lock of the model it delegates to.
+
+    Parameters
+    ----------
+    adapter : Geolocation
+        Wrapper (e.g. a chip geolocation) whose calls reach
+        ``geolocation``.
+    geolocation : Geolocation
+        The wrapped model.
+    """
+    lock = geolocation_lock(geolocation)
+    with _REGISTRY_LOCK:
+        try:
+            _LOCKS[adapter] = lock
+        except TypeError:
+            pass
@@ -10,6 +10,7 @@ image display components.
 Dependencies
 ------------
 PyQt6
+numba (optional, fused display kernel)
 
 Author
 ------
@@ -31,23 +32,31 @@ Created
 
 Modified
 --------
-2026-02-06
+2026-10-16
 """
 
 # Standard library
+import functools
 import logging
 from dataclasses import dataclass, field, replace
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Tuple
 
 _log = logging.getLogger("grdk.image_canvas")
 
 # Third-party
 import numpy as np
 
+try:
+    from numba import njit, prange
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
 try:
     from PyQt6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QRubberBand
     from PyQt6.QtGui import QImage, QPixmap, QPainter, QCursor
-    from PyQt6.QtCore import QPoint, QRect, QSize, Qt, pyqtSignal as Signal
+    from PyQt6.QtCore import QPoint, QRect, QSize, Qt, QTimer, pyqtSignal as Signal
 
     _QT_AVAILABLE = True
 except ImportError:
@@ -67,77 +76,98 @@ if _QT_AVAILABLE:
 # Colormap LUTs (256 × 3 uint8, sampled from matplotlib published tables)
 # ---------------------------------------------------------------------------
 
-def _make_viridis_lut() -> np.ndarray:
-    """Generate viridis colormap LUT (256 entries)."""
-    # Key control points sampled from matplotlib viridis
-    points = np.array([
-        [68, 1, 84], [72, 35, 116], [64, 67, 135], [52, 94, 141],
-        [41, 120, 142], [32, 144, 140], [34, 167, 132], [68, 190, 112],
-        [121, 209, 81], [189, 222, 38], [253, 231, 37],
-    ], dtype=np.float64)
-    indices = np.linspace(0, len(points) - 1, 256)
-    lut = np.zeros((256, 3), dtype=np.uint8)
-    for c in range(3):
-        lut[:, c] = np.interp(indices, np.arange(len(points)), points[:, c])
-    return lut
-
-
-def _make_inferno_lut() -> np.ndarray:
-    """Generate inferno colormap LUT (256 entries)."""
-    points = np.array([
-        [0, 0, 4], [22, 11, 57], [66, 10, 104], [106, 23, 110],
-        [147, 38, 103], [186, 54, 85], [221, 81, 58], [243, 118, 27],
-        [249, 166, 10], [240, 215, 66], [252, 255, 164],
-    ], dtype=np.float64)
-    indices = np.linspace(0, len(points) - 1, 256)
-    lut = np.zeros((256, 3), dtype=np.uint8)
-    for c in range(3):
-        lut[:, c] = np.interp(indices, np.arange(len(points)), points[:, c])
-    return lut
-
-
-def _make_plasma_lut() -> np.ndarray:
-    """Generate plasma colormap LUT (256 entries)."""
-    points = np.array([
-        [13, 8, 135], [75, 3, 161], [126, 3, 168], [168, 34, 150],
-        [199, 63, 125], [224, 100, 97], [241, 140, 73], [248, 181, 48],
-        [241, 222, 36], [240, 249, 33],
-    ], dtype=np.float64)
+def _interp_axis0(
+    x: np.ndarray,
+    xp: np.ndarray,
+    fp: np.ndarray,
+) -> np.ndarray:
+    """``np.interp`` applied to every column of *fp* in one pass.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        (M,) sample positions within ``[xp[0], xp[-1]]``.
+    xp : np.ndarray
+        (N,) increasing knot positions, N >= 2.
+    fp : np.ndarray
+        (N, K) knot values.
+
+    Returns
+    -------
+    np.ndarray
+        (M, K) float64 interpolated values, matching ``np.interp``
+        column by column.
+    """
+    seg = np.clip(np.searchsorted(xp, x, side='right') - 1, 0, len(xp) - 2)
+    slope = (fp[seg + 1] - fp[seg]) / (xp[seg + 1] - xp[seg])[:, None]
+    return slope * (x - xp[seg])[:, None] + fp[seg]
+
+
+def _lut_from_points(points: np.ndarray) -> np.ndarray:
+    """Linearly interpolate colormap control points into a 256-entry LUT.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        (N, 3) RGB control points, evenly spaced along the colormap.
+
+    Returns
+    -------
+    np.ndarray
+        (256, 3) uint8 LUT.
+    """
+    xp = np.arange(len(points))
     indices = np.linspace(0, len(points) - 1, 256)
-    lut = np.zeros((256, 3), dtype=np.uint8)
-    for c in range(3):
-        lut[:, c] = np.interp(indices, np.arange(len(points)), points[:, c])
-    return lut
+    return _interp_axis0(indices, xp, points).astype(np.uint8)
+
+
+# Key control points sampled from matplotlib viridis
+_VIRIDIS_POINTS = np.array([
+    [68, 1, 84], [72, 35, 116], [64, 67, 135], [52, 94, 141],
+    [41, 120, 142], [32, 144, 140], [34, 167, 132], [68, 190, 112],
+    [121, 209, 81], [189, 222, 38], [253, 231, 37],
+], dtype=np.float64)
+
+_INFERNO_POINTS = np.array([
+    [0, 0, 4], [22, 11, 57], [66, 10, 104], [106, 23, 110],
+    [147, 38, 103], [186, 54, 85], [221, 81, 58], [243, 118, 27],
+    [249, 166, 10], [240, 215, 66], [252, 255, 164],
+], dtype=np.float64)
+
+_PLASMA_POINTS = np.array([
+    [13, 8, 135], [75, 3, 161], [126, 3, 168], [168, 34, 150],
+    [199, 63, 125], [224, 100, 97], [241, 140, 73], [248, 181, 48],
+    [241, 222, 36], [240, 249, 33],
+], dtype=np.float64)
 
 
 def _make_hot_lut() -> np.ndarray:
     """Generate hot colormap LUT (256 entries)."""
-    lut = np.zeros((256, 3), dtype=np.uint8)
-    for i in range(256):
-        t = i / 255.0
-        # Red ramps first, then green, then blue
-        r = min(1.0, t * 2.5)
-        g = max(0.0, min(1.0, (t - 0.4) * 2.5))
-        b = max(0.0, min(1.0, (t - 0.8) * 5.0))
-        lut[i] = [int(r * 255), int(g * 255), int(b * 255)]
-    return lut
+    t = np.arange(256) / 255.0
+    # Red ramps first, then green, then blue
+    r = np.clip(t * 2.5, 0.0, 1.0)
+    g = np.clip((t - 0.4) * 2.5, 0.0, 1.0)
+    b = np.clip((t - 0.8) * 5.0, 0.0, 1.0)
+    return (np.stack([r, g, b], axis=1) * 255).astype(np.uint8)
 
 
-# Lazy-initialized colormap registry
-_COLORMAPS: Optional[dict] = None
+# Built once at import so the render path is a single dict lookup.
+_LUT_VIRIDIS = _lut_from_points(_VIRIDIS_POINTS)
+_LUT_INFERNO = _lut_from_points(_INFERNO_POINTS)
+_LUT_PLASMA = _lut_from_points(_PLASMA_POINTS)
+_LUT_HOT = _make_hot_lut()
+
+_LUTS = {
+    'viridis': _LUT_VIRIDIS,
+    'inferno': _LUT_INFERNO,
+    'plasma': _LUT_PLASMA,
+    'hot': _LUT_HOT,
+}
 
 
 def _get_colormaps() -> dict:
-    """Return colormap LUT registry, building on first access."""
-    global _COLORMAPS
-    if _COLORMAPS is None:
-        _COLORMAPS = {
-            'viridis': _make_viridis_lut(),
-            'inferno': _make_inferno_lut(),
-            'plasma': _make_plasma_lut(),
-            'hot': _make_hot_lut(),
-        }
-    return _COLORMAPS
+    """Return the colormap LUT registry (name -> (256, 3) uint8)."""
+    return _LUTS
 
 
 AVAILABLE_COLORMAPS = ('grayscale', 'viridis', 'inferno', 'plasma', 'hot')
@@ -194,9 +224,321 @@ class DisplaySettings:
 # Pure functions (no Qt dependency)
 # ---------------------------------------------------------------------------
 
+if _NUMBA_AVAILABLE:
+
+    # fastmath without 'nnan'/'ninf' so NaN pixels still clip predictably.
+    @njit(
+        parallel=True, cache=True,
+        fastmath={'nsz', 'contract', 'afn', 'reassoc'},
+    )
+    def _display_kernel(arr, vmin, span, contrast, offset, inv_gamma, out):
+        """Fused window/level, contrast, gamma and uint8 quantization."""
+        rows, cols = arr.shape
+        for i in prange(rows):
+            for j in range(cols):
+                t = contrast * ((arr[i, j] - vmin) / span) + offset
+                if t > 1.0:
+                    t = 1.0
+                elif not t >= 0.0:
+                    t = 0.0
+                if inv_gamma != 1.0:
+                    t = t ** inv_gamma
+                out[i, j] = np.uint8(t * 255.0)
+
+
+def _percentile_hist(
+    arr: np.ndarray,
+    low: float,
+    high: float,
+    bins: int = 65536,
+) -> Tuple[float, float]:
+    """Approximate ``np.nanpercentile(arr, (low, high))`` from a histogram.
+
+    One min/max pass plus one histogram pass replaces the full
+    partition of the image. Percentiles are linearly interpolated
+    inside the bin holding the target rank, so the error is at most
+    one bin width. When that is too coarse for the resulting window
+    (the window spans fewer than 256 bins, i.e. a display level would
+    be off by more than one step), or the input is small or has
+    non-finite extremes, the exact percentiles are returned instead.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Real-valued image; NaNs are ignored.
+    low, high : float
+        Percentiles in [0, 100].
+    bins : int
+        Histogram resolution.
+
+    Returns
+    -------
+    Tuple[float, float]
+        Approximate (low, high) percentile values.
+    """
+    def exact() -> Tuple[float, float]:
+        lo, hi = np.nanpercentile(arr, (low, high))
+        return float(lo), float(hi)
+
+    if arr.size <= bins:
+        return exact()
+
+    dmin = float(np.nanmin(arr))
+    dmax = float(np.nanmax(arr))
+    if not (np.isfinite(dmin) and np.isfinite(dmax)) or dmax <= dmin:
+        return exact()
+
+    hist, edges = np.histogram(arr, bins=bins, range=(dmin, dmax))
+    cdf = np.cumsum(hist)
+    count = int(cdf[-1])
+    if count == 0:
+        return exact()
+
+    # Rank of each percentile among the valid samples (numpy 'linear').
+    ranks = np.array((low, high), dtype=np.float64) / 100.0 * (count - 1)
+    idx = np.searchsorted(cdf, ranks, side='right')
+    idx = np.minimum(idx, bins - 1)
+    before = np.where(idx > 0, cdf[idx - 1], 0)
+    frac = (ranks - before + 0.5) / np.maximum(hist[idx], 1)
+    values = edges[idx] + np.clip(frac, 0.0, 1.0) * (edges[1] - edges[0])
+    vmin, vmax = (float(v) for v in np.clip(values, dmin, dmax))
+
+    if (vmax - vmin) * 256 < (dmax - dmin):
+        return exact()
+    return vmin, vmax
+
+
+def _apply_display(
+    arr: np.ndarray,
+    vmin: float,
+    vmax: float,
+    settings: DisplaySettings,
+) -> np.ndarray:
+    """Map *arr* through window/level, contrast, brightness and gamma.
+
+    Equivalent to normalizing to ``[0, 1]`` with ``(vmin, vmax)``,
+    applying ``contrast * (t - 0.5) + 0.5 + brightness``, clipping,
+    raising to ``1 / gamma`` and scaling to uint8. 2D inputs run
+    through a single fused numba kernel when numba is installed;
+    otherwise one float32 buffer is updated in place so no
+    intermediate full-image temporaries are allocated.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        Real-valued source, 2D (H, W) or 3D (C, H, W), any dtype.
+    vmin, vmax : float
+        Window bounds. ``vmax <= vmin`` maps every pixel to zero
+        before contrast/brightness.
+    settings : DisplaySettings
+        Supplies contrast, brightness and gamma.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array with the same shape as *arr*.
+    """
+    contrast = float(settings.contrast)
+    offset = 0.5 - 0.5 * contrast + float(settings.brightness)
+    inv_gamma = 1.0 / settings.gamma
+
+    if vmax <= vmin:
+        # Degenerate window: every pixel sits at the bottom of the ramp.
+        t = min(max(offset, 0.0), 1.0) ** inv_gamma
+        return np.full(arr.shape, int(t * 255.0), dtype=np.uint8)
+
+    span = vmax - vmin
+    if _NUMBA_AVAILABLE and arr.ndim == 2:
+        out = np.empty(arr.shape, dtype=np.uint8)
+        _display_kernel(arr, vmin, span, contrast, offset, inv_gamma, out)
+        return out
+
+    buf = np.subtract(arr, vmin, dtype=np.float32)
+    buf /= span
+    if contrast != 1.0 or offset != 0.0:
+        buf *= contrast
+        buf += offset
+    np.clip(buf, 0.0, 1.0, out=buf)
+    if inv_gamma != 1.0:
+        np.power(buf, inv_gamma, out=buf)
+    buf *= 255.0
+    return buf.astype(np.uint8)
+
+
+# Sample size for preview percentiles; their cost stops growing with the
+# image beyond this many pixels.
+_PREVIEW_SAMPLES = 1_000_000
+
+# Every possible uint8 pixel value, for building 256-entry mapping tables.
+_UINT8_RAMP = np.arange(256, dtype=np.uint8)
+
+# Window levels used to index a tone table. 65536 entries keep the
+# gamma curve within one output step of the exact float pipeline,
+# while a (65536, 3) table (192 KiB) still fits in L2 cache.
+_TONE_LEVELS = 65536
+
+
+@functools.lru_cache(maxsize=32)
+def _tone_table(gamma: float, colormap: str) -> Optional[np.ndarray]:
+    """Gamma curve composed with a colormap.
+
+    Contrast and brightness are linear, so callers fold them into the
+    window (see :func:`_fold_contrast`) and the table only carries the
+    non-linear tail of the pipeline.
+
+    Parameters
+    ----------
+    gamma : float
+        Gamma, as in :class:`DisplaySettings`.
+    colormap : str
+        Colormap name; 'grayscale' (or any name without a LUT) leaves
+        the table single-channel.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Read-only uint8 table indexed by the window level
+        ``0 .. _TONE_LEVELS - 1``; shape (_TONE_LEVELS,) or
+        (_TONE_LEVELS, 3). None when the curve is too steep for the
+        level spacing (e.g. high gamma near black), i.e. adjacent
+        levels differ by more than one output step.
+    """
+    ramp = np.arange(_TONE_LEVELS, dtype=np.uint16)
+    table = _apply_display(
+        ramp, 0.0, _TONE_LEVELS - 1.0, DisplaySettings(gamma=gamma),
+    )
+    if np.abs(np.diff(table.astype(np.int16))).max() > 1:
+        return None
+    lut = _LUTS.get(colormap)
+    if lut is not None:
+        table = lut[table]
+    table.flags.writeable = False
+    return table
+
+
+def _fold_contrast(
+    vmin: float,
+    vmax: float,
+    contrast: float,
+    brightness: float,
+) -> Tuple[float, float]:
+    """Fold contrast and brightness into the window bounds.
+
+    ``contrast * (t - 0.5) + 0.5 + brightness`` applied to the window
+    value ``t`` spans exactly [0, 1] for ``t`` between
+    ``-offset / contrast`` and ``(1 - offset) / contrast``. Windowing
+    on those bounds therefore gives the same clipped result, including
+    for pixels outside the original window. Requires ``contrast > 0``.
+
+    Parameters
+    ----------
+    vmin, vmax : float
+        Window bounds, ``vmax > vmin``.
+    contrast, brightness : float
+        As in :class:`DisplaySettings`.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The equivalent (vmin, vmax) with default contrast/brightness.
+    """
+    offset = 0.5 - 0.5 * contrast + brightness
+    span = vmax - vmin
+    return (vmin - span * offset / contrast,
+            vmin + span * (1.0 - offset) / contrast)
+
+
+def _window_levels(arr: np.ndarray, vmin: float, vmax: float) -> np.ndarray:
+    """Window *arr* to uint16 levels ``0 .. _TONE_LEVELS - 1``.
+
+    Requires ``vmax > vmin``.
+    """
+    buf = np.subtract(arr, vmin, dtype=np.float32)
+    buf /= vmax - vmin
+    np.clip(buf, 0.0, 1.0, out=buf)
+    buf *= _TONE_LEVELS - 1
+    return buf.astype(np.uint16)
+
+
+def _map_uint8(
+    arr: np.ndarray,
+    vmin: float,
+    vmax: float,
+    settings: DisplaySettings,
+    lut: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Apply :func:`_apply_display` to uint8 input via a lookup table.
+
+    A uint8 image only holds 256 distinct values, so the display
+    mapping (and the colormap, if any) is evaluated once per value and
+    gathered, skipping the float pipeline. When the mapping is the
+    identity (full 0-255 data, default settings, no colormap) *arr*
+    is returned unchanged.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        uint8 image of any shape.
+    vmin, vmax : float
+        Window bounds.
+    settings : DisplaySettings
+        Supplies contrast, brightness and gamma.
+    lut : Optional[np.ndarray]
+        (256, 3) colormap composed after the display mapping.
+    out : Optional[np.ndarray]
+        Reusable output buffer, see :func:`_apply_lut`.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array, bit-identical to ``_apply_display(arr, ...)``
+        followed by the colormap.
+    """
+    table = _apply_display(_UINT8_RAMP, vmin, vmax, settings)
+    if lut is not None:
+        return _apply_lut(lut[table], arr, out)
+    if np.array_equal(table, _UINT8_RAMP):
+        return arr
+    return np.take(table, arr, mode='clip')
+
+
+def _apply_lut(
+    lut: np.ndarray,
+    index: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Gather table rows for an integer index image.
+
+    Parameters
+    ----------
+    lut : np.ndarray
+        (N, 3) or (N,) uint8 table, e.g. a (256, 3) colormap.
+    index : np.ndarray
+        (H, W) uint8 or uint16 image with values below N.
+    out : Optional[np.ndarray]
+        Reusable uint8 C-contiguous buffer of the result shape.
+        Ignored (and a new array allocated) when it does not match.
+
+    Returns
+    -------
+    np.ndarray
+        ``index.shape + lut.shape[1:]`` uint8 image, *out* when it
+        was usable.
+    """
+    shape = index.shape + lut.shape[1:]
+    if (out is None or out.shape != shape or out.dtype != np.uint8
+            or not out.flags.c_contiguous):
+        out = np.empty(shape, dtype=np.uint8)
+    # mode='clip' lets take write straight into out; indices are in range.
+    return np.take(lut, index, axis=0, out=out, mode='clip')
+
+
 def normalize_array(
     arr: np.ndarray,
     settings: Optional[DisplaySettings] = None,
+    out: Optional[np.ndarray] = None,
+    preview: bool = False,
 ) -> np.ndarray:
     """Convert a numpy array to display-ready uint8.
 
@@ -210,12 +552,22 @@ def normalize_array(
         Source image. 2D (H, W), 3D (H, W, C), or complex.
     settings : Optional[DisplaySettings]
         Display parameters. None uses defaults.
+    out : Optional[np.ndarray]
+        Optional (H, W, 3) uint8 buffer reused for colormap output
+        instead of allocating a new image. The result may then be
+        *out* itself, so callers must not keep a previous result
+        while passing its buffer back in.
+    preview : bool
+        Estimate percentile windows from a strided subsample of about
+        ``_PREVIEW_SAMPLES`` pixels. Cheaper on large images while a
+        control is being dragged; render again without it afterwards.
 
     Returns
     -------
     np.ndarray
         uint8 array. Shape (H, W) for grayscale or (H, W, 3) for
         RGB (either from 3-band input or colormap application).
+        uint8 input that needs no mapping may be returned as-is.
     """
     if settings is None:
         settings = DisplaySettings()
@@ -238,7 +590,7 @@ def normalize_array(
         and settings.window_min is None
         and settings.window_max is None
     ):
-        out = arr.astype(np.float64)
+        out = arr.astype(np.float32, copy=False)
         # Apply contrast/brightness/gamma if non-default, then scale.
         if settings.contrast != 1.0 or settings.brightness != 0.0:
             out = settings.contrast * (out - 0.5) + 0.5 + settings.brightness
@@ -278,68 +630,64 @@ def normalize_array(
                     arr = np.clip(arr * 255.0, 0, 255).astype(np.uint8)
                 else:
                     arr = np.clip(arr, 0, 255).astype(np.uint8)
-            # Apply contrast, brightness, gamma on the remap output
-            arr = arr.astype(np.float64) / 255.0
-            if settings.contrast != 1.0 or settings.brightness != 0.0:
-                arr = settings.contrast * (arr - 0.5) + 0.5 + settings.brightness
-            if settings.gamma != 1.0:
-                arr = np.clip(arr, 0.0, 1.0)
-                arr = np.power(arr, 1.0 / settings.gamma)
-            arr = np.clip(arr * 255.0, 0, 255).astype(np.uint8)
-            # Apply colormap if grayscale
-            if settings.colormap != 'grayscale':
-                colormaps = _get_colormaps()
-                lut = colormaps.get(settings.colormap)
-                if lut is not None:
-                    arr = lut[arr]
-            return arr
+            # Apply contrast, brightness, gamma and colormap in one gather
+            return _map_uint8(
+                arr, 0.0, 255.0, settings, _LUTS.get(settings.colormap), out,
+            )
         except Exception:
             pass  # Fall through to standard pipeline on error
 
     # 3. Window/level
-    arr = arr.astype(np.float64)
-
     if settings.window_min is not None and settings.window_max is not None:
         vmin = float(settings.window_min)
         vmax = float(settings.window_max)
     else:
         if settings.percentile_low > 0 or settings.percentile_high < 100:
-            vmin = float(np.nanpercentile(arr, settings.percentile_low))
-            vmax = float(np.nanpercentile(arr, settings.percentile_high))
+            sample = arr
+            if preview:
+                step = int(np.sqrt(arr.size / _PREVIEW_SAMPLES))
+                if step > 1:
+                    sample = arr[..., ::step, ::step]
+            vmin, vmax = _percentile_hist(
+                sample, settings.percentile_low, settings.percentile_high,
+            )
         else:
             vmin = float(np.nanmin(arr))
             vmax = float(np.nanmax(arr))
 
-    if vmax > vmin:
-        arr = (arr - vmin) / (vmax - vmin)
-    else:
-        arr = np.zeros_like(arr)
-
-    # 4. Contrast and brightness
-    if settings.contrast != 1.0 or settings.brightness != 0.0:
-        arr = settings.contrast * (arr - 0.5) + 0.5 + settings.brightness
-
-    # 5. Gamma
-    if settings.gamma != 1.0:
-        arr = np.clip(arr, 0.0, 1.0)
-        arr = np.power(arr, 1.0 / settings.gamma)
-
-    # 6. Scale to uint8
-    arr = np.clip(arr * 255.0, 0, 255).astype(np.uint8)
-
-    # 7. Colormap (only for grayscale images)
-    if not is_rgb and settings.colormap != 'grayscale':
-        colormaps = _get_colormaps()
-        lut = colormaps.get(settings.colormap)
-        if lut is not None:
-            arr = lut[arr]  # (H, W) uint8 → (H, W, 3) uint8
+    # 4-7. Contrast/brightness, gamma, uint8 scaling and colormap
+    lut = None if is_rgb else _LUTS.get(settings.colormap)
+    if arr.dtype == np.uint8:
+        return _map_uint8(arr, vmin, vmax, settings, lut, out)
+
+    tone = (settings.contrast != 1.0 or settings.brightness != 0.0
+            or settings.gamma != 1.0)
+    fused = _NUMBA_AVAILABLE and arr.ndim == 2
+    if tone and not fused and vmax > vmin and settings.contrast > 0:
+        # Contrast/brightness become part of the window; gamma (and the
+        # colormap) is one gather through a cached table instead of a
+        # per-pixel power.
+        vmin, vmax = _fold_contrast(
+            vmin, vmax, float(settings.contrast), float(settings.brightness),
+        )
+        cmap = settings.colormap if lut is not None else 'grayscale'
+        settings = DisplaySettings(gamma=settings.gamma)
+        if settings.gamma != 1.0:
+            table = _tone_table(float(settings.gamma), cmap)
+            if table is not None:
+                return _apply_lut(table, _window_levels(arr, vmin, vmax), out)
 
+    arr = _apply_display(arr, vmin, vmax, settings)
+    if lut is not None:
+        arr = _apply_lut(lut, arr, out)  # (H, W) → (H, W, 3)
     return arr
 
 
 def array_to_qimage(
     arr: np.ndarray,
     settings: Optional[DisplaySettings] = None,
+    out: Optional[np.ndarray] = None,
+    preview: bool = False,
 ) -> Any:
     """Convert a numpy array to a QImage using display settings.
 
@@ -349,6 +697,10 @@ def array_to_qimage(
         Source image array.
     settings : Optional[DisplaySettings]
         Display parameters. None uses defaults.
+    out : Optional[np.ndarray]
+        Reusable colormap buffer, see :func:`normalize_array`.
+    preview : bool
+        Subsampled percentile window, see :func:`normalize_array`.
 
     Returns
     -------
@@ -358,13 +710,36 @@ def array_to_qimage(
     if not _QT_AVAILABLE:
         raise ImportError("Qt is required for array_to_qimage")
 
-    display = normalize_array(arr, settings)
+    display = normalize_array(arr, settings, out, preview)
 
     _log.debug(
         "array_to_qimage: display shape=%s dtype=%s",
         display.shape, display.dtype,
     )
 
+    qimg, _ = _qimage_view(display)
+    # Detach from the numpy buffer, which is freed when this returns.
+    return qimg.copy()
+
+
+def _qimage_view(display: np.ndarray) -> Tuple[Any, np.ndarray]:
+    """Wrap a display-ready uint8 array in a QImage without copying.
+
+    The QImage reads the returned array's memory, so the caller must
+    keep that array alive (and unmodified) for as long as the QImage,
+    or anything sharing its data, is in use.
+
+    Parameters
+    ----------
+    display : np.ndarray
+        Output of :func:`normalize_array`: (H, W), (H, W, 3) or
+        channels-first (3, H, W) uint8.
+
+    Returns
+    -------
+    Tuple[QImage, np.ndarray]
+        The image and the C-contiguous array backing it.
+    """
     # Channels-first (C, H, W) → channels-last (H, W, C) for QImage.
     # Distinguish from colormap output (H, W, 3) by checking dim sizes.
     if (display.ndim == 3
@@ -372,21 +747,18 @@ def array_to_qimage(
             and display.shape[0] < display.shape[2]):
         display = np.transpose(display, (1, 2, 0))
 
+    if display.ndim == 3 and display.shape[2] != 3:
+        # Fallback: first channel
+        display = display[:, :, 0]
     display = np.ascontiguousarray(display)
 
     if display.ndim == 2:
         h, w = display.shape
-        return QImage(display.data, w, h, w, QImage.Format.Format_Grayscale8).copy()
-    elif display.ndim == 3 and display.shape[2] == 3:
-        h, w, _ = display.shape
-        bpl = 3 * w
-        return QImage(display.data, w, h, bpl, QImage.Format.Format_RGB888).copy()
+        qimg = QImage(display.data, w, h, w, QImage.Format.Format_Grayscale8)
     else:
-        # Fallback: first channel
-        band = display[:, :, 0] if display.ndim == 3 else display
-        h, w = band.shape
-        band = np.ascontiguousarray(band)
-        return QImage(band.data, w, h, w, QImage.Format.Format_Grayscale8).copy()
+        h, w, _ = display.shape
+        qimg = QImage(display.data, w, h, 3 * w, QImage.Format.Format_RGB888)
+    return qimg, display
 
 
 # ---------------------------------------------------------------------------
@@ -423,12 +795,27 @@ if _QT_AVAILABLE:
         polygon_completed = Signal(object)  # emits np.ndarray of vertices
 
         _ZOOM_FACTOR = 1.15
+        # Settings changes closer together than this count as a drag
+        _PREVIEW_SETTLE_MS = 150
 
         def __init__(self, parent: Optional[Any] = None) -> None:
             super().__init__(parent)
 
             self._source: Optional[np.ndarray] = None
             self._settings = DisplaySettings()
+            # (id(source), settings) of the pixmap currently displayed
+            self._display_key: Optional[Tuple[int, DisplaySettings]] = None
+            # Colormap output buffer, reused while the image shape holds
+            self._lut_buf: Optional[np.ndarray] = None
+            # Array backing the displayed pixmap's image data
+            self._last_display: Optional[np.ndarray] = None
+
+            # Rapid settings changes (slider drags) render previews; a
+            # full render follows once the changes settle.
+            self._settle_timer = QTimer(self)
+            self._settle_timer.setSingleShot(True)
+            self._settle_timer.setInterval(self._PREVIEW_SETTLE_MS)
+            self._settle_timer.timeout.connect(self._refresh_display)
             self._zoom_level = 1.0
             self._zoom_history: list = []  # Stack of QTransform for undo
 
@@ -482,6 +869,7 @@ if _QT_AVAILABLE:
                 arr.shape, arr.dtype,
             )
             self._source = arr
+            self._display_key = None  # Same object may hold new pixels
             self._refresh_display()
 
         def set_display_settings(self, settings: DisplaySettings) -> None:
@@ -497,7 +885,8 @@ if _QT_AVAILABLE:
                 settings.colormap, settings.band_index, settings.contrast,
             )
             self._settings = settings
-            self._refresh_display()
+            self._refresh_display(preview=self._settle_timer.isActive())
+            self._settle_timer.start()
             self.display_settings_changed.emit(settings)
 
         @property
@@ -848,13 +1237,40 @@ if _QT_AVAILABLE:
             # Clear active drawing
             self._polygon_state.clear_active_drawing()
 
-        def _refresh_display(self) -> None:
-            """Re-render the source array with current settings."""
+        def _refresh_display(self, preview: bool = False) -> None:
+            """Re-render the source array with current settings.
+
+            Skipped when the displayed pixmap was already rendered from
+            the same source array with equal settings, so view-only
+            changes (reset, re-emitted settings) cost nothing.
+
+            Parameters
+            ----------
+            preview : bool
+                Window from subsampled percentiles (see
+                :func:`normalize_array`). The result is provisional;
+                the settle timer replaces it with a full render.
+            """
             if self._source is None:
+                self._display_key = None
                 self._pixmap_item.setPixmap(QPixmap())
+                self._last_display = None
+                return
+
+            key = (id(self._source), self._settings)
+            if key == self._display_key:
                 return
 
-            qimg = array_to_qimage(self._source, self._settings)
+            s = self._settings
+            preview = preview and (
+                s.percentile_low > 0 or s.percentile_high < 100
+            ) and (s.window_min is None or s.window_max is None)
+            display = normalize_array(
+                self._source, s, self._colormap_buffer(), preview,
+            )
+            # No intermediate QImage copy: the pixmap is built straight
+            # from the numpy buffer, which is kept alive alongside it.
+            qimg, self._last_display = _qimage_view(display)
             pixmap = QPixmap.fromImage(qimg)
             _log.debug(
                 "_refresh_display: pixmap %dx%d (null=%s)",
@@ -862,6 +1278,21 @@ if _QT_AVAILABLE:
             )
             self._pixmap_item.setPixmap(pixmap)
             self._scene.setSceneRect(self._pixmap_item.boundingRect())
+            self._display_key = None if preview else key
+
+        def _colormap_buffer(self) -> Optional[np.ndarray]:
+            """Return the (H, W, 3) colormap buffer for the current source.
+
+            Returns None for grayscale, where no colormap is applied.
+            Overwriting it is safe: only the next render writes to it,
+            and that render replaces the pixmap showing its contents.
+            """
+            if self._settings.colormap == 'grayscale':
+                return None
+            shape = self._source.shape[-2:] + (3,)
+            if self._lut_buf is None or self._lut_buf.shape != shape:
+                self._lut_buf = np.empty(shape, dtype=np.uint8)
+            return self._lut_buf
 
         def _update_zoom_level(self) -> None:
             """Read current transform and emit zoom_changed."""
@@ -26,7 +26,7 @@ Created
 
 Modified
 --------
-2026-02-20
+2026-10-16
 """
 
 # Standard library
@@ -97,6 +97,7 @@ def _build_arg_parser() -> argparse.ArgumentParser:
 
 if _QT_AVAILABLE:
     from grdk.viewers.dual_viewer import DualGeoViewer
+    from grdk.viewers.geolocation_lock import geolocation_lock
     from grdk.viewers.image_canvas import DisplaySettings
     from grdk.widgets._display_controls import build_display_controls
     from grdk.widgets._pol_utils import (
@@ -261,10 +262,8 @@ if _QT_AVAILABLE:
             # polarimetric decomposition so the tool can gate re-runs.
             self._decomp_state: dict = {0: None, 1: None}
 
-            # Wire signals
-            self._viewer.band_info_changed.connect(
-                self._on_band_info_changed,
-            )
+            # Wire signals.  pane_band_info_changed already covers the
+            # active pane, so the legacy band_info_changed is not needed
             self._viewer.pane_band_info_changed.connect(
                 self._on_pane_band_info_changed,
             )
@@ -272,6 +271,7 @@ if _QT_AVAILABLE:
                 self._on_active_pane_changed,
             )
             self._viewer.mode_changed.connect(self._on_mode_changed)
+            self._viewer.export_finished.connect(self._on_export_finished)
 
             # Update status bar when display settings change in dual mode
             self._viewer.left_viewer.canvas.display_settings_changed.connect(
@@ -717,7 +717,7 @@ if _QT_AVAILABLE:
             cb = getattr(controls, 'colorbar_checkbox', None)
             if cb is not None:
                 cb.toggled.connect(
-                    self._viewer.left_viewer.colorbar.setVisible,
+                    self._viewer.left_viewer.set_colorbar_visible,
                 )
 
         def _create_right_display_dock(self) -> None:
@@ -742,7 +742,7 @@ if _QT_AVAILABLE:
             cb = getattr(controls, 'colorbar_checkbox', None)
             if cb is not None:
                 cb.toggled.connect(
-                    self._viewer.right_viewer.colorbar.setVisible,
+                    self._viewer.right_viewer.set_colorbar_visible,
                 )
 
             # Hidden by default (single mode)
@@ -800,7 +800,8 @@ if _QT_AVAILABLE:
             if geo is not None:
                 pairs.append(("geolocation", type(geo).__name__))
                 try:
-                    bounds = geo.get_bounds()
+                    with geolocation_lock(geo):
+                        bounds = geo.get_bounds()
                     if bounds:
                         pairs.append(("bounds", str(bounds)))
                 except Exception:
@@ -1186,13 +1187,6 @@ if _QT_AVAILABLE:
             right = _band_label(self._viewer.right_viewer)
             self.statusBar().showMessage(f"Dual view: {left} | {right}")
 
-        def _on_band_info_changed(self, band_info: list) -> None:
-            """Update band selector when active pane's band info changes."""
-            # Legacy signal — routed to active pane's dock
-            self._on_pane_band_info_changed(
-                self._viewer.active_pane, band_info,
-            )
-
         def _on_pane_band_info_changed(
             self, pane: int, band_info: list,
         ) -> None:
@@ -2604,7 +2598,8 @@ if _QT_AVAILABLE:
             if geo is not None:
                 data["geolocation_type"] = type(geo).__name__
                 try:
-                    bounds = geo.get_bounds()
+                    with geolocation_lock(geo):
+                        bounds = geo.get_bounds()
                     if bounds is not None:
                         data["bounds"] = bounds
                 except Exception:
@@ -2685,15 +2680,24 @@ if _QT_AVAILABLE:
                     # Default to PNG if filter is "All Files"
                     filepath += '.png'
 
+            # Encoding runs off the GUI thread; _on_export_finished
+            # reports the outcome
             try:
-                self._viewer.export_view(filepath, pane=pane)
-                self.statusBar().showMessage(f"Exported: {filepath}")
+                self._viewer.export_view(filepath, pane=pane, background=True)
+                self.statusBar().showMessage(f"Exporting: {filepath}")
             except Exception as e:
-                _log.error("Export failed: %s", e, exc_info=True)
-                QMessageBox.critical(
-                    self, "Export Error",
-                    f"Could not export view:\n{filepath}\n\n{e}",
-                )
+                self._on_export_finished(filepath, str(e))
+
+        def _on_export_finished(self, filepath: str, error: str) -> None:
+            """Report a completed export in the status bar or a dialog."""
+            if not error:
+                self.statusBar().showMessage(f"Exported: {filepath}")
+                return
+            _log.error("Export failed: %s", error)
+            QMessageBox.critical(
+                self, "Export Error",
+                f"Could not export view:\n{filepath}\n\n{error}",
+            )
 
         # --- Polygon Drawing ---
 
@@ -27,7 +27,7 @@ Created
 
 Modified
 --------
-2026-02-17
+2026-10-16
 """
 
 # Standard library
@@ -319,6 +319,14 @@ if _QT_AVAILABLE:
             """Tile edge length in pixels."""
             return self._tile_size
 
+        @property
+        def reader_mutex(self) -> QMutex:
+            """Mutex serialising tile-worker reads from the reader.
+
+            Hold it when reading from the same reader on another thread.
+            """
+            return self._mutex
+
         def tiles_at_level(self, level: int) -> Tuple[int, int]:
             """Return (num_tile_rows, num_tile_cols) at the given LOD level.
 
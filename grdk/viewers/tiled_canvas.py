@@ -27,7 +27,7 @@ Created
 
 Modified
 --------
-2026-02-17
+2026-10-16
 """
 
 # Standard library
@@ -244,6 +244,13 @@ if _QT_AVAILABLE:
             """
             self.centerOn(QPointF(col, row))
 
+        @property
+        def reader_mutex(self) -> Optional[Any]:
+            """Tile cache mutex guarding reader access, or None if not tiled."""
+            if self._tiled_mode and self._tile_cache is not None:
+                return self._tile_cache.reader_mutex
+            return None
+
         def get_zoom(self) -> float:
             """Return the current zoom factor.
 
@@ -254,6 +261,30 @@ if _QT_AVAILABLE:
             """
             return self.transform().m11()
 
+        def set_viewport(self, row: float, col: float, zoom: float) -> None:
+            """Set zoom and center together with a single repaint.
+
+            Zoom is applied first so the requested center is not shifted
+            by the zoom anchor.
+
+            Parameters
+            ----------
+            row : float
+                Center row in source image pixel space.
+            col : float
+                Center column in source image pixel space.
+            zoom : float
+                Zoom level (1.0 = 100%).
+            """
+            self.setUpdatesEnabled(False)
+            try:
+                self.zoom_to(zoom)
+                self.center_on(row, col)
+            finally:
+                self.setUpdatesEnabled(True)
+            if self._tiled_mode:
+                self._schedule_tile_update()
+
         # --- Event overrides ---
 
         def zoom_undo(self) -> None:
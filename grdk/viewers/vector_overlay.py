@@ -27,7 +27,7 @@ Created
 
 Modified
 --------
-2026-02-17
+2026-10-16
 """
 
 # Standard library
@@ -38,6 +38,9 @@ from typing import Any, Dict, List, Optional, Sequence
 # Third-party
 import numpy as np
 
+# GRDK internal
+from grdk.viewers.geolocation_lock import geolocation_lock
+
 try:
     from PyQt6.QtWidgets import (
         QGraphicsEllipseItem,
@@ -256,7 +259,8 @@ if _QT_AVAILABLE:
                 lons = coords_arr[:, 0]
                 lats = coords_arr[:, 1]
                 try:
-                    result = self._geolocation.latlon_to_image(lats, lons)
+                    with geolocation_lock(self._geolocation):
+                        result = self._geolocation.latlon_to_image(lats, lons)
                     if isinstance(result, tuple) and len(result) >= 2:
                         rows, cols = result[0], result[1]
                     else:
@@ -66,3 +66,21 @@ class TestGetBandInfo:
         assert isinstance(result, list)
         for item in result:
             assert isinstance(item, BandInfo)
+
+    def test_cached_per_reader(self):
+        reader = _MockReader(bands=2)
+        first = get_band_info(reader)
+        reader.metadata = _DictMeta(bands=5)
+        second = get_band_info(reader)
+        assert [b.name for b in second] == [b.name for b in first]
+        assert second is not first
+
+    def test_cache_is_per_instance(self):
+        assert len(get_band_info(_MockReader(bands=2))) == 2
+        assert len(get_band_info(_MockReader(bands=3))) == 3
+
+    def test_num_bands_attribute_preferred(self):
+        reader = _MockReader(bands=1)
+        reader.num_bands = 3
+        result = get_band_info(reader)
+        assert [b.name for b in result] == ["Band 0", "Band 1", "Band 2"]
@@ -15,13 +15,21 @@ Created
 2026-02-20
 """
 
+import threading
 from typing import Any, Optional, Tuple
 from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
 
-from grdk.viewers.dual_viewer import compute_geo_bounds, compute_overlap
+from grdk.viewers.dual_viewer import (
+    _OffsetGeolocation,
+    _chip_geolocation,
+    _overlap_pixel_bbox,
+    _project_pixel,
+    compute_geo_bounds,
+    compute_overlap,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -54,6 +62,32 @@ class SyntheticReader:
         pass
 
 
+class ClosingSyntheticReader(SyntheticReader):
+    """SyntheticReader whose ``close()`` really closes it."""
+
+    def __init__(self, rows: int, cols: int) -> None:
+        super().__init__(rows, cols)
+        self.closed = False
+
+    def read_chip(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        if self.closed:
+            raise ValueError("read from closed reader")
+        return super().read_chip(*args, **kwargs)
+
+    def get_shape(self) -> Tuple[int, ...]:
+        if self.closed:
+            raise ValueError("read from closed reader")
+        return super().get_shape()
+
+    def read_full(self, bands: Any = None) -> np.ndarray:
+        if self.closed:
+            raise ValueError("read from closed reader")
+        return super().read_full(bands)
+
+    def close(self) -> None:
+        self.closed = True
+
+
 class MultibandSyntheticReader:
     """Multiband reader that returns channels-first (C, H, W) data.
 
@@ -141,6 +175,43 @@ class MockGeolocation:
         return (row, col)
 
 
+class ExclusiveGeolocation(MockGeolocation):
+    """MockGeolocation that records overlapping calls from two threads.
+
+    Calls from a worker thread wait for ``release`` once inside the
+    model, so a test can act on the GUI thread while one is in flight.
+    """
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+        self.active = 0
+        self.overlaps = 0
+        self.gui_calls = 0
+
+    def _call(self, fn: Any, *args: Any) -> Any:
+        self.active += 1
+        if self.active > 1:
+            self.overlaps += 1
+        try:
+            if threading.current_thread() is threading.main_thread():
+                self.gui_calls += 1
+            else:
+                self.entered.set()
+                self.release.wait(5)
+            return fn(*args)
+        finally:
+            self.active -= 1
+
+    def image_to_latlon(self, *args: Any) -> Tuple[float, float]:
+        return self._call(super().image_to_latlon, *args)
+
+    def latlon_to_image(self, *args: Any) -> Tuple[float, float]:
+        return self._call(super().latlon_to_image, *args)
+
+
 # ---------------------------------------------------------------------------
 # compute_geo_bounds (no Qt)
 # ---------------------------------------------------------------------------
@@ -161,6 +232,24 @@ class TestComputeGeoBounds:
         geo.image_to_latlon.side_effect = Exception("transform error")
         assert compute_geo_bounds(geo, 100, 100) is None
 
+    def test_vectorised_geolocation(self):
+        """Array-capable models are projected with a single call."""
+        calls = []
+
+        class _ArrayGeo:
+            def image_to_latlon(self, points):
+                calls.append(points.shape)
+                pts = np.asarray(points, dtype=float)
+                return np.column_stack([
+                    30.0 + pts[:, 0] / 99.0,
+                    -90.0 + pts[:, 1] / 199.0,
+                    np.zeros(len(pts)),
+                ])
+
+        bounds = compute_geo_bounds(_ArrayGeo(), 100, 200)
+        assert calls == [(4, 2)]
+        assert bounds == pytest.approx((30.0, 31.0, -90.0, -89.0))
+
 
 # ---------------------------------------------------------------------------
 # compute_overlap (no Qt)
@@ -197,6 +286,14 @@ class TestComputeOverlap:
             left_geo, (100, 100), right_geo, (100, 100),
         ) is None
 
+    def test_same_model_projects_once(self):
+        geo = MagicMock(wraps=MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0))
+        overlap = compute_overlap(geo, (100, 100), geo, (100, 100))
+        calls = geo.image_to_latlon.call_count
+        geo.image_to_latlon.reset_mock()
+        assert overlap == compute_geo_bounds(geo, 100, 100)
+        assert geo.image_to_latlon.call_count == calls
+
     def test_none_geolocation(self):
         """None geolocation should return None."""
         geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
@@ -204,11 +301,169 @@ class TestComputeOverlap:
         assert compute_overlap(geo, (100, 100), None, (100, 100)) is None
 
 
+# ---------------------------------------------------------------------------
+# _overlap_pixel_bbox (no Qt)
+# ---------------------------------------------------------------------------
+
+class TestOverlapPixelBbox:
+    def test_scalar_geolocation(self):
+        geo = MockGeolocation(101, 101, 30.0, 31.0, -90.0, -89.0)
+        bbox = _overlap_pixel_bbox(geo, (30.5, 31.0, -89.5, -89.0))
+        assert bbox == (50, 101, 50, 101)
+
+    def test_end_clamped_to_shape(self):
+        geo = MockGeolocation(101, 101, 30.0, 31.0, -90.0, -89.0)
+        box = (30.5, 31.5, -89.5, -88.5)
+        assert _overlap_pixel_bbox(geo, box) == (50, 151, 50, 151)
+        assert _overlap_pixel_bbox(geo, box, (101, 120)) == (50, 101, 50, 120)
+
+    def test_box_outside_image_returns_none(self):
+        geo = MockGeolocation(101, 101, 30.0, 31.0, -90.0, -89.0)
+        box = (31.5, 32.0, -89.5, -89.0)
+        assert _overlap_pixel_bbox(geo, box, (101, 101)) is None
+
+    def test_vectorised_geolocation(self):
+        calls = []
+
+        class _ArrayGeo:
+            def latlon_to_image(self, points):
+                calls.append(points.shape)
+                pts = np.asarray(points, dtype=float)
+                return np.column_stack([
+                    (pts[:, 0] - 30.0) * 100.0, (pts[:, 1] + 90.0) * 100.0,
+                ])
+
+        bbox = _overlap_pixel_bbox(
+            _ArrayGeo(), (29.9, 30.5, -89.5, -89.0), densify_pts=0,
+        )
+        assert calls == [(4, 2)]
+        assert bbox == (0, 51, 50, 101)
+
+    def test_densified_edges_bound_curved_mapping(self):
+        class _CurvedGeo:
+            # Row bulges in the middle of each longitude span
+            def latlon_to_image(self, points):
+                pts = np.asarray(points, dtype=float)
+                u = pts[:, 1] + 90.0
+                return np.column_stack([
+                    (pts[:, 0] - 30.0) * 100.0 + 40.0 * u * (1.0 - u),
+                    u * 100.0,
+                ])
+
+        box = (30.0, 30.5, -90.0, -89.0)
+        corners_only = _overlap_pixel_bbox(_CurvedGeo(), box, densify_pts=0)
+        densified = _overlap_pixel_bbox(_CurvedGeo(), box)
+        assert corners_only[1] == 51
+        assert densified[1] == 61
+
+    def test_returns_none_on_error(self):
+        geo = MagicMock()
+        geo.latlon_to_image.side_effect = ValueError("outside model")
+        assert _overlap_pixel_bbox(geo, (30.0, 31.0, -90.0, -89.0)) is None
+
+    @pytest.mark.parametrize("error", [NotImplementedError, RuntimeError])
+    def test_runtime_error_returns_none(self, error, caplog):
+        geo = MagicMock()
+        geo.latlon_to_image.side_effect = error("no inverse")
+        with caplog.at_level("WARNING", logger="grdk.dual_viewer"):
+            assert _overlap_pixel_bbox(geo, (30.0, 31.0, -90.0, -89.0)) is None
+        assert "projection failed" in caplog.text
+
+    def test_vectorised_runtime_error_falls_back_to_corners(self):
+        class _ScalarGeo(MockGeolocation):
+            def latlon_to_image(self, *args):
+                if len(args) == 1:
+                    raise NotImplementedError("stacked points")
+                return super().latlon_to_image(*args)
+
+        geo = _ScalarGeo(101, 101, 30.0, 31.0, -90.0, -89.0)
+        bbox = _overlap_pixel_bbox(geo, (30.5, 31.0, -89.5, -89.0))
+        assert bbox == (50, 101, 50, 101)
+
+    def test_unexpected_error_propagates(self):
+        geo = MagicMock()
+        geo.latlon_to_image.side_effect = ZeroDivisionError
+        with pytest.raises(ZeroDivisionError):
+            _overlap_pixel_bbox(geo, (30.0, 31.0, -90.0, -89.0))
+
+    def test_array_box_matches_tuple(self):
+        geo = MockGeolocation(101, 101, 30.0, 31.0, -90.0, -89.0)
+        box = np.array([[30.5, -89.5], [31.0, -89.0]])
+        assert _overlap_pixel_bbox(geo, box) == _overlap_pixel_bbox(
+            geo, (30.5, 31.0, -89.5, -89.0),
+        )
+
+
+# ---------------------------------------------------------------------------
+# _chip_geolocation (no Qt)
+# ---------------------------------------------------------------------------
+
+class TestChipGeolocation:
+    def test_duck_typed_model_offset(self):
+        geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        chip = _chip_geolocation(geo, 40, 10, (20, 30))
+        assert isinstance(chip, _OffsetGeolocation)
+        assert chip.shape == (20, 30)
+        np.testing.assert_allclose(
+            chip.image_to_latlon(2, 3), geo.image_to_latlon(42, 13),
+        )
+        np.testing.assert_allclose(
+            chip.latlon_to_image(*geo.image_to_latlon(42, 13)), (2, 3),
+        )
+
+    def test_chip_shares_model_lock(self):
+        from grdk.viewers.geolocation_lock import geolocation_lock
+
+        geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        chip = _chip_geolocation(geo, 40, 10, (20, 30))
+        assert geolocation_lock(chip) is geolocation_lock(geo)
+        assert geolocation_lock(geo) is not geolocation_lock(
+            MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0),
+        )
+
+    def test_stacked_points_offset(self):
+        class _ArrayGeo:
+            def image_to_latlon(self, points):
+                return np.asarray(points, dtype=float) * 0.5
+
+            def latlon_to_image(self, points):
+                return np.asarray(points, dtype=float) * 2.0
+
+        pts = np.array([[0.0, 0.0], [4.0, 6.0]])
+        chip = _chip_geolocation(_ArrayGeo(), 10, 20, (8, 8))
+        np.testing.assert_allclose(
+            chip.image_to_latlon(pts), [[5.0, 10.0], [7.0, 13.0]],
+        )
+        np.testing.assert_allclose(
+            chip.latlon_to_image(np.array([[5.0, 10.0]])), [[0.0, 0.0]],
+        )
+        assert pts[1, 0] == 4.0
+
+    def test_grdl_model_uses_chip_geolocation(self):
+        from grdl.geolocation import ChipGeolocation, Geolocation
+
+        class _LinearGeolocation(Geolocation):
+            def _image_to_latlon_array(self, rows, cols, height=0.0):
+                return 30.0 + rows * 0.01, -90.0 + cols * 0.01, \
+                    np.zeros_like(rows, dtype=float)
+
+            def _latlon_to_image_array(self, lats, lons, height=0.0):
+                return (lats - 30.0) / 0.01, (lons + 90.0) / 0.01
+
+        geo = _LinearGeolocation(shape=(100, 100), crs='WGS84')
+        chip = _chip_geolocation(geo, 40, 10, (20, 30))
+        assert isinstance(chip, ChipGeolocation)
+        np.testing.assert_allclose(
+            chip.image_to_latlon(2.0, 3.0)[:2], geo.image_to_latlon(42.0, 13.0)[:2],
+        )
+
+
 # ---------------------------------------------------------------------------
 # Qt-dependent tests
 # ---------------------------------------------------------------------------
 
 try:
+    from PyQt6.QtCore import QThreadPool
     from PyQt6.QtWidgets import QApplication, QMessageBox
     from grdk.viewers.dual_viewer import (
         DualGeoViewer,
@@ -224,6 +479,12 @@ except (ImportError, RuntimeError):
     _QT_SKIP = True
 
 
+def _wait_for_pool() -> None:
+    """Let thread-pool workers finish and deliver their queued signals."""
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
 @pytest.mark.skipif(_QT_SKIP, reason="Qt not available")
 class TestSyncController:
     def test_init(self):
@@ -257,6 +518,17 @@ class TestSyncController:
         ctrl.set_canvases(left, right)
         # Should not raise
 
+    def test_set_canvases_twice_does_not_double_connect(self):
+        ctrl = SyncController()
+        left = TiledImageCanvas()
+        right = TiledImageCanvas()
+        ctrl.set_canvases(left, right)
+        ctrl._left_canvas = None  # simulate a partially failed rebind
+        ctrl.set_canvases(left, right)
+        ctrl._queue_sync = MagicMock()
+        left.viewport_changed.emit()
+        assert ctrl._queue_sync.call_count == 1
+
     def test_reentrancy_guard(self):
         """Sync should not trigger infinite loops."""
         ctrl = SyncController()
@@ -272,6 +544,25 @@ class TestSyncController:
         # Trigger viewport change — should not hang or recurse
         left.viewport_changed.emit()
         right.viewport_changed.emit()
+        QApplication.processEvents()
+
+    def test_viewport_changes_coalesced(self):
+        """A burst of viewport changes should produce a single sync."""
+        ctrl = SyncController()
+        left = TiledImageCanvas()
+        right = TiledImageCanvas()
+        ctrl.set_canvases(left, right)
+        ctrl._sync_viewport = MagicMock()
+
+        for _ in range(5):
+            left.viewport_changed.emit()
+        right.viewport_changed.emit()
+        ctrl._sync_viewport.assert_not_called()
+
+        QApplication.processEvents()
+        ctrl._sync_viewport.assert_called_once()
+        # Most recent source wins
+        assert ctrl._sync_viewport.call_args[0][0] is right
 
     def test_geo_overlap_detection(self):
         ctrl = SyncController()
@@ -280,6 +571,18 @@ class TestSyncController:
         ctrl.set_geolocations(left_geo, (100, 100), right_geo, (100, 100))
         assert ctrl.get_overlap() is not None
 
+    def test_overlap_as_array(self):
+        ctrl = SyncController()
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        ctrl.set_geolocations(left_geo, (100, 100), right_geo, (100, 100))
+        lat_min, lat_max, lon_min, lon_max = ctrl.get_overlap()
+        box = ctrl.get_overlap(as_array=True)
+        np.testing.assert_array_equal(
+            box, [[lat_min, lon_min], [lat_max, lon_max]],
+        )
+        assert ctrl.get_overlap(as_array=True) is box
+
     def test_no_geo_no_overlap(self):
         ctrl = SyncController()
         ctrl.set_geolocations(None, (100, 100), None, (100, 100))
@@ -351,6 +654,319 @@ class TestDualGeoViewer:
         viewer.set_array(arr, pane=0)
         assert viewer.left_viewer.canvas.source_array is not None
 
+    def test_pane_shapes_cached_per_load(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        viewer.set_array(np.zeros((40, 60), dtype=np.float32), pane=0)
+        viewer.set_array(np.zeros((30, 20), dtype=np.float32), pane=1)
+        assert viewer._cached_left_shape == (40, 60)
+        assert viewer._cached_right_shape == (30, 20)
+
+        viewer._get_image_shape = MagicMock(return_value=(10, 10))
+        viewer.set_array(np.zeros((10, 10), dtype=np.float32), pane=1)
+        viewer._get_image_shape.assert_called_once_with(viewer.right_viewer)
+        assert viewer.sync_controller._left_shape == (40, 60)
+
+    def test_reopening_same_reader_is_skipped(self):
+        viewer = DualGeoViewer()
+        reader = SyntheticReader(50, 50)
+        viewer.open_reader(reader, pane=0)
+        viewer.left_viewer.open_reader = MagicMock()
+        viewer.open_reader(reader, pane=0)
+        viewer.left_viewer.open_reader.assert_not_called()
+        viewer.open_reader(SyntheticReader(50, 50), pane=0)
+        viewer.left_viewer.open_reader.assert_called_once()
+
+    def test_crop_bbox_reused_across_crop_toggles(self, monkeypatch):
+        import grdk.viewers.dual_viewer as dual_viewer
+
+        bbox_fn = MagicMock(wraps=dual_viewer._overlap_pixel_bbox)
+        monkeypatch.setattr(dual_viewer, "_overlap_pixel_bbox", bbox_fn)
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        assert viewer.left_viewer.canvas.source_array.shape == (51, 51)
+        assert bbox_fn.call_count == 2
+        viewer.reset_crop()
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        assert bbox_fn.call_count == 2
+
+    def test_crop_chips_read_off_thread(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        assert viewer.left_viewer.canvas.source_array.shape == (100, 100)
+        _wait_for_pool()
+        assert viewer.left_viewer.canvas.source_array.shape == (51, 51)
+        assert viewer.right_viewer.canvas.source_array.shape == (50, 50)
+
+    def test_repeated_crop_skips_reread(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_reader = MagicMock(wraps=SyntheticReader(100, 100))
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+        viewer._readers[0] = left_reader
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        assert left_reader.read_chip.call_count == 1
+
+    def test_shared_geolocation_projected_once_per_crop(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        geo = MagicMock(wraps=MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0))
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=geo, pane=1)
+        _wait_for_pool()
+        overlap = viewer.sync_controller.get_overlap()
+        geo.latlon_to_image.reset_mock()
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        single = geo.latlon_to_image.call_count
+        _wait_for_pool()
+        geo.latlon_to_image.reset_mock()
+        _overlap_pixel_bbox(geo, overlap)
+        assert single == geo.latlon_to_image.call_count
+
+    def test_crop_chip_made_contiguous(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        reader = SyntheticReader(100, 100)
+        reader._arr = np.asfortranarray(reader._arr)
+        reader.read_chip = lambda r0, r1, c0, c1, bands=None: reader._arr[r0:r1, c0:c1]
+        viewer.open_reader(reader, geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        assert viewer.left_viewer.canvas.source_array.flags.c_contiguous
+
+    def test_crop_requires_reader_and_geo_in_both_panes(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.set_array(
+            np.zeros((100, 100), dtype=np.float32), geolocation=right_geo, pane=1,
+        )
+        _wait_for_pool()
+        assert viewer.sync_controller.get_overlap() is not None
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        assert viewer._cropped is False
+        assert viewer.left_viewer.canvas.source_array.shape == (100, 100)
+
+    def test_crop_without_pixels_leaves_state_alone(self, monkeypatch):
+        import grdk.viewers.dual_viewer as dual_viewer
+
+        monkeypatch.setattr(
+            dual_viewer, "_overlap_pixel_bbox", MagicMock(return_value=None),
+        )
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+        _wait_for_pool()
+
+        viewer.crop_to_overlap()
+        assert viewer._cropped is False
+        assert viewer._sync_bar._crop_btn.isVisibleTo(viewer._sync_bar)
+
+    def test_repeated_crop_keeps_cropped_state(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+        _wait_for_pool()
+
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        assert viewer._crop_pending == 0
+        assert viewer._cropped is True
+
+    def test_failed_chip_reads_clear_cropped_state(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        readers = [SyntheticReader(100, 100), SyntheticReader(100, 100)]
+        for pane, (reader, geo) in enumerate(zip(readers, (left_geo, right_geo))):
+            viewer.open_reader(reader, geolocation=geo, pane=pane)
+            reader.read_chip = MagicMock(side_effect=OSError("bad read"))
+        _wait_for_pool()
+
+        viewer.crop_to_overlap()
+        assert viewer._cropped is True
+        _wait_for_pool()
+        assert viewer._cropped is False
+        assert viewer._sync_bar._crop_btn.isVisibleTo(viewer._sync_bar)
+        assert viewer.left_viewer.canvas.source_array.shape == (100, 100)
+
+    def test_reset_during_crop_discards_chips(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        viewer.reset_crop()
+        _wait_for_pool()
+        assert viewer.left_viewer.canvas.source_array.shape == (100, 100)
+
+    def test_reset_skips_panes_never_cropped(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        viewer.reset_crop()
+        viewer.left_viewer.open_reader = MagicMock()
+        viewer.right_viewer.open_reader = MagicMock()
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        viewer.reset_crop()
+        viewer.left_viewer.open_reader.assert_not_called()
+        viewer.right_viewer.open_reader.assert_not_called()
+
+    def test_reset_restores_pre_crop_viewport(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+        canvas = viewer.left_viewer.canvas
+        canvas.get_viewport_center = MagicMock(return_value=(20.0, 70.0))
+        canvas.get_zoom = MagicMock(return_value=2.0)
+        canvas.set_viewport = MagicMock()
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        viewer.reset_crop()
+        assert canvas.source_array.shape == (100, 100)
+        canvas.set_viewport.assert_called_once_with(20.0, 70.0, 2.0)
+
+    def test_crop_reset_keeps_reader_open(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        left_reader = ClosingSyntheticReader(100, 100)
+        viewer.open_reader(left_reader, geolocation=left_geo, pane=0)
+        viewer.open_reader(
+            ClosingSyntheticReader(100, 100), geolocation=right_geo, pane=1,
+        )
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        assert viewer.left_viewer.canvas.source_array.shape == (51, 51)
+        assert not left_reader.closed
+
+        viewer.reset_crop()
+        assert viewer.left_viewer._reader is left_reader
+        np.testing.assert_array_equal(
+            viewer.left_viewer.canvas.source_array, left_reader._arr,
+        )
+        assert viewer.sync_controller._left_shape == (100, 100)
+        assert viewer.sync_controller._left_geo is left_geo
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        assert viewer.left_viewer.canvas.source_array.shape == (51, 51)
+
+    def test_loading_over_crop_closes_detached_reader(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        left_reader = ClosingSyntheticReader(100, 100)
+        viewer.open_reader(left_reader, geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        assert left_reader.closed
+
+    def test_hover_on_cropped_pane_reports_full_image_position(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        viewer.show()
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=left_geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=right_geo, pane=1)
+
+        _wait_for_pool()
+        viewer.crop_to_overlap()
+        _wait_for_pool()
+        r0, _, c0, _ = viewer._last_chip_bbox[0]
+        assert (r0, c0) != (0, 0)
+        assert viewer.sync_controller._left_shape == (51, 51)
+
+        bar = viewer._coord_bar
+        viewer.left_viewer.canvas.pixel_hovered.emit(3, 4, None)
+        QApplication.processEvents()
+        bar._do_geo_lookup()
+        lat, lon = left_geo.image_to_latlon(r0 + 3, c0 + 4)
+        assert bar._geo_text == f"Lat: {lat:.6f}\u00b0  Lon: {lon:.6f}\u00b0"
+
+    def test_hover_bursts_coalesced(self):
+        viewer = DualGeoViewer()
+        calls = []
+        viewer._coord_bar._on_pixel_hovered = (
+            lambda r, c, v: calls.append((r, c))
+        )
+        for i in range(5):
+            viewer.left_viewer.canvas.pixel_hovered.emit(i, i, None)
+        assert calls == []
+        QApplication.processEvents()
+        assert calls == [(4, 4)]
+
     def test_set_array_right(self):
         viewer = DualGeoViewer()
         viewer.set_mode("dual")
@@ -401,6 +1017,36 @@ class TestDualGeoViewer:
         viewer = DualGeoViewer()
         viewer.clear_vectors()  # Should not raise
 
+    def test_band_info_legacy_signal_only_when_connected(self):
+        viewer = DualGeoViewer()
+        pane_calls = []
+        viewer.pane_band_info_changed.connect(
+            lambda pane, info: pane_calls.append(pane)
+        )
+        viewer.set_array(np.zeros((10, 10), dtype=np.float32), pane=0)
+        assert pane_calls == [0]
+
+        legacy_calls = []
+        viewer.band_info_changed.connect(legacy_calls.append)
+        viewer.set_array(np.zeros((10, 10), dtype=np.float32), pane=0)
+        viewer.set_array(np.zeros((10, 10), dtype=np.float32), pane=1)
+        assert pane_calls == [0, 0, 1]
+        assert len(legacy_calls) == 1
+
+    def test_clear_vectors_skips_empty_panes(self):
+        viewer = DualGeoViewer()
+        viewer.left_viewer.load_vector = MagicMock()
+        viewer.left_viewer.clear_vectors = MagicMock()
+        viewer.right_viewer.clear_vectors = MagicMock()
+        viewer.clear_vectors()
+        viewer.left_viewer.clear_vectors.assert_not_called()
+
+        viewer.load_vector("roads.geojson", pane=0)
+        viewer.clear_vectors()
+        viewer.clear_vectors()
+        viewer.left_viewer.clear_vectors.assert_called_once()
+        viewer.right_viewer.clear_vectors.assert_not_called()
+
     def test_export_view(self):
         import os
         import tempfile
@@ -418,6 +1064,38 @@ class TestDualGeoViewer:
         finally:
             os.unlink(tmppath)
 
+    def test_export_view_format_from_extension(self):
+        import os
+        import tempfile
+
+        viewer = DualGeoViewer()
+        viewer.set_array(np.random.rand(50, 50).astype(np.float32), pane=0)
+        with tempfile.TemporaryDirectory() as d:
+            for name, magic in (
+                ("view.png", (b"\x89PNG",)),
+                ("view.tiff", (b"II*\x00", b"MM\x00*")),
+            ):
+                path = os.path.join(d, name)
+                viewer.export_view(path, pane=0)
+                with open(path, "rb") as f:
+                    assert f.read(4) in magic
+
+    def test_export_view_background(self):
+        import os
+        import tempfile
+
+        viewer = DualGeoViewer()
+        viewer.set_array(np.random.rand(50, 50).astype(np.float32), pane=0)
+        done = []
+        viewer.export_finished.connect(lambda path, err: done.append((path, err)))
+
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "view.png")
+            viewer.export_view(path, pane=0, background=True)
+            _wait_for_pool()
+            assert done == [(path, "")]
+            assert os.path.getsize(path) > 0
+
     def test_set_mode_single_resets_active_pane(self):
         """Switching to single should reset active pane to 0."""
         viewer = DualGeoViewer()
@@ -427,6 +1105,28 @@ class TestDualGeoViewer:
         viewer.set_mode("single")
         assert viewer.active_pane == 0
 
+    def test_active_pane_border_follows_pane(self):
+        viewer = DualGeoViewer()
+        assert not viewer._left_frame._bordered
+        viewer.set_mode("dual")
+        assert viewer._left_frame._active and not viewer._right_frame._active
+        viewer._set_active_pane(1)
+        assert viewer._right_frame._active and not viewer._left_frame._active
+        viewer.set_mode("single")
+        assert not viewer._left_frame._bordered
+        assert not viewer._right_frame._active
+
+    def test_pane_switch_with_shared_geo_keeps_coord_bar(self):
+        viewer = DualGeoViewer()
+        viewer.set_mode("dual")
+        geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=geo, pane=0)
+        viewer.open_reader(SyntheticReader(100, 100), geolocation=geo, pane=1)
+        viewer._coord_bar.set_geolocation = MagicMock()
+        viewer._set_active_pane(1)
+        viewer._set_active_pane(0)
+        viewer._coord_bar.set_geolocation.assert_not_called()
+
 
 @pytest.mark.skipif(_QT_SKIP, reason="Qt not available")
 class TestMultibandPrompt:
@@ -921,6 +1621,39 @@ class TestAutoSettingsNoRerender:
         assert viewer.canvas.display_settings.band_index == 0
         assert viewer.canvas.display_settings.percentile_low == 2.0
 
+    def test_auto_settings_uses_open_snapshot(self):
+        """Shape/dtype/metadata read by open_reader are not re-read."""
+        from grdk.viewers.geo_viewer import GeoImageViewer, _ReaderSnapshot
+
+        viewer = GeoImageViewer()
+        reader = MagicMock()
+        reader.get_available_polarizations.return_value = []
+        snapshot = _ReaderSnapshot((50, 50, 4), np.dtype(np.complex64), None)
+        viewer._apply_auto_settings(reader, snapshot)
+
+        reader.get_shape.assert_not_called()
+        reader.get_dtype.assert_not_called()
+        assert viewer.canvas.display_settings.band_index == 0
+        assert viewer.canvas.display_settings.percentile_low == 2.0
+
+    def test_auto_settings_selects_loaded_polarization(self):
+        from types import SimpleNamespace
+
+        from grdk.viewers.geo_viewer import GeoImageViewer, _ReaderSnapshot
+
+        viewer = GeoImageViewer()
+        reader = SimpleNamespace(
+            get_available_polarizations=lambda: ["VV", "VH"],
+        )
+        meta = {"swath_info": SimpleNamespace(polarization="VH")}
+        snapshot = _ReaderSnapshot((50, 50), np.dtype(np.complex64), meta)
+        viewer._apply_auto_settings(reader, snapshot)
+        assert viewer.canvas.display_settings.band_index == 1
+
+        reader._requested_polarization = "HV"  # not available: unchanged
+        viewer._apply_auto_settings(reader, snapshot)
+        assert viewer.canvas.display_settings.band_index == 1
+
 
 @pytest.mark.skipif(_QT_SKIP, reason="Qt not available")
 class TestContrastBrightnessSpinboxes:
@@ -1079,6 +1812,26 @@ class TestColorBarWidget:
         viewer = GeoImageViewer()
         assert viewer.colorbar.isHidden()
 
+    def test_colorbar_and_overlay_created_lazily(self):
+        from dataclasses import replace
+
+        from grdk.viewers.geo_viewer import GeoImageViewer
+
+        viewer = GeoImageViewer()
+        viewer.set_colorbar_visible(False)
+        viewer.clear_vectors()
+        assert viewer._colorbar is None
+        assert viewer._vector_overlay is None
+
+        viewer.canvas.set_display_settings(
+            replace(viewer.canvas.display_settings, colormap="viridis"),
+        )
+        viewer.set_colorbar_visible(True)
+        assert not viewer.colorbar.isHidden()
+        assert viewer.colorbar._colormap_name == "viridis"
+        layout = viewer.layout()
+        assert layout.indexOf(viewer.colorbar) == layout.indexOf(viewer.canvas) + 1
+
     def test_colorbar_set_colormap(self):
         """Setting colormap should update the colorbar."""
         from grdk.widgets.colorbar import ColorBarWidget
@@ -1331,3 +2084,173 @@ class TestTiledLoading:
         assert not cache.has_pending, (
             "has_pending still True after failed tile load"
         )
+
+
+@pytest.mark.skipif(_QT_SKIP, reason="Qt not available")
+class TestSyncControllerCaching:
+    def test_bounds_cached_across_overlap_queries(self):
+        ctrl = SyncController()
+        left_geo = MagicMock(wraps=MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0))
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        ctrl.set_geolocations(left_geo, (100, 100), right_geo, (100, 100))
+        calls = left_geo.image_to_latlon.call_count
+        assert ctrl.get_overlap() is not None
+        assert ctrl.get_overlap() is not None
+        assert left_geo.image_to_latlon.call_count == calls
+
+    def test_bounds_cache_pruned_on_model_change(self):
+        ctrl = SyncController()
+        geo_a = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        geo_b = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        geo_c = MockGeolocation(100, 100, 40.0, 41.0, -80.0, -79.0)
+        ctrl.set_geolocations(geo_a, (100, 100), geo_b, (100, 100))
+        ctrl.set_geolocations(geo_a, (100, 100), geo_c, (100, 100))
+        assert ctrl.get_overlap() is None
+        assert {k[0] for k in ctrl._bounds_cache} <= {id(geo_a), id(geo_c)}
+
+    def test_geo_sync_reuses_anchor_within_fit_region(self):
+        ctrl = SyncController()
+        left_geo = MagicMock(wraps=MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0))
+        right_geo = MockGeolocation(200, 200, 30.5, 31.5, -89.5, -88.5)
+        ctrl.set_geolocations(left_geo, (100, 100), right_geo, (200, 200))
+        assert ctrl._affine_lr is not None
+
+        row, col = ctrl._map_geo(left_geo, right_geo, 80.0, 80.0)
+        calls = left_geo.image_to_latlon.call_count
+        row2, col2 = ctrl._map_geo(left_geo, right_geo, 90.0, 70.0)
+        assert left_geo.image_to_latlon.call_count == calls
+
+        exact = right_geo.latlon_to_image(
+            *left_geo.image_to_latlon(90.0, 70.0)
+        )
+        assert row2 == pytest.approx(exact[0])
+        assert col2 == pytest.approx(exact[1])
+
+    def test_invalidate_overlap_reprojects(self):
+        ctrl = SyncController()
+        left_geo = MagicMock(wraps=MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0))
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        ctrl.set_geolocations(left_geo, (100, 100), right_geo, (100, 100))
+        overlap = ctrl.get_overlap()
+        calls = left_geo.image_to_latlon.call_count
+        ctrl.invalidate_overlap()
+        assert ctrl.get_overlap() == overlap
+        assert left_geo.image_to_latlon.call_count > calls
+
+    def test_subpixel_sync_skipped(self):
+        ctrl = SyncController()
+        source = MagicMock()
+        target = MagicMock()
+        source.get_zoom.return_value = 2.0
+        source.get_viewport_center.return_value = (10.0, 20.0)
+        ctrl._sync_viewport(source, target, None, None)
+        source.get_viewport_center.return_value = (10.2, 20.1)
+        ctrl._sync_viewport(source, target, None, None)
+        assert target.set_viewport.call_count == 1
+
+        source.get_viewport_center.return_value = (12.0, 20.0)
+        ctrl._sync_viewport(source, target, None, None)
+        assert target.set_viewport.call_count == 2
+
+    def test_signals_emitted_only_on_change(self):
+        ctrl = SyncController()
+        overlaps, modes = [], []
+        ctrl.overlap_changed.connect(overlaps.append)
+        ctrl.sync_mode_changed.connect(modes.append)
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        ctrl.set_geolocations(left_geo, (100, 100), right_geo, (100, 100))
+        ctrl.set_geolocations(left_geo, (100, 100), right_geo, (100, 100))
+        ctrl.set_geolocations(None, (100, 100), right_geo, (100, 100))
+        assert overlaps == [True, False]
+
+        ctrl.set_sync_mode("pixel")
+        ctrl.set_sync_mode("geo")
+        ctrl.set_sync_mode("geo")
+        assert modes == ["geo"]
+
+    def test_target_viewport_signal_blocked_during_sync(self):
+        ctrl = SyncController()
+        left = TiledImageCanvas()
+        right = TiledImageCanvas()
+        ctrl.set_canvases(left, right)
+        emitted, zooms = [], []
+        right.viewport_changed.connect(lambda: emitted.append(True))
+        right.zoom_changed.connect(zooms.append)
+        ctrl._sync_viewport(left, right, None, None)
+        assert emitted == []
+        assert zooms == [pytest.approx(left.get_zoom())]
+        assert not right.signalsBlocked()
+
+    def test_set_viewport_applies_zoom_and_center(self):
+        canvas = TiledImageCanvas()
+        canvas.resize(200, 200)
+        canvas.set_array(np.random.rand(400, 400).astype(np.float32))
+        canvas.set_viewport(150.0, 250.0, 2.0)
+        assert canvas.get_zoom() == pytest.approx(2.0)
+        row, col = canvas.get_viewport_center()
+        assert row == pytest.approx(150.0, abs=1.0)
+        assert col == pytest.approx(250.0, abs=1.0)
+        assert canvas.updatesEnabled()
+
+    def test_background_overlap_published_on_completion(self):
+        ctrl = SyncController()
+        overlaps = []
+        ctrl.overlap_changed.connect(overlaps.append)
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        ctrl.set_geolocations(
+            left_geo, (100, 100), right_geo, (100, 100), background=True,
+        )
+        assert overlaps == []
+        assert ctrl.overlap_pending
+        assert ctrl.get_overlap() is None
+        _wait_for_pool()
+        assert overlaps == [True]
+        assert not ctrl.overlap_pending
+        assert ctrl.get_overlap() is not None
+        assert ctrl._affine_lr is not None
+
+    def test_gui_thread_leaves_models_alone_while_in_flight(self):
+        from grdk.viewers.coordinate_bar import CoordinateBar
+
+        left_geo = ExclusiveGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        bar = CoordinateBar()
+        bar.show()
+        bar.set_geolocation(left_geo)
+        ctrl = SyncController()
+
+        left_geo.release.clear()
+        ctrl.set_geolocations(
+            left_geo, (100, 100), right_geo, (100, 100), background=True,
+        )
+        assert left_geo.entered.wait(5)
+        left_geo.gui_calls = 0
+        assert ctrl.get_overlap() is None
+        bar._on_pixel_hovered(3, 4, None)
+        bar._do_geo_lookup()
+        assert left_geo.gui_calls == 0
+        assert bar._geo_text == ""
+
+        # A blocking GUI-thread projection waits for the worker's call
+        threading.Timer(0.05, left_geo.release.set).start()
+        assert _project_pixel(left_geo, right_geo, 0.0, 0.0) is not None
+        _wait_for_pool()
+        assert left_geo.overlaps == 0
+        assert ctrl.get_overlap() is not None
+        bar._do_geo_lookup()
+        assert bar._geo_text.startswith("Lat: 30.0")
+
+    def test_superseded_background_result_dropped(self):
+        ctrl = SyncController()
+        overlaps = []
+        ctrl.overlap_changed.connect(overlaps.append)
+        left_geo = MockGeolocation(100, 100, 30.0, 31.0, -90.0, -89.0)
+        right_geo = MockGeolocation(100, 100, 30.5, 31.5, -89.5, -88.5)
+        ctrl.set_geolocations(
+            left_geo, (100, 100), right_geo, (100, 100), background=True,
+        )
+        ctrl.set_geolocations(None, (100, 100), right_geo, (100, 100))
+        _wait_for_pool()
+        assert overlaps == [False]
@@ -377,6 +377,20 @@ class TestFindSentinel2BandFile:
             assert result is not None
             assert "_B05_" in result.name
 
+    def test_flat_img_data_fallback(self):
+        """JP2s directly under IMG_DATA are used when no R*m dirs exist."""
+        from grdk.viewers.geo_viewer import _find_sentinel2_band_file
+
+        with tempfile.TemporaryDirectory() as d:
+            img = os.path.join(d, "GRANULE", "L1C_T15RTP", "IMG_DATA")
+            os.makedirs(img)
+            for name in ("T15RTP_AOT_60m.jp2", "T15RTP_B02_10m.jp2",
+                         "T15RTP_TCI_10m.jp2", "T15RTP_B03_10m.xml"):
+                Path(img, name).touch()
+            result = _find_sentinel2_band_file(Path(d))
+            assert result is not None
+            assert "_TCI_" in result.name
+
 
 class TestOpenAny:
     def test_nonexistent_file_raises(self):
@@ -408,6 +422,84 @@ class TestOpenAny:
             except PermissionError:
                 pass  # Windows file-locking; temp dir will clean up
 
+    def test_openers_tried_in_order_and_reported(self):
+        from unittest.mock import patch
+
+        from grdk.viewers.geo_viewer import open_any
+
+        calls = []
+
+        def _fail(label):
+            def opener(path):
+                calls.append(label)
+                raise ValueError(f"not {label}")
+            return opener
+
+        def _ok(path):
+            calls.append("EO")
+            return "reader"
+
+        openers = (
+            ("SAR", "open_sar", True, _fail("SAR")),
+            ("Image", "open_reader", True, _fail("Image")),
+            ("EO", "open_eo", False, _ok),
+        )
+        with patch("grdk.viewers.geo_viewer._openers", return_value=openers):
+            assert open_any("/tmp/scene.tif") == "reader"
+        assert calls == ["SAR", "Image", "EO"]
+
+        openers = (
+            ("SAR", "open_sar", True, _fail("SAR")),
+            ("IR", "open_ir", False, "No module named 'grdl.IO.ir'"),
+        )
+        with patch("grdk.viewers.geo_viewer._openers", return_value=openers):
+            with pytest.raises(ValueError, match="IR: No module named"):
+                open_any("/tmp/scene.tif")
+
+    def test_opener_bug_propagates(self):
+        from unittest.mock import patch
+
+        from grdk.viewers.geo_viewer import open_any
+
+        def _buggy(path):
+            raise KeyError("header")
+
+        openers = (("SAR", "open_sar", True, _buggy),)
+        with patch("grdk.viewers.geo_viewer._openers", return_value=openers):
+            with pytest.raises(KeyError):
+                open_any("/tmp/scene.tif")
+
+    def test_stderr_silenced_only_for_nitf_openers(self):
+        import contextlib
+        from unittest.mock import patch
+
+        from grdk.viewers.geo_viewer import open_any
+
+        quiet = []
+        log = []
+
+        @contextlib.contextmanager
+        def _spy():
+            quiet.append(True)
+            yield
+            quiet.pop()
+
+        def _opener(label):
+            def opener(path):
+                log.append((label, bool(quiet)))
+                raise ValueError(label)
+            return opener
+
+        openers = (
+            ("SAR", "open_sar", True, _opener("SAR")),
+            ("EO", "open_eo", False, _opener("EO")),
+        )
+        with patch("grdk.viewers.geo_viewer._openers", return_value=openers), \
+                patch("grdk.viewers.geo_viewer._suppress_stderr", _spy):
+            with pytest.raises(ValueError):
+                open_any("/tmp/scene.tif")
+        assert log == [("SAR", True), ("EO", False)]
+
 
 # ---------------------------------------------------------------------------
 # create_geolocation
@@ -422,6 +514,39 @@ class TestCreateGeolocation:
         geo = create_geolocation(reader)
         assert geo is None
 
+    def test_dispatch_by_reader_mro(self):
+        from unittest.mock import patch
+
+        from grdk.viewers.geo_viewer import create_geolocation
+
+        class _Base:
+            pass
+
+        class _Derived(_Base):
+            pass
+
+        base_geo = object()
+        dispatch = {
+            _Base: ("test._Base", lambda r: base_geo),
+            _Derived: ("test._Derived", lambda r: None),
+        }
+        with patch(
+            "grdk.viewers.geo_viewer._geo_dispatch", return_value=dispatch,
+        ):
+            # Derived factory declines, so the base class entry is used
+            assert create_geolocation(_Derived()) is base_geo
+            assert create_geolocation(SyntheticReader(10, 10)) is None
+
+
+class TestSarReaderClasses:
+    def test_classes_resolved_once(self):
+        from grdk.viewers.geo_viewer import _sar_reader_classes
+
+        classes = _sar_reader_classes()
+        assert _sar_reader_classes() is classes
+        assert all(isinstance(cls, type) for cls in classes)
+        assert not isinstance(SyntheticReader(10, 10), classes)
+
 
 # ---------------------------------------------------------------------------
 # TileCache (Qt-dependent)
@@ -521,3 +646,165 @@ class TestTiledImageCanvas:
         canvas = TiledImageCanvas()
         zoom = canvas.get_zoom()
         assert isinstance(zoom, float)
+
+
+@pytest.mark.skipif(_QT_SKIP, reason="Qt not available")
+class TestCoordinateBarFormatting:
+    def _bar(self):
+        from grdk.viewers.coordinate_bar import CoordinateBar
+        bar = CoordinateBar()
+        bar.show()
+        return bar
+
+    def test_real_scalar(self):
+        bar = self._bar()
+        bar._format_value(np.float32(42.123456))
+        assert bar._value_text == "Value: 42.12"
+
+    def test_complex_scalar(self):
+        bar = self._bar()
+        bar._format_value(np.complex64(3 + 4j))
+        assert bar._value_text == "Value: 5∠53.1°"
+
+    def test_multiband_array(self):
+        bar = self._bar()
+        bar._format_value(np.array([128.0, 64.0, 32.0]))
+        assert bar._value_text == "Value: [128, 64, 32]"
+
+    def test_none(self):
+        bar = self._bar()
+        bar._format_value(None)
+        assert bar._value_text == "Value: —"
+
+    def test_formatter_cached_per_type(self):
+        from grdk.viewers.coordinate_bar import CoordinateBar
+
+        bar = self._bar()
+        bar._format_value(1.0)
+        assert float in CoordinateBar._FORMATTERS
+        bar._format_value(np.float64(1.0))
+        assert (np.float64, True, 'f') in CoordinateBar._FORMATTERS
+        bar._format_value(np.array(2.0))
+        assert (np.ndarray, True, 'f') in CoordinateBar._FORMATTERS
+
+    def test_complex_zero_d_array(self):
+        bar = self._bar()
+        bar._format_value(np.array(-1 + 0j, dtype=np.complex128))
+        assert bar._value_text == "Value: 1∠180.0°"
+
+    def test_multiband_complex_array(self):
+        bar = self._bar()
+        bar._format_value(np.array([3 + 4j, 1 + 0j], dtype=np.complex64))
+        assert bar._value_text == "Value: [5∠53.1°, 1∠0.0°]"
+
+    def test_multiband_int_array(self):
+        bar = self._bar()
+        bar._format_value(np.array([1, 2, 300000], dtype=np.int32))
+        assert bar._value_text == "Value: [1, 2, 3e+05]"
+
+    def test_geo_lookup_skips_repeated_pixel(self):
+        bar = self._bar()
+        geo = MagicMock()
+        geo.image_to_latlon.return_value = (10.0, 20.0)
+        bar.set_geolocation(geo)
+        bar._on_pixel_hovered(5, 6, None)
+        bar._do_geo_lookup()
+        bar._do_geo_lookup()
+        assert geo.image_to_latlon.call_count == 1
+        assert bar._geo_text.startswith("Lat: 10.000000")
+
+    def test_geo_lookup_accepts_ndarray_result(self):
+        bar = self._bar()
+        geo = MagicMock()
+        geo.image_to_latlon.return_value = np.array([1.5, -2.25, 0.0])
+        bar.set_geolocation(geo)
+        bar._on_pixel_hovered(0, 0, None)
+        bar._do_geo_lookup()
+        assert bar._geo_text == "Lat: 1.500000°  Lon: -2.250000°"
+
+    def test_hidden_bar_ignores_hover(self):
+        bar = self._bar()
+        bar.hide()
+        bar._on_pixel_hovered(3, 4, 1.0)
+        assert bar._label.text() == "Pixel: —   Value: —"
+
+    def test_hover_burst_is_compressed(self):
+        from PyQt6.QtWidgets import QApplication
+
+        bar = self._bar()
+        calls = []
+        bar._on_pixel_hovered = lambda r, c, v: calls.append((r, c))
+        for i in range(5):
+            bar.queue_hover(i, i, None)
+        QApplication.processEvents()
+        assert calls == [(4, 4)]
+
+    def test_geo_grid_interpolates_affine_model(self):
+        class _AffineGeo:
+            shape = (1000, 2000)
+
+            def image_to_latlon(self, row_or_points, col=None):
+                pts = np.asarray(row_or_points, dtype=float)
+                if col is not None:
+                    pts = np.array([[row_or_points, col]], dtype=float)
+                lat = 10.0 - pts[:, 0] * 1e-4
+                lon = 20.0 + pts[:, 1] * 1e-4
+                out = np.column_stack([lat, lon, np.zeros(len(pts))])
+                return out[0] if col is not None else out
+
+        bar = self._bar()
+        bar.set_geolocation(_AffineGeo())
+        assert bar._geo_grid is not None
+        bar._on_pixel_hovered(500, 1000, None)
+        bar._do_geo_lookup()
+        assert bar._geo_text == "Lat: 9.950000°  Lon: 20.100000°"
+
+    def test_single_label_joins_segments(self):
+        bar = self._bar()
+        bar._on_pixel_hovered(1, 2, np.float32(3.0))
+        assert bar._label.text() == "Pixel: (1, 2)   Value: 3"
+
+    def test_geo_lookup_nan_result(self):
+        bar = self._bar()
+        geo = MagicMock()
+        geo.image_to_latlon.return_value = (float('nan'), float('nan'))
+        bar.set_geolocation(geo)
+        bar._on_pixel_hovered(1, 1, None)
+        bar._do_geo_lookup()
+        assert bar._geo_text == "Lat/Lon: —"
+
+    def test_identical_hover_short_circuits(self):
+        bar = self._bar()
+        bar._on_pixel_hovered(1, 2, np.float32(3.0))
+        bar._format_value = MagicMock()
+        bar._on_pixel_hovered(1, 2, np.float32(3.0))
+        bar._format_value.assert_not_called()
+        bar._on_pixel_hovered(1, 2, np.float32(4.0))
+        bar._format_value.assert_called_once()
+
+    def test_close_disconnects_canvas(self):
+        from grdk.viewers.image_canvas import ImageCanvas
+
+        bar = self._bar()
+        canvas = ImageCanvas()
+        bar.connect_canvas(canvas)
+        bar.close()
+        assert bar._canvas is None
+        canvas.pixel_hovered.emit(1, 1, None)
+        assert bar._hover_args is None
+
+    def test_debounce_interval_tracks_lookup_cost(self):
+        bar = self._bar()
+        for _ in range(5):
+            bar._record_geo_cost(50_000_000)  # 50 ms
+        assert bar._throttle_timer.interval() == 150
+        bar._geo_costs.clear()
+        bar._record_geo_cost(1_000)
+        assert bar._throttle_timer.interval() == 16
+
+    def test_python_complex_and_int(self):
+        bar = self._bar()
+        bar._format_value(3 + 4j)
+        assert bar._value_text == "Value: 5∠53.1°"
+        bar._format_value(7)
+        assert bar._value_text == "Value: 7"
@@ -20,13 +20,23 @@ Created
 2026-02-06
 """
 
+from dataclasses import replace
+
 import numpy as np
 import pytest
 
+import grdk.viewers.image_canvas as image_canvas
 from grdk.viewers.image_canvas import (
     DisplaySettings,
+    AVAILABLE_COLORMAPS,
     normalize_array,
+    _LUTS,
+    _NUMBA_AVAILABLE,
+    _apply_display,
     _get_colormaps,
+    _interp_axis0,
+    _percentile_hist,
+    _tone_table,
 )
 
 
@@ -107,6 +117,106 @@ class TestNormalizeArray:
         center = result[50, 50]
         assert 50 < center < 200
 
+    def test_histogram_percentile_close_to_exact(self):
+        """Histogram percentiles land within one bin of the exact values."""
+        rng = np.random.default_rng(1)
+        arr = rng.rayleigh(1.0, (400, 400)).astype(np.float32)
+        arr[0, 0] = np.nan
+        lo, hi = _percentile_hist(arr, 2, 98, bins=4096)
+        exact = np.nanpercentile(arr, (2, 98))
+        width = (np.nanmax(arr) - np.nanmin(arr)) / 4096
+        assert abs(lo - exact[0]) <= width
+        assert abs(hi - exact[1]) <= width
+
+    def test_histogram_percentile_falls_back_for_narrow_window(self):
+        """A huge outlier makes the bins too coarse; use exact values."""
+        rng = np.random.default_rng(2)
+        arr = rng.random((300, 300)).astype(np.float32)
+        arr[0, 0] = 1e7
+        result = _percentile_hist(arr, 5, 95, bins=4096)
+        np.testing.assert_allclose(result, np.nanpercentile(arr, (5, 95)))
+
+    def test_uint8_full_range_passes_through(self):
+        """Full-range uint8 with default settings skips the pipeline."""
+        arr = np.arange(256, dtype=np.uint8).reshape(16, 16)
+        assert normalize_array(arr) is arr
+
+    def test_uint8_table_matches_float_pipeline(self):
+        """The uint8 lookup path gives the float pipeline's output."""
+        rng = np.random.default_rng(3)
+        arr = rng.integers(20, 200, (9, 7)).astype(np.uint8)
+        settings = DisplaySettings(contrast=1.3, brightness=0.1, gamma=0.7)
+        result = normalize_array(arr, settings)
+        expected = normalize_array(arr.astype(np.float32), settings)
+        np.testing.assert_array_equal(result, expected)
+
+    @pytest.mark.parametrize('contrast, brightness, gamma', [
+        (0.5, 0.0, 1.0),
+        (1.0, 0.1, 1.0),
+        (1.0, -0.1, 1.0),
+        (0.5, 0.1, 1.5),
+        (0.7, -0.15, 0.6),
+        (2.0, 0.05, 1.2),
+    ])
+    def test_tone_matches_reference_outside_window(
+        self, contrast, brightness, gamma,
+    ):
+        """Pixels outside a percentile window follow the exact curve."""
+        rng = np.random.default_rng(4)
+        arr = (rng.random((60, 50)) ** 2 * 100.0).astype(np.float32)
+        settings = DisplaySettings(
+            percentile_low=2, percentile_high=98,
+            contrast=contrast, brightness=brightness, gamma=gamma,
+        )
+        vmin, vmax = np.percentile(arr, (2, 98))
+        t = (arr.astype(np.float64) - vmin) / (vmax - vmin)
+        t = np.clip(contrast * (t - 0.5) + 0.5 + brightness, 0.0, 1.0)
+        expected = (t ** (1.0 / gamma) * 255.0).astype(np.uint8)
+        outside = (arr < vmin) | (arr > vmax)
+        assert outside.any()
+
+        result = normalize_array(arr, settings)
+        diff = np.abs(result.astype(int) - expected.astype(int))
+        assert diff.max() <= 1
+
+        hot = normalize_array(arr, replace(settings, colormap='hot'))
+        np.testing.assert_array_equal(hot, _LUTS['hot'][result])
+
+    def test_tone_table_composes_colormap(self):
+        """Gamma and colormap fold into one cached, read-only table."""
+        gray = _tone_table(1.5, 'grayscale')
+        rgb = _tone_table(1.5, 'inferno')
+        assert _tone_table(1.5, 'inferno') is rgb
+        assert gray.ndim == 1 and rgb.shape == gray.shape + (3,)
+        assert not rgb.flags.writeable
+        np.testing.assert_array_equal(rgb, _LUTS['inferno'][gray])
+
+    def test_tone_table_rejects_steep_curve(self):
+        """High gamma near black is too steep for the level spacing."""
+        assert _tone_table(5.0, 'grayscale') is None
+        # The exact pipeline still renders it
+        arr = np.linspace(0, 1, 100).reshape(10, 10) ** 4
+        result = normalize_array(arr, DisplaySettings(gamma=5.0))
+        assert result[0, 1] > 0
+
+    def test_preview_percentiles_use_subsample(self):
+        """preview=True windows from a strided sample of large images."""
+        arr = np.zeros((2000, 2000), dtype=np.float32)
+        arr[1::2, :] = 100.0  # Odd rows are skipped by the even stride
+        settings = DisplaySettings(percentile_low=1, percentile_high=99)
+        assert normalize_array(arr, settings).max() == 255
+        assert normalize_array(arr, settings, preview=True).max() == 0
+
+    def test_float32_source_not_modified(self):
+        """Float32 input is used without a copy but must not be mutated."""
+        arr = np.linspace(0, 100, 64, dtype=np.float32).reshape(8, 8)
+        before = arr.copy()
+        result = normalize_array(arr, DisplaySettings(
+            percentile_low=2, percentile_high=98, contrast=1.5, gamma=0.8,
+        ))
+        np.testing.assert_array_equal(arr, before)
+        assert result.dtype == np.uint8
+
     def test_contrast_brightness(self):
         """Contrast > 1 should expand range, brightness shifts."""
         arr = np.array([[100.0, 200.0]], dtype=np.float64)
@@ -153,6 +263,27 @@ class TestNormalizeArray:
         # All zeros since vmax == vmin
         assert np.all(result == 0)
 
+    def test_constant_array_keeps_brightness(self):
+        """A degenerate window still honours brightness."""
+        arr = np.full((3, 4, 4), 7, dtype=np.uint16)
+        result = normalize_array(arr, DisplaySettings(brightness=0.25))
+        assert result.shape == (3, 4, 4)
+        assert np.all(result == int(0.25 * 255))
+
+    def test_fused_display_matches_reference(self):
+        """The fused display step matches the unfused float pipeline."""
+        rng = np.random.default_rng(0)
+        arr = rng.random((12, 10)) * 500.0
+        settings = DisplaySettings(
+            window_min=50.0, window_max=400.0,
+            contrast=1.4, brightness=-0.05, gamma=1.8,
+        )
+        t = (arr - 50.0) / 350.0
+        t = np.clip(1.4 * (t - 0.5) + 0.5 - 0.05, 0.0, 1.0) ** (1 / 1.8)
+        expected = (t * 255.0).astype(np.uint8)
+        result = normalize_array(arr, settings)
+        assert np.abs(result.astype(int) - expected.astype(int)).max() <= 1
+
     def test_none_settings_uses_defaults(self):
         """Passing None for settings should use defaults."""
         arr = np.array([[0.0, 255.0]])
@@ -162,6 +293,42 @@ class TestNormalizeArray:
         assert result[0, 1] == 255
 
 
+# ---------------------------------------------------------------------------
+# Fused numba display kernel
+# ---------------------------------------------------------------------------
+
+@pytest.mark.skipif(not _NUMBA_AVAILABLE, reason="numba not installed")
+class TestDisplayKernel:
+    @pytest.mark.parametrize("contrast, brightness, gamma", [
+        (1.0, 0.0, 1.0),
+        (0.5, 0.2, 2.2),
+        (1.6, -0.15, 0.7),
+        (0.3, -0.4, 1.0),
+    ])
+    @pytest.mark.parametrize("dtype", [np.float32, np.float64, np.uint16])
+    def test_kernel_matches_numpy_path(
+        self, monkeypatch, contrast, brightness, gamma, dtype,
+    ):
+        """The kernel matches the NumPy path, pixels outside the
+        window included."""
+        rng = np.random.default_rng(3)
+        arr = (rng.random((37, 53)) * 1000.0).astype(dtype)
+        settings = DisplaySettings(
+            contrast=contrast, brightness=brightness, gamma=gamma,
+        )
+        vmin, vmax = 200.0, 700.0
+        fused = _apply_display(arr, vmin, vmax, settings)
+        monkeypatch.setattr(image_canvas, "_NUMBA_AVAILABLE", False)
+        reference = _apply_display(arr, vmin, vmax, settings)
+        assert fused.dtype == np.uint8
+        assert np.abs(fused.astype(int) - reference.astype(int)).max() <= 1
+        outside = (arr < vmin) | (arr > vmax)
+        assert outside.sum() > arr.size // 4
+        assert np.abs(
+            fused[outside].astype(int) - reference[outside].astype(int)
+        ).max() <= 1
+
+
 # ---------------------------------------------------------------------------
 # Colormap tests
 # ---------------------------------------------------------------------------
@@ -195,15 +362,63 @@ class TestColormaps:
             assert lut.shape == (256, 3), f"{name} LUT shape wrong"
             assert lut.dtype == np.uint8, f"{name} LUT dtype wrong"
 
+    def test_colormap_writes_into_out_buffer(self):
+        """A matching out buffer receives the colormap output."""
+        arr = np.linspace(0, 1, 64).reshape(8, 8)
+        settings = DisplaySettings(colormap='plasma')
+        buf = np.zeros((8, 8, 3), dtype=np.uint8)
+        result = normalize_array(arr, settings, out=buf)
+        assert result is buf
+        np.testing.assert_array_equal(result, normalize_array(arr, settings))
+        # Wrong shape is ignored rather than raising
+        other = normalize_array(arr, settings, out=np.empty((4, 4, 3), np.uint8))
+        assert other.shape == (8, 8, 3)
+
+    def test_colormap_luts_built_at_import(self):
+        """LUTs are module constants; endpoints match the control points."""
+        assert _get_colormaps() is _LUTS
+        assert set(_LUTS) == set(AVAILABLE_COLORMAPS) - {'grayscale'}
+        np.testing.assert_array_equal(_LUTS['viridis'][0], [68, 1, 84])
+        np.testing.assert_array_equal(_LUTS['viridis'][-1], [253, 231, 37])
+
+    def test_interp_axis0_matches_np_interp(self):
+        """Batched interpolation equals per-column np.interp."""
+        xp = np.array([0.0, 1.0, 2.5, 4.0])
+        fp = np.array([[0, 10, 255], [40, 0, 128], [90, 200, 7], [255, 30, 60]],
+                      dtype=np.float64)
+        x = np.linspace(0.0, 4.0, 37)
+        result = _interp_axis0(x, xp, fp)
+        for c in range(3):
+            np.testing.assert_allclose(result[:, c], np.interp(x, xp, fp[:, c]))
+
+    def test_hot_lut_ramps_red_then_green_then_blue(self):
+        """Hot LUT saturates red, then green, then blue."""
+        hot = _LUTS['hot']
+        np.testing.assert_array_equal(hot[0], [0, 0, 0])
+        np.testing.assert_array_equal(hot[102], [255, 0, 0])
+        np.testing.assert_array_equal(hot[204], [255, 255, 0])
+        assert hot[-1, 2] >= 254
+        for c in range(3):
+            assert np.all(np.diff(hot[:, c].astype(int)) >= 0)
+
 
 # ---------------------------------------------------------------------------
 # Qt-dependent tests (skip if no display)
 # ---------------------------------------------------------------------------
 
 try:
+    from unittest.mock import patch
+
     from PyQt6.QtGui import QImage
-    from grdk.viewers.image_canvas import array_to_qimage, ImageCanvasThumbnail
+    from PyQt6.QtWidgets import QApplication
+    from grdk.viewers.image_canvas import (
+        array_to_qimage,
+        ImageCanvas,
+        ImageCanvasThumbnail,
+    )
     _QT_SKIP = False
+    if QApplication.instance() is None:
+        _app = QApplication([])
 except (ImportError, RuntimeError):
     _QT_SKIP = True
 
@@ -238,3 +453,57 @@ class TestImageCanvasThumbnail:
         thumb = ImageCanvasThumbnail(size=96)
         assert thumb.width() == 96
         assert thumb.height() == 96
+
+
+@pytest.mark.skipif(_QT_SKIP, reason="Qt not available")
+class TestImageCanvasRefresh:
+    def test_unchanged_inputs_skip_render(self):
+        """Equal settings on the same source do not re-run the pipeline."""
+        canvas = ImageCanvas()
+        arr = np.random.rand(16, 16).astype(np.float32)
+        canvas.set_array(arr)
+        with patch(
+            'grdk.viewers.image_canvas.normalize_array',
+            wraps=normalize_array,
+        ) as render:
+            canvas.set_display_settings(DisplaySettings())
+            canvas.reset_view()
+            assert render.call_count == 0
+            canvas.set_display_settings(DisplaySettings(gamma=2.0))
+            assert render.call_count == 1
+            canvas.set_array(arr)  # Same object, possibly new pixels
+            assert render.call_count == 2
+
+    def test_rapid_changes_render_preview_then_full(self):
+        """A quick second change previews; the settle timer renders fully."""
+        canvas = ImageCanvas()
+        canvas.set_array(np.random.rand(16, 16).astype(np.float32))
+        with patch(
+            'grdk.viewers.image_canvas.normalize_array',
+            wraps=normalize_array,
+        ) as render:
+            canvas.set_display_settings(DisplaySettings(percentile_low=2))
+            canvas.set_display_settings(DisplaySettings(percentile_low=3))
+            assert [c.args[3] for c in render.call_args_list] == [False, True]
+            canvas._settle_timer.timeout.emit()
+            assert render.call_args.args[3] is False
+            assert render.call_count == 3
+
+    def test_pixmap_backing_array_kept_alive(self):
+        """The canvas holds the array its uncopied QImage was built on."""
+        canvas = ImageCanvas()
+        canvas.set_array(np.random.rand(9, 7).astype(np.float32))
+        assert canvas._last_display.shape == (9, 7)
+        assert canvas._last_display.flags.c_contiguous
+        pixmap = canvas._pixmap_item.pixmap()
+        assert (pixmap.width(), pixmap.height()) == (7, 9)
+
+    def test_colormap_buffer_reused(self):
+        """The colormap buffer is kept across renders of one shape."""
+        canvas = ImageCanvas()
+        canvas.set_array(np.random.rand(3, 12, 10).astype(np.float32))
+        canvas.set_display_settings(DisplaySettings(colormap='viridis', band_index=0))
+        buf = canvas._lut_buf
+        assert buf.shape == (12, 10, 3)
+        canvas.set_display_settings(DisplaySettings(colormap='hot', band_index=1))
+        assert canvas._lut_buf is buf